@@ -0,0 +1,76 @@
+"""
+Pure ASGI interceptor for high-frequency liveness probes.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, MutableMapping, Tuple
+
+from app.core.config import settings
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+LIVENESS_PATHS: FrozenSet[str] = frozenset({"/ping", "/health/live"})
+MONITORING_PING_PATH = f"{settings.API_V1_STR}/monitoring/health/ping"
+
+
+def _ok_response(body: bytes) -> Tuple[Dict[str, Any], bytes]:
+    start = {
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    return start, body
+
+
+_LIVENESS_RESPONSE = _ok_response(b'{"alive":true,"message":"pong"}')
+_PROBE_RESPONSES: Dict[str, Tuple[Dict[str, Any], bytes]] = {
+    **{path: _LIVENESS_RESPONSE for path in LIVENESS_PATHS},
+    MONITORING_PING_PATH: _ok_response(b'{"status":"ok"}'),
+}
+_METHOD_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_METHOD_NOT_ALLOWED_START: Dict[str, Any] = {
+    "type": "http.response.start",
+    "status": 405,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_METHOD_NOT_ALLOWED_BODY)).encode()),
+        (b"allow", b"GET"),
+    ],
+}
+
+
+class HealthCheckInterceptor:
+    """
+    Answer liveness probes before they reach the FastAPI middleware stack.
+
+    GET requests to LIVENESS_PATHS and the monitoring ping get a
+    pre-serialized 200 response (other methods get 405); every other
+    request is delegated to the wrapped application. Attribute access is
+    forwarded to the wrapped app so callers can keep treating it as the
+    FastAPI instance (dependency_overrides, routes, etc.).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in _PROBE_RESPONSES:
+            if scope["method"] == "GET":
+                start, body = _PROBE_RESPONSES[scope["path"]]
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+            else:
+                await send(_METHOD_NOT_ALLOWED_START)
+                await send({"type": "http.response.body", "body": _METHOD_NOT_ALLOWED_BODY})
+            return
+
+        await self.app(scope, receive, send)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.app, name)
@@ -6,24 +6,67 @@ import asyncio
 import time
 import psutil
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Awaitable, Dict, List, Any, Literal, Optional
 from enum import Enum
+from functools import cached_property
 import json
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import redis
 from loguru import logger
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Gauge, generate_latest
 
-from app.db.session import get_db, get_redis_client
+from app.db.session import SessionLocal, get_db, get_redis_client
 from app.core.config import settings
 from app.services.llm import LLMService
 from app.services.nlu import NLUService
 from app.services.embedding import EmbeddingService
-from app.services.dialogue import DialogueManager
-from app.services.memory import ConversationMemoryManager
-from app.services.quality import ConversationQualityAssessor
+from app.utils.clock import clock
+from app.utils.ttl_cache import TTLCache
+
+# How far the comprehensive check goes; "shallow" skips the downstream services
+CheckDepth = Literal["shallow", "full"]
+
+# Response-time thresholds (seconds) for each component check
+DB_DEGRADED_S = 5.0
+DB_UNHEALTHY_S = 10.0
+REDIS_DEGRADED_S = 1.0
+REDIS_UNHEALTHY_S = 2.0
+REDIS_ROUND_TRIP_DEGRADED_S = 0.5
+LLM_DEGRADED_S = 10.0
+LLM_UNHEALTHY_S = 20.0
+EMBEDDING_DEGRADED_S = 5.0
+EMBEDDING_UNHEALTHY_S = 10.0
+NLU_DEGRADED_S = 8.0
+NLU_UNHEALTHY_S = 15.0
+
+# Seconds each check may run inside the comprehensive check. Budgets sit just
+# past the UNHEALTHY threshold so the thresholds above still grade slow checks.
+CHECK_TIMEOUT_MARGIN_S = 1.0
+DB_CHECK_TIMEOUT = DB_UNHEALTHY_S + CHECK_TIMEOUT_MARGIN_S
+REDIS_CHECK_TIMEOUT = REDIS_UNHEALTHY_S + CHECK_TIMEOUT_MARGIN_S
+LLM_CHECK_TIMEOUT = LLM_UNHEALTHY_S + CHECK_TIMEOUT_MARGIN_S
+EMBEDDING_CHECK_TIMEOUT = EMBEDDING_UNHEALTHY_S + CHECK_TIMEOUT_MARGIN_S
+NLU_CHECK_TIMEOUT = NLU_UNHEALTHY_S + CHECK_TIMEOUT_MARGIN_S
+
+# Seconds between background refreshes of the Prometheus gauges
+METRICS_REFRESH_INTERVAL = 15.0
+
+# Fixed key used by the deep Redis read/write probe
+REDIS_PROBE_KEY = "_hc:probe"
+REDIS_PROBE_VALUE = "ok"
+
+# Seconds a deep check result is reused by /health/detailed and /metrics
+DEEP_CHECK_CACHE_TTL = 10.0
+
+# Seconds a CPU/memory/disk snapshot is reused before re-sampling
+SYSTEM_INFO_CACHE_TTL = 60.0
+
+# Seconds the public table count is reused by the deep database check
+TABLE_COUNT_CACHE_TTL = 300.0
 
 
 class HealthStatus(Enum):
@@ -34,23 +77,17 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class HealthCheckResult:
+class HealthCheckResult(BaseModel):
     """Individual health check result."""
     name: str
     status: HealthStatus
     response_time: float
     message: str
     details: Optional[Dict[str, Any]] = None
-    timestamp: datetime = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
 
-
-@dataclass
-class SystemHealthReport:
+class SystemHealthReport(BaseModel):
     """Complete system health report."""
     overall_status: HealthStatus
     checks: List[HealthCheckResult]
@@ -65,12 +102,29 @@ class HealthChecker:
 
     def __init__(self):
         self.start_time = time.time()
-        self.llm_service = LLMService()
-        self.nlu_service = NLUService()
-        self.embedding_service = EmbeddingService()
-        self.dialogue_manager = DialogueManager()
-        self.memory_manager = ConversationMemoryManager()
-        self.quality_assessor = ConversationQualityAssessor()
+        self._cache = TTLCache(ttl=DEEP_CHECK_CACHE_TTL)
+        self._proc = psutil.Process()
+        self._masked_db_url: Optional[str] = None
+        self._system_info_lock = asyncio.Lock()
+
+        # Prime the non-blocking CPU counters so later samples cover a real interval
+        psutil.cpu_percent(interval=None)
+        self._proc.cpu_percent(interval=None)
+
+    @cached_property
+    def llm_service(self) -> LLMService:
+        """LLM service, constructed on first health check."""
+        return LLMService()
+
+    @cached_property
+    def nlu_service(self) -> NLUService:
+        """NLU service, constructed on first health check."""
+        return NLUService()
+
+    @cached_property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service, constructed on first health check."""
+        return EmbeddingService()
 
     def check_database_health(self, db: Session) -> HealthCheckResult:
         """Check database connectivity and performance."""
@@ -91,13 +145,6 @@ class HealthChecker:
                     details={"expected": 1, "actual": db_result}
                 )
 
-            # Test table access
-            try:
-                table_result = db.execute(text("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'"))
-                table_count = table_result.scalar()
-            except Exception:
-                table_count = 0
-
             # Check connection pool
             pool_status = {
                 "size": db.bind.pool.size() if hasattr(db.bind, 'pool') else "unknown",
@@ -108,12 +155,12 @@ class HealthChecker:
             response_time = time.time() - start_time
 
             # Determine status based on response time
-            if response_time > 5.0:
-                status = HealthStatus.DEGRADED
-                message = "Database response time is slow"
-            elif response_time > 10.0:
+            if response_time > DB_UNHEALTHY_S:
                 status = HealthStatus.UNHEALTHY
                 message = "Database response time is critical"
+            elif response_time > DB_DEGRADED_S:
+                status = HealthStatus.DEGRADED
+                message = "Database response time is slow"
             else:
                 status = HealthStatus.HEALTHY
                 message = "Database is operating normally"
@@ -124,9 +171,8 @@ class HealthChecker:
                 response_time=response_time,
                 message=message,
                 details={
-                    "table_count": table_count,
                     "pool_status": pool_status,
-                    "connection_string": str(db.bind.url).replace(db.bind.url.password or "", "***") if db.bind.url.password else str(db.bind.url)
+                    "connection_string": self._get_masked_db_url(db)
                 }
             )
 
@@ -140,69 +186,135 @@ class HealthChecker:
                 details={"error": str(e)}
             )
 
-    def check_redis_health(self, redis_client: redis.Redis) -> HealthCheckResult:
-        """Check Redis connectivity and performance."""
+    def _get_masked_db_url(self, db: Session) -> str:
+        """Return the database URL with the password masked, computed once."""
+        if self._masked_db_url is None:
+            url = db.bind.url
+            self._masked_db_url = (
+                url.set(password="***").render_as_string(hide_password=False)
+                if url.password else str(url)
+            )
+        return self._masked_db_url
+
+    def check_database_health_deep(self, db: Session) -> HealthCheckResult:
+        """Check database health including the public table count."""
+        result = self.check_database_health(db)
+        if result.status != HealthStatus.UNHEALTHY:
+            result.details["table_count"] = self._get_table_count(db)
+        return result
+
+    def _get_table_count(self, db: Session) -> int:
+        """Count tables in the public schema, cached per database URL."""
+        cache_key = ("table_count", db.bind.url)
+        table_count = self._cache.get(cache_key)
+        if table_count is not None:
+            return table_count
+
+        try:
+            # Single catalog relation instead of the information_schema views
+            table_result = db.execute(text(
+                "SELECT count(*) FROM pg_class "
+                "WHERE relnamespace = 'public'::regnamespace AND relkind = 'r'"
+            ))
+            table_count = table_result.scalar()
+        except Exception:
+            return 0
+
+        self._cache.set(cache_key, table_count, ttl=TABLE_COUNT_CACHE_TTL)
+        return table_count
+
+    def check_redis_health_fast(self, redis_client: redis.Redis) -> HealthCheckResult:
+        """Check Redis connectivity with a single PING."""
         start_time = time.time()
 
         try:
-            # Test basic connectivity
             redis_client.ping()
-            logger.info("Redis ping successful")
+            response_time = time.time() - start_time
 
-            # Test read/write performance
-            test_key = f"health_check_{int(time.time())}"
-            test_value = "test_value"
+            # Determine status based on response time
+            if response_time > REDIS_UNHEALTHY_S:
+                status = HealthStatus.UNHEALTHY
+                message = "Redis response time is critical"
+            elif response_time > REDIS_DEGRADED_S:
+                status = HealthStatus.DEGRADED
+                message = "Redis response time is slow"
+            else:
+                status = HealthStatus.HEALTHY
+                message = "Redis is operating normally"
 
-            # Write test
-            write_start = time.time()
-            redis_client.set(test_key, test_value, ex=60)
-            write_time = time.time() - write_start
+            return HealthCheckResult(
+                name="redis",
+                status=status,
+                response_time=response_time,
+                message=message
+            )
 
-            # Read test
-            read_start = time.time()
-            read_value = redis_client.get(test_key)
-            read_time = time.time() - read_start
-            logger.info(f"Redis read/write test: expected={test_value}, actual={read_value}")
+        except Exception as e:
+            logger.error(f"Redis health check failed: {str(e)}")
+            return HealthCheckResult(
+                name="redis",
+                status=HealthStatus.UNHEALTHY,
+                response_time=time.time() - start_time,
+                message=f"Redis connection failed: {str(e)}",
+                details={"error": str(e)}
+            )
 
-            # Cleanup
-            redis_client.delete(test_key)
+    def check_redis_health_deep(self, redis_client: redis.Redis) -> HealthCheckResult:
+        """Check Redis connectivity, read/write round-trip and server info."""
+        cached = self._cache.get("redis_deep")
+        if cached is not None:
+            return cached
+
+        start_time = time.time()
+
+        try:
+            # Test basic connectivity
+            redis_client.ping()
+
+            # Test read/write in a single round-trip
+            round_trip_start = time.time()
+            # MULTI/EXEC keeps concurrent probes from interleaving on the fixed key
+            with redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(REDIS_PROBE_KEY, REDIS_PROBE_VALUE, ex=5, nx=True)
+                pipe.getdel(REDIS_PROBE_KEY)
+                _, read_value = pipe.execute()
+            round_trip_time = time.time() - round_trip_start
 
             # Get Redis info
             info = redis_client.info()
 
             response_time = time.time() - start_time
 
-            if read_value != test_value:
+            if read_value != REDIS_PROBE_VALUE:
                 return HealthCheckResult(
                     name="redis",
                     status=HealthStatus.UNHEALTHY,
                     response_time=response_time,
                     message="Redis read/write test failed",
                     details={
-                        "expected": test_value,
+                        "expected": REDIS_PROBE_VALUE,
                         "actual": read_value if read_value else None
                     }
                 )
 
             # Determine status based on response times
-            if response_time > 1.0 or write_time > 0.5 or read_time > 0.5:
-                status = HealthStatus.DEGRADED
-                message = "Redis response time is slow"
-            elif response_time > 2.0:
+            if response_time > REDIS_UNHEALTHY_S:
                 status = HealthStatus.UNHEALTHY
                 message = "Redis response time is critical"
+            elif response_time > REDIS_DEGRADED_S or round_trip_time > REDIS_ROUND_TRIP_DEGRADED_S:
+                status = HealthStatus.DEGRADED
+                message = "Redis response time is slow"
             else:
                 status = HealthStatus.HEALTHY
                 message = "Redis is operating normally"
 
-            return HealthCheckResult(
+            result = HealthCheckResult(
                 name="redis",
                 status=status,
                 response_time=response_time,
                 message=message,
                 details={
-                    "write_time": write_time,
-                    "read_time": read_time,
+                    "round_trip_time": round_trip_time,
                     "redis_info": {
                         "version": info.get("redis_version"),
                         "used_memory": info.get("used_memory_human"),
@@ -211,6 +323,8 @@ class HealthChecker:
                     }
                 }
             )
+            self._cache.set("redis_deep", result)
+            return result
 
         except Exception as e:
             logger.error(f"Redis health check failed: {str(e)}")
@@ -241,12 +355,12 @@ class HealthChecker:
             response_time = time.time() - start_time
 
             if response and "choices" in response and len(response["choices"]) > 0:
-                if response_time > 10.0:
-                    status = HealthStatus.DEGRADED
-                    message = "LLM service response is slow"
-                elif response_time > 20.0:
+                if response_time > LLM_UNHEALTHY_S:
                     status = HealthStatus.UNHEALTHY
                     message = "LLM service response is critical"
+                elif response_time > LLM_DEGRADED_S:
+                    status = HealthStatus.DEGRADED
+                    message = "LLM service response is slow"
                 else:
                     status = HealthStatus.HEALTHY
                     message = "LLM service is operating normally"
@@ -293,12 +407,12 @@ class HealthChecker:
             response_time = time.time() - start_time
 
             if embeddings and len(embeddings) > 0:
-                if response_time > 5.0:
-                    status = HealthStatus.DEGRADED
-                    message = "Embedding service response is slow"
-                elif response_time > 10.0:
+                if response_time > EMBEDDING_UNHEALTHY_S:
                     status = HealthStatus.UNHEALTHY
                     message = "Embedding service response is critical"
+                elif response_time > EMBEDDING_DEGRADED_S:
+                    status = HealthStatus.DEGRADED
+                    message = "Embedding service response is slow"
                 else:
                     status = HealthStatus.HEALTHY
                     message = "Embedding service is operating normally"
@@ -351,12 +465,12 @@ class HealthChecker:
             response_time = time.time() - start_time
 
             if intent_result and entity_result and sentiment_result:
-                if response_time > 8.0:
-                    status = HealthStatus.DEGRADED
-                    message = "NLU service response is slow"
-                elif response_time > 15.0:
+                if response_time > NLU_UNHEALTHY_S:
                     status = HealthStatus.UNHEALTHY
                     message = "NLU service response is critical"
+                elif response_time > NLU_DEGRADED_S:
+                    status = HealthStatus.DEGRADED
+                    message = "NLU service response is slow"
                 else:
                     status = HealthStatus.HEALTHY
                     message = "NLU service is operating normally"
@@ -396,11 +510,31 @@ class HealthChecker:
                 details={"error": str(e)}
             )
 
-    def get_system_info(self) -> Dict[str, Any]:
-        """Get system information."""
+    async def get_system_info(self) -> Dict[str, Any]:
+        """Get system information, re-sampling host metrics at most once per TTL."""
+        system_info = self._cache.get("system_info")
+        if system_info is None:
+            async with self._system_info_lock:
+                system_info = self._cache.get("system_info")
+                if system_info is None:
+                    system_info = await asyncio.to_thread(self._gather_system_info_sync)
+                    if "error" not in system_info:
+                        self._cache.set("system_info", system_info, ttl=SYSTEM_INFO_CACHE_TTL)
+
+        if "error" in system_info:
+            return system_info
+
+        # Thread count is cheap and changes often, so it is always read live
+        return {
+            **system_info,
+            "process": {**system_info["process"], "num_threads": self._proc.num_threads()}
+        }
+
+    def _gather_system_info_sync(self) -> Dict[str, Any]:
+        """Sample CPU, memory, disk and process metrics (blocking syscalls)."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous sample (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
 
             # Memory usage
@@ -412,9 +546,9 @@ class HealthChecker:
             disk_percent = (disk.used / disk.total) * 100
 
             # Process information
-            process = psutil.Process()
+            process = self._proc
             process_memory = process.memory_info()
-            process_cpu = process.cpu_percent()
+            process_cpu = process.cpu_percent(interval=None)
 
             return {
                 "cpu": {
@@ -438,7 +572,6 @@ class HealthChecker:
                     "memory_rss_mb": round(process_memory.rss / (1024**2), 2),
                     "memory_vms_mb": round(process_memory.vms / (1024**2), 2),
                     "cpu_percent": process_cpu,
-                    "num_threads": process.num_threads(),
                     "create_time": datetime.fromtimestamp(process.create_time()).isoformat()
                 }
             }
@@ -446,34 +579,82 @@ class HealthChecker:
             logger.error(f"Error getting system info: {e}")
             return {"error": str(e)}
 
+    async def _run_with_timeout(
+        self,
+        name: str,
+        coro: Awaitable[HealthCheckResult],
+        budget: float
+    ) -> HealthCheckResult:
+        """
+        Await a health check, reporting it unhealthy if it exceeds its budget.
+
+        Checks running in worker threads cannot be cancelled, but the probe
+        response is no longer held up by them.
+        """
+        try:
+            return await asyncio.wait_for(coro, timeout=budget)
+        except asyncio.TimeoutError:
+            return HealthCheckResult(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                response_time=budget,
+                message=f"Check timed out after {budget}s",
+                details={"timed_out": True}
+            )
+
     async def run_comprehensive_health_check(
         self,
         db: Session,
         redis_client: redis.Redis,
-        include_system_checks: bool = True
+        include_system_checks: bool = True,
+        depth: CheckDepth = "full"
     ) -> SystemHealthReport:
-        """Run comprehensive health check of all system components."""
-        checks = []
-
-        # Database health check (sync call)
-        db_check = self.check_database_health(db)
-        checks.append(db_check)
-
-        # Redis health check (sync call)
-        redis_check = self.check_redis_health(redis_client)
-        checks.append(redis_check)
-
-        # LLM service health check
-        llm_check = await self.check_llm_service_health()
-        checks.append(llm_check)
-
-        # Embedding service health check
-        embedding_check = await self.check_embedding_service_health()
-        checks.append(embedding_check)
+        """
+        Run comprehensive health check of all system components.
+
+        Database and Redis are checked first. The LLM, embedding and NLU
+        checks only run when depth is "full" and neither critical component
+        is unhealthy; otherwise they are reported as skipped.
+        """
+        # Phase 1: critical components (sync calls, run in worker threads)
+        db_check, redis_check = await asyncio.gather(
+            self._run_with_timeout(
+                "database",
+                asyncio.to_thread(self.check_database_health_deep, db),
+                DB_CHECK_TIMEOUT
+            ),
+            self._run_with_timeout(
+                "redis",
+                asyncio.to_thread(self.check_redis_health_deep, redis_client),
+                REDIS_CHECK_TIMEOUT
+            )
+        )
+        checks = [db_check, redis_check]
 
-        # NLU service health check
-        nlu_check = await self.check_nlu_service_health()
-        checks.append(nlu_check)
+        # Phase 2: downstream services
+        downstream = {
+            "llm_service": (self.check_llm_service_health, LLM_CHECK_TIMEOUT),
+            "embedding_service": (self.check_embedding_service_health, EMBEDDING_CHECK_TIMEOUT),
+            "nlu_service": (self.check_nlu_service_health, NLU_CHECK_TIMEOUT)
+        }
+        critical_unhealthy = any(check.status == HealthStatus.UNHEALTHY for check in checks)
+
+        if depth == "shallow" or critical_unhealthy:
+            reason = "shallow check requested" if depth == "shallow" else "critical dependency unhealthy"
+            checks.extend(
+                HealthCheckResult(
+                    name=name,
+                    status=HealthStatus.UNKNOWN,
+                    response_time=0.0,
+                    message=f"Check skipped: {reason}"
+                )
+                for name in downstream
+            )
+        else:
+            checks.extend(await asyncio.gather(*(
+                self._run_with_timeout(name, check(), budget)
+                for name, (check, budget) in downstream.items()
+            )))
 
         # Determine overall status
         unhealthy_count = sum(1 for check in checks if check.status == HealthStatus.UNHEALTHY)
@@ -489,12 +670,12 @@ class HealthChecker:
         # Get system information
         system_info = {}
         if include_system_checks:
-            system_info = self.get_system_info()
+            system_info = await self.get_system_info()
 
         return SystemHealthReport(
             overall_status=overall_status,
             checks=checks,
-            uptime_seconds=time.time() - self.start_time,
+            uptime_seconds=clock.time() - self.start_time,
             version=settings.VERSION,
             timestamp=datetime.utcnow(),
             system_info=system_info
@@ -504,10 +685,91 @@ class HealthChecker:
 router = APIRouter()
 health_checker = HealthChecker()
 
+# Prometheus metrics, updated by a background task and served by /metrics
+metrics_registry = CollectorRegistry()
+HEALTH_CHECK_STATUS = Gauge(
+    "health_check_status",
+    "Component health (1=healthy, 0.5=degraded, 0=unhealthy, -1=unknown)",
+    ["name"],
+    registry=metrics_registry
+)
+HEALTH_CHECK_DURATION = Gauge(
+    "health_check_duration_seconds",
+    "Duration of the latest component health check",
+    ["name"],
+    registry=metrics_registry
+)
+SYSTEM_CPU_PERCENT = Gauge("system_cpu_percent", "System CPU usage percent", registry=metrics_registry)
+SYSTEM_MEMORY_PERCENT = Gauge("system_memory_percent", "System memory usage percent", registry=metrics_registry)
+SYSTEM_DISK_PERCENT = Gauge("system_disk_percent", "Root filesystem usage percent", registry=metrics_registry)
+UPTIME_SECONDS = Gauge("uptime_seconds", "Seconds since the health checker started", registry=metrics_registry)
+
+_STATUS_GAUGE_VALUES = {
+    HealthStatus.HEALTHY: 1.0,
+    HealthStatus.DEGRADED: 0.5,
+    HealthStatus.UNHEALTHY: 0.0,
+    HealthStatus.UNKNOWN: -1.0
+}
+
+
+async def _refresh_health_metrics() -> None:
+    """
+    Run a shallow health check and publish it to the Prometheus gauges.
 
-@router.get("/health", response_model=Dict[str, Any])
+    Shallow depth keeps the refresh to the database, Redis and system
+    checks; the paid LLM, embedding and NLU probes are reported as UNKNOWN
+    (-1) rather than called every refresh interval in every worker.
+    """
+    db = SessionLocal()
+    try:
+        health_report = await health_checker.run_comprehensive_health_check(
+            db, get_redis_client(), include_system_checks=True, depth="shallow"
+        )
+    finally:
+        db.close()
+
+    for check in health_report.checks:
+        HEALTH_CHECK_STATUS.labels(name=check.name).set(_STATUS_GAUGE_VALUES[check.status])
+        HEALTH_CHECK_DURATION.labels(name=check.name).set(check.response_time)
+
+    system_info = health_report.system_info
+    if "error" not in system_info:
+        SYSTEM_CPU_PERCENT.set(system_info["cpu"]["usage_percent"])
+        SYSTEM_MEMORY_PERCENT.set(system_info["memory"]["usage_percent"])
+        SYSTEM_DISK_PERCENT.set(system_info["disk"]["usage_percent"])
+    UPTIME_SECONDS.set(health_report.uptime_seconds)
+
+
+async def metrics_refresh_task(interval: float = METRICS_REFRESH_INTERVAL) -> None:
+    """
+    Refresh the Prometheus gauges every `interval` seconds.
+
+    An application that mounts this router's /metrics should start and
+    cancel it from its lifespan, so scrapes only read the gauges. app.main
+    does not mount this router and so does not run it.
+    """
+    while True:
+        try:
+            await _refresh_health_metrics()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Metrics refresh failed: {e}")
+        await asyncio.sleep(interval)
+
+
+# Pre-serialized bodies for the static and near-static endpoints
+_PING_BYTES_TEMPLATE = b'{"status":"ok","message":"pong","timestamp":"%s"}'
+_LIVENESS_BYTES_TEMPLATE = b'{"alive":true,"timestamp":"%s","uptime_seconds":%.6f}'
+_VERSION_BYTES = json.dumps({
+    "version": settings.VERSION,
+    "name": settings.PROJECT_NAME,
+    "environment": "development" if settings.DEBUG else "production"
+}).encode()
+
+
+@router.get("/health")
 async def health_check(
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis_client)
 ):
@@ -523,7 +785,7 @@ async def health_check(
         logger.info(f"Database check result: {db_check.status.value}")
 
         logger.info("Calling Redis health check")
-        redis_check = health_checker.check_redis_health(redis_client)
+        redis_check = health_checker.check_redis_health_fast(redis_client)
         logger.info(f"Redis check result: {redis_check.status.value}")
 
         # Determine status
@@ -539,8 +801,8 @@ async def health_check(
 
         result = {
             "status": status,
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": time.time() - health_checker.start_time,
+            "timestamp": clock.iso(),
+            "uptime_seconds": clock.time() - health_checker.start_time,
             "version": settings.VERSION,
             "checks": {
                 "database": {
@@ -554,84 +816,65 @@ async def health_check(
             }
         }
         logger.info(f"Health check result: {status}")
-        return result
+        return ORJSONResponse(content=result, status_code=status_code)
 
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }, 503
+        return ORJSONResponse(
+            content={
+                "status": "unhealthy",
+                "timestamp": clock.iso(),
+                "error": str(e)
+            },
+            status_code=503
+        )
 
 
-@router.get("/health/detailed", response_model=Dict[str, Any])
+@router.get("/health/detailed")
 async def detailed_health_check(
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis_client),
-    include_system_checks: bool = True
+    include_system_checks: bool = True,
+    depth: CheckDepth = Query("full", description="shallow skips LLM/embedding/NLU checks")
 ):
     """
     Detailed health check endpoint.
     Returns comprehensive health information for monitoring and debugging.
     """
     try:
-        # Schedule background health check update
-        background_tasks.add_task(
-            health_checker.run_comprehensive_health_check,
-            db, redis_client, include_system_checks
-        )
-
         # Run health check
         health_report = await health_checker.run_comprehensive_health_check(
-            db, redis_client, include_system_checks
+            db, redis_client, include_system_checks, depth
         )
 
-        # Convert to response format
-        response = {
-            "overall_status": health_report.overall_status.value,
-            "timestamp": health_report.timestamp.isoformat(),
-            "uptime_seconds": health_report.uptime_seconds,
-            "version": health_report.version,
-            "system_info": health_report.system_info,
-            "checks": []
-        }
-
-        for check in health_report.checks:
-            check_data = {
-                "name": check.name,
-                "status": check.status.value,
-                "response_time": check.response_time,
-                "message": check.message,
-                "timestamp": check.timestamp.isoformat()
-            }
-
-            if check.details:
-                check_data["details"] = check.details
-
-            response["checks"].append(check_data)
-
         # Set appropriate status code
         if health_report.overall_status == HealthStatus.UNHEALTHY:
             status_code = 503
-        elif health_report.overall_status == HealthStatus.DEGRADED:
-            status_code = 200
         else:
             status_code = 200
 
-        return response, status_code
+        # Omit only empty per-check details; None values inside details are kept
+        return Response(
+            content=health_report.model_dump_json(exclude={
+                "checks": {i: {"details"} for i, check in enumerate(health_report.checks) if not check.details}
+            }),
+            media_type="application/json",
+            status_code=status_code
+        )
 
     except Exception as e:
         logger.error(f"Detailed health check failed: {e}")
-        return {
-            "overall_status": "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }, 503
+        return ORJSONResponse(
+            content={
+                "overall_status": "unhealthy",
+                "timestamp": clock.iso(),
+                "error": str(e)
+            },
+            status_code=503
+        )
 
 
-@router.get("/health/ready", response_model=Dict[str, Any])
+@router.get("/health/ready")
 async def readiness_check(
     db: Session = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis_client)
@@ -643,40 +886,37 @@ async def readiness_check(
     try:
         # Check critical components
         db_check = health_checker.check_database_health(db)
-        redis_check = health_checker.check_redis_health(redis_client)
+        redis_check = health_checker.check_redis_health_fast(redis_client)
 
         # Application is ready if database and redis are healthy
-        if (db_check.status == HealthStatus.HEALTHY and
-            redis_check.status == HealthStatus.HEALTHY):
+        ready = (db_check.status == HealthStatus.HEALTHY and
+                 redis_check.status == HealthStatus.HEALTHY)
 
-            return {
-                "ready": True,
-                "timestamp": datetime.utcnow().isoformat(),
-                "checks": {
-                    "database": db_check.status.value,
-                    "redis": redis_check.status.value
-                }
-            }
-        else:
-            return {
-                "ready": False,
-                "timestamp": datetime.utcnow().isoformat(),
+        return ORJSONResponse(
+            content={
+                "ready": ready,
+                "timestamp": clock.iso(),
                 "checks": {
                     "database": db_check.status.value,
                     "redis": redis_check.status.value
                 }
-            }, 503
+            },
+            status_code=200 if ready else 503
+        )
 
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return {
-            "ready": False,
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }, 503
+        return ORJSONResponse(
+            content={
+                "ready": False,
+                "timestamp": clock.iso(),
+                "error": str(e)
+            },
+            status_code=503
+        )
 
 
-@router.get("/health/live", response_model=Dict[str, Any])
+@router.get("/health/live")
 async def liveness_check():
     """
     Liveness check endpoint for Kubernetes/container orchestration.
@@ -684,66 +924,44 @@ async def liveness_check():
     """
     try:
         # Simple liveness check - if we can respond, we're alive
-        return {
-            "alive": True,
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": time.time() - health_checker.start_time
-        }
+        return Response(
+            content=_LIVENESS_BYTES_TEMPLATE % (
+                clock.iso().encode(),
+                clock.time() - health_checker.start_time
+            ),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Liveness check failed: {e}")
-        return {
-            "alive": False,
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }, 503
+        return ORJSONResponse(
+            content={
+                "alive": False,
+                "timestamp": clock.iso(),
+                "error": str(e)
+            },
+            status_code=503
+        )
 
 
-@router.get("/metrics", response_model=Dict[str, Any])
-async def get_metrics(
-    db: Session = Depends(get_db),
-    redis_client: redis.Redis = Depends(get_redis_client)
-):
+@router.get("/metrics")
+async def get_metrics():
     """
-    Get application metrics for monitoring.
+    Get application metrics for monitoring in Prometheus text format.
+    Values are refreshed in the background rather than probed per scrape.
     """
-    try:
-        system_info = health_checker.get_system_info()
-
-        # Get basic health metrics
-        health_report = await health_checker.run_comprehensive_health_check(
-            db, redis_client, include_system_checks=False
-        )
-
-        metrics = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": time.time() - health_checker.start_time,
-            "version": settings.VERSION,
-            "system": system_info,
-            "health_checks": {
-                check.name: {
-                    "status": check.status.value,
-                    "response_time": check.response_time
-                }
-                for check in health_report.checks
-            }
-        }
-
-        return metrics
-
-    except Exception as e:
-        logger.error(f"Metrics collection failed: {e}")
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "error": str(e)
-        }, 500
+    return Response(
+        content=generate_latest(metrics_registry),
+        headers={"Content-Type": CONTENT_TYPE_LATEST}
+    )
 
 
 @router.get("/")
-async def legacy_health_check(db: Session = Depends(get_db)):
+async def legacy_health_check(request: Request):
     """
     Legacy health check endpoint for backward compatibility.
+    Permanently redirects to the basic health check.
     """
-    return await health_check(BackgroundTasks(), db)
+    return RedirectResponse(url=str(request.url_for("health_check")), status_code=308)
 
 
 @router.get("/ping")
@@ -751,11 +969,10 @@ async def ping():
     """
     Simple ping endpoint for basic connectivity check.
     """
-    return {
-        "status": "ok",
-        "message": "pong",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    return Response(
+        content=_PING_BYTES_TEMPLATE % clock.iso().encode(),
+        media_type="application/json"
+    )
 
 
 @router.get("/version")
@@ -763,8 +980,4 @@ async def version_info():
     """
     Get version information.
     """
-    return {
-        "version": settings.VERSION,
-        "name": settings.PROJECT_NAME,
-        "environment": "development" if settings.DEBUG else "production"
-    }
\ No newline at end of file
+    return Response(content=_VERSION_BYTES, media_type="application/json")
@@ -2,22 +2,72 @@
 Load testing API endpoints.
 """
 
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+import asyncio
+from functools import lru_cache
+from typing import Callable, Dict, Any, Literal, Optional
+import orjson
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 
 from app.testing.load_testing import (
     LoadTestConfig,
+    LoadTestResult,
     LoadTestScenario,
-    LoadTestRunner,
     PredefinedScenarios,
+    TERMINAL_STATUSES,
     get_load_test_runner,
     generate_load_report
 )
-
-router = APIRouter()
+from app.utils.clock import clock
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Load tests that may run at once on this process
+MAX_CONCURRENT_LOAD_TESTS = 10
+
+HTTPMethod = Literal["GET", "POST", "PUT", "DELETE"]
+ScenarioName = Literal["chat_api", "nlu_api", "health_check"]
+
+# Predefined scenario builders by name
+_SCENARIO_MAP: Dict[ScenarioName, Callable[[str], LoadTestScenario]] = {
+    "chat_api": PredefinedScenarios.chat_api_scenario,
+    "nlu_api": PredefinedScenarios.nlu_api_scenario,
+    "health_check": PredefinedScenarios.health_check_scenario
+}
+
+# Scenario catalogue is static, so its JSON body is built once at import
+_SCENARIOS_BODY = orjson.dumps({
+    "available_scenarios": {
+        "chat_api": {
+            "name": "Chat API Load Test",
+            "description": "Tests the chat API endpoints with realistic user interactions",
+            "endpoints": [
+                "/api/v1/chat/message (70%)",
+                "/api/v1/chat/history (20%)",
+                "/api/v1/chat/conversations (10%)"
+            ]
+        },
+        "nlu_api": {
+            "name": "NLU API Load Test",
+            "description": "Tests the natural language understanding endpoints",
+            "endpoints": [
+                "/api/v1/nlu/classify-intent (40%)",
+                "/api/v1/nlu/extract-entities (30%)",
+                "/api/v1/nlu/analyze-sentiment (30%)"
+            ]
+        },
+        "health_check": {
+            "name": "Health Check Load Test",
+            "description": "Tests the health check endpoints for monitoring",
+            "endpoints": [
+                "/health (60%)",
+                "/health/detailed (40%)"
+            ]
+        }
+    }
+})
 
 
 class LoadTestRequest(BaseModel):
@@ -25,7 +75,7 @@ class LoadTestRequest(BaseModel):
     name: str = Field(..., description="Test name")
     base_url: str = Field(..., description="Base URL for testing")
     endpoint: str = Field(..., description="API endpoint to test")
-    method: str = Field("GET", regex="^(GET|POST|PUT|DELETE)$", description="HTTP method")
+    method: HTTPMethod = Field("GET", description="HTTP method")
     headers: Optional[Dict[str, str]] = Field(None, description="Request headers")
     body: Optional[Dict[str, Any]] = Field(None, description="Request body for POST/PUT")
     concurrent_users: int = Field(10, ge=1, le=1000, description="Number of concurrent users")
@@ -34,32 +84,35 @@ class LoadTestRequest(BaseModel):
     requests_per_second: Optional[int] = Field(None, ge=1, le=1000, description="Target requests per second")
     timeout_seconds: int = Field(30, ge=1, le=300, description="Request timeout in seconds")
     think_time_seconds: float = Field(0.0, ge=0.0, le=60.0, description="Think time between requests")
+    fast_mode: bool = Field(True, description="Only check status codes; skip decoding error response bodies")
+    workers: int = Field(1, ge=1, le=32, description="Worker processes to split concurrent users across")
 
 
 class ScenarioTestRequest(BaseModel):
     """Scenario-based load test request model."""
-    scenario_name: str = Field(..., description="Name of predefined scenario")
+    scenario_name: ScenarioName = Field(..., description="Name of predefined scenario")
     base_url: str = Field(..., description="Base URL for testing")
     concurrent_users: int = Field(10, ge=1, le=1000, description="Number of concurrent users")
     duration_seconds: int = Field(60, ge=10, le=3600, description="Test duration in seconds")
     ramp_up_seconds: int = Field(10, ge=0, le=300, description="Ramp-up time in seconds")
+    http2: bool = Field(True, description="Multiplex requests over HTTP/2 connections")
 
 
-@router.post("/load-test/start", response_model=Dict[str, Any])
-async def start_load_test(
-    request: LoadTestRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/load-test/start")
+async def start_load_test(request: LoadTestRequest):
     """
     Start a new load test.
 
     Args:
         request: Load test configuration
-        background_tasks: FastAPI background tasks
 
     Returns:
         Load test information and test ID
     """
+    runner = get_load_test_runner()
+    if runner.running_task_count >= MAX_CONCURRENT_LOAD_TESTS:
+        raise HTTPException(status_code=429, detail="Too many load tests running")
+
     try:
         # Create load test configuration
         config = LoadTestConfig(
@@ -74,26 +127,30 @@ async def start_load_test(
             ramp_up_seconds=request.ramp_up_seconds,
             requests_per_second=request.requests_per_second,
             timeout_seconds=request.timeout_seconds,
-            think_time_seconds=request.think_time_seconds
+            think_time_seconds=request.think_time_seconds,
+            fast_mode=request.fast_mode
         )
 
-        # Get load test runner
-        runner = get_load_test_runner()
-
-        # Start load test in background
-        background_tasks.add_task(runner.run_load_test, config)
+        # Start load test as a tracked background task
+        if request.workers > 1:
+            test_id = runner.start_test(config, runner.run_distributed_load_test, config, request.workers)
+        else:
+            test_id = runner.start_test(config, runner.run_load_test, config)
 
         return {
             "message": "Load test started successfully",
+            "test_id": test_id,
             "test_name": request.name,
             "test_config": {
                 "endpoint": request.endpoint,
                 "method": request.method,
                 "concurrent_users": request.concurrent_users,
                 "duration_seconds": request.duration_seconds,
-                "ramp_up_seconds": request.ramp_up_seconds
+                "ramp_up_seconds": request.ramp_up_seconds,
+                "fast_mode": request.fast_mode,
+                "workers": request.workers
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": clock.iso()
         }
 
     except Exception as e:
@@ -101,70 +158,57 @@ async def start_load_test(
         raise HTTPException(status_code=500, detail=f"Failed to start load test: {str(e)}")
 
 
-@router.post("/load-test/scenario", response_model=Dict[str, Any])
-async def start_scenario_test(
-    request: ScenarioTestRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/load-test/scenario")
+async def start_scenario_test(request: ScenarioTestRequest):
     """
     Start a predefined scenario load test.
 
     Args:
         request: Scenario test configuration
-        background_tasks: FastAPI background tasks
 
     Returns:
         Load test information and test ID
     """
-    try:
-        # Get predefined scenario
-        scenario_map = {
-            "chat_api": PredefinedScenarios.chat_api_scenario,
-            "nlu_api": PredefinedScenarios.nlu_api_scenario,
-            "health_check": PredefinedScenarios.health_check_scenario
-        }
+    runner = get_load_test_runner()
+    if runner.running_task_count >= MAX_CONCURRENT_LOAD_TESTS:
+        raise HTTPException(status_code=429, detail="Too many load tests running")
 
-        if request.scenario_name not in scenario_map:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown scenario: {request.scenario_name}. Available scenarios: {list(scenario_map.keys())}"
-            )
-
-        # Create scenario
-        scenario = scenario_map[request.scenario_name](request.base_url)
-
-        # Get load test runner
-        runner = get_load_test_runner()
+    try:
+        # Create predefined scenario (the name is validated by ScenarioName)
+        scenario = _SCENARIO_MAP[request.scenario_name](request.base_url)
 
-        # Start scenario test in background
-        background_tasks.add_task(
-            runner.run_scenario_test,
+        # Start scenario test as a tracked background task
+        scenario_args = (
             scenario,
             request.concurrent_users,
             request.duration_seconds,
-            request.ramp_up_seconds
+            request.ramp_up_seconds,
+            request.http2
+        )
+        test_id = runner.start_test(
+            runner.scenario_config(*scenario_args), runner.run_scenario_test, *scenario_args
         )
 
         return {
             "message": f"Scenario load test '{request.scenario_name}' started successfully",
+            "test_id": test_id,
             "scenario_name": request.scenario_name,
             "test_config": {
                 "concurrent_users": request.concurrent_users,
                 "duration_seconds": request.duration_seconds,
                 "ramp_up_seconds": request.ramp_up_seconds,
-                "requests_in_scenario": len(scenario.requests)
+                "requests_in_scenario": len(scenario.requests),
+                "http2": request.http2
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": clock.iso()
         }
 
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"Failed to start scenario test: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to start scenario test: {str(e)}")
 
 
-@router.get("/load-test/active", response_model=List[Dict[str, Any]])
+@router.get("/load-test/active")
 async def get_active_load_tests():
     """
     Get all currently active load tests.
@@ -181,16 +225,15 @@ async def get_active_load_tests():
                 "test_id": test.test_id,
                 "name": test.config.name,
                 "status": test.status.value,
-                "start_time": test.start_time.isoformat(),
+                "start_time": test.start_iso,
                 "endpoint": test.config.endpoint,
                 "method": test.config.method,
                 "concurrent_users": test.config.concurrent_users,
                 "total_requests": test.total_requests,
                 "successful_requests": test.successful_requests,
                 "failed_requests": test.failed_requests,
-                "current_response_time": (
-                    statistics.mean(test.response_times[-10:]) if test.response_times else 0
-                )
+                "current_response_time": test.current_response_time_ewma,
+                "recent_response_times": test.last_n_response_times()
             }
             for test in active_tests
         ]
@@ -200,15 +243,39 @@ async def get_active_load_tests():
         raise HTTPException(status_code=500, detail="Failed to retrieve active load tests")
 
 
-@router.get("/load-test/history", response_model=List[Dict[str, Any]])
+def _history_row(test: LoadTestResult) -> Dict[str, Any]:
+    """Summary row for a test in the history listing."""
+    return {
+        "test_id": test.test_id,
+        "name": test.config.name,
+        "status": test.status.value,
+        "start_time": test.start_iso,
+        "end_time": test.end_iso,
+        "duration_seconds": test.duration_seconds,
+        "endpoint": test.config.endpoint,
+        "method": test.config.method,
+        "concurrent_users": test.config.concurrent_users,
+        "total_requests": test.total_requests,
+        "successful_requests": test.successful_requests,
+        "failed_requests": test.failed_requests,
+        "success_rate": test.success_rate,
+        "throughput_rps": test.throughput,
+        "average_response_time": test.average_response_time,
+        "p95_response_time": test.p95_response_time
+    }
+
+
+@router.get("/load-test/history")
 async def get_load_test_history(
-    limit: int = Query(20, ge=1, le=100, description="Maximum number of results")
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    stream: bool = Query(False, description="Stream rows as newline-delimited JSON")
 ):
     """
     Get load test history.
 
     Args:
         limit: Maximum number of test results to return
+        stream: Send one JSON object per line instead of a single array
 
     Returns:
         List of historical load test information
@@ -217,98 +284,20 @@ async def get_load_test_history(
         runner = get_load_test_runner()
         test_history = runner.get_test_history(limit)
 
-        return [
-            {
-                "test_id": test.test_id,
-                "name": test.config.name,
-                "status": test.status.value,
-                "start_time": test.start_time.isoformat(),
-                "end_time": test.end_time.isoformat() if test.end_time else None,
-                "duration_seconds": (
-                    (test.end_time - test.start_time).total_seconds()
-                    if test.end_time else 0
-                ),
-                "endpoint": test.config.endpoint,
-                "method": test.config.method,
-                "concurrent_users": test.config.concurrent_users,
-                "total_requests": test.total_requests,
-                "successful_requests": test.successful_requests,
-                "failed_requests": test.failed_requests,
-                "success_rate": (
-                    (test.successful_requests / test.total_requests * 100)
-                    if test.total_requests > 0 else 0
-                ),
-                "throughput_rps": test.throughput,
-                "average_response_time": test.average_response_time,
-                "p95_response_time": test.p95_response_time
-            }
-            for test in test_history
-        ]
+        if stream:
+            return StreamingResponse(
+                (orjson.dumps(_history_row(test)) + b"\n" for test in test_history),
+                media_type="application/x-ndjson"
+            )
+
+        return [_history_row(test) for test in test_history]
 
     except Exception as e:
         logger.error(f"Failed to get load test history: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve load test history")
 
 
-@router.get("/load-test/{test_id}", response_model=Dict[str, Any])
-async def get_load_test_result(test_id: str):
-    """
-    Get detailed results for a specific load test.
-
-    Args:
-        test_id: Load test ID
-
-    Returns:
-        Detailed load test results
-    """
-    try:
-        runner = get_load_test_runner()
-        result = runner.get_test_result(test_id)
-
-        if not result:
-            raise HTTPException(status_code=404, detail="Load test not found")
-
-        return generate_load_report(result)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get load test result: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve load test result")
-
-
-@router.post("/load-test/{test_id}/cancel", response_model=Dict[str, Any])
-async def cancel_load_test(test_id: str):
-    """
-    Cancel an active load test.
-
-    Args:
-        test_id: Load test ID to cancel
-
-    Returns:
-        Cancellation confirmation
-    """
-    try:
-        runner = get_load_test_runner()
-        success = runner.cancel_test(test_id)
-
-        if not success:
-            raise HTTPException(status_code=404, detail="Active load test not found")
-
-        return {
-            "message": "Load test cancelled successfully",
-            "test_id": test_id,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to cancel load test: {e}")
-        raise HTTPException(status_code=500, detail="Failed to cancel load test")
-
-
-@router.get("/load-test/scenarios", response_model=Dict[str, Any])
+@router.get("/load-test/scenarios")
 async def get_predefined_scenarios():
     """
     Get available predefined load test scenarios.
@@ -316,47 +305,14 @@ async def get_predefined_scenarios():
     Returns:
         List of available scenarios and their descriptions
     """
-    try:
-        scenarios = {
-            "chat_api": {
-                "name": "Chat API Load Test",
-                "description": "Tests the chat API endpoints with realistic user interactions",
-                "endpoints": [
-                    "/api/v1/chat/message (70%)",
-                    "/api/v1/chat/history (20%)",
-                    "/api/v1/chat/conversations (10%)"
-                ]
-            },
-            "nlu_api": {
-                "name": "NLU API Load Test",
-                "description": "Tests the natural language understanding endpoints",
-                "endpoints": [
-                    "/api/v1/nlu/classify-intent (40%)",
-                    "/api/v1/nlu/extract-entities (30%)",
-                    "/api/v1/nlu/analyze-sentiment (30%)"
-                ]
-            },
-            "health_check": {
-                "name": "Health Check Load Test",
-                "description": "Tests the health check endpoints for monitoring",
-                "endpoints": [
-                    "/health (60%)",
-                    "/health/detailed (40%)"
-                ]
-            }
-        }
-
-        return {
-            "available_scenarios": scenarios,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-    except Exception as e:
-        logger.error(f"Failed to get predefined scenarios: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve scenarios")
+    return Response(
+        content=_SCENARIOS_BODY,
+        media_type="application/json",
+        headers={"X-Server-Time": clock.iso()}
+    )
 
 
-@router.get("/load-test/dashboard", response_model=Dict[str, Any])
+@router.get("/load-test/dashboard")
 async def get_load_test_dashboard():
     """
     Get load testing dashboard data.
@@ -369,33 +325,26 @@ async def get_load_test_dashboard():
         active_tests = runner.get_active_tests()
         recent_tests = runner.get_test_history(10)
 
-        # Calculate summary statistics
-        total_requests = sum(test.total_requests for test in recent_tests)
-        total_successful = sum(test.successful_requests for test in recent_tests)
+        # Calculate summary statistics in a single pass
+        total_requests = total_successful = 0
+        rt_sum = tp_sum = 0.0
+        rt_count = tp_count = 0
+        for test in recent_tests:
+            total_requests += test.total_requests
+            total_successful += test.successful_requests
+            if test.average_response_time > 0:
+                rt_sum += test.average_response_time
+                rt_count += 1
+            if test.throughput > 0:
+                tp_sum += test.throughput
+                tp_count += 1
+
         avg_success_rate = (
             (total_successful / total_requests * 100)
             if total_requests > 0 else 0
         )
-
-        # Get average response times
-        avg_response_times = [
-            test.average_response_time for test in recent_tests
-            if test.average_response_time > 0
-        ]
-        avg_response_time = (
-            sum(avg_response_times) / len(avg_response_times)
-            if avg_response_times else 0
-        )
-
-        # Get throughput data
-        throughputs = [
-            test.throughput for test in recent_tests
-            if test.throughput > 0
-        ]
-        avg_throughput = (
-            sum(throughputs) / len(throughputs)
-            if throughputs else 0
-        )
+        avg_response_time = rt_sum / rt_count if rt_count else 0
+        avg_throughput = tp_sum / tp_count if tp_count else 0
 
         return {
             "summary": {
@@ -410,13 +359,10 @@ async def get_load_test_dashboard():
                 {
                     "test_id": test.test_id,
                     "name": test.config.name,
-                    "start_time": test.start_time.isoformat(),
+                    "start_time": test.start_iso,
                     "concurrent_users": test.config.concurrent_users,
                     "requests_so_far": test.total_requests,
-                    "success_rate": (
-                        (test.successful_requests / test.total_requests * 100)
-                        if test.total_requests > 0 else 0
-                    )
+                    "success_rate": test.success_rate
                 }
                 for test in active_tests
             ],
@@ -425,17 +371,14 @@ async def get_load_test_dashboard():
                     "test_id": test.test_id,
                     "name": test.config.name,
                     "status": test.status.value,
-                    "end_time": test.end_time.isoformat() if test.end_time else None,
-                    "success_rate": (
-                        (test.successful_requests / test.total_requests * 100)
-                        if test.total_requests > 0 else 0
-                    ),
+                    "end_time": test.end_iso,
+                    "success_rate": test.success_rate,
                     "throughput_rps": test.throughput,
                     "avg_response_time": test.average_response_time
                 }
                 for test in recent_tests[:5]
             ],
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": clock.iso()
         }
 
     except Exception as e:
@@ -443,5 +386,83 @@ async def get_load_test_dashboard():
         raise HTTPException(status_code=500, detail="Failed to retrieve dashboard data")
 
 
-# Import statistics for calculation
-import statistics
\ No newline at end of file
+@lru_cache(maxsize=256)
+def _finished_report_bytes(test_id: str) -> bytes:
+    """Serialized report for a finished test; its results no longer change."""
+    report = generate_load_report(get_load_test_runner().get_test_result(test_id))
+    # status_codes is keyed by int
+    return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS)
+
+
+@router.get("/load-test/{test_id}")
+async def get_load_test_result(test_id: str, request: Request):
+    """
+    Get detailed results for a specific load test.
+
+    Finished tests are served with an ETag so pollers can revalidate
+    with If-None-Match and get a 304 instead of the full report.
+
+    Args:
+        test_id: Load test ID
+        request: Incoming request (for If-None-Match)
+
+    Returns:
+        Detailed load test results
+    """
+    try:
+        runner = get_load_test_runner()
+        result = runner.get_test_result(test_id)
+
+        if not result:
+            raise HTTPException(status_code=404, detail="Load test not found")
+
+        # Report assembly walks the full result, so keep it off the event loop
+        if result.status not in TERMINAL_STATUSES:
+            return await asyncio.to_thread(generate_load_report, result)
+
+        etag = f'"{test_id}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
+        return Response(
+            content=await asyncio.to_thread(_finished_report_bytes, test_id),
+            media_type="application/json",
+            headers={"ETag": etag}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get load test result: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve load test result")
+
+
+@router.post("/load-test/{test_id}/cancel")
+async def cancel_load_test(test_id: str):
+    """
+    Cancel an active load test.
+
+    Args:
+        test_id: Load test ID to cancel
+
+    Returns:
+        Cancellation confirmation
+    """
+    try:
+        runner = get_load_test_runner()
+        success = runner.cancel_test(test_id)
+
+        if not success:
+            raise HTTPException(status_code=404, detail="Active load test not found")
+
+        return {
+            "message": "Load test cancelled successfully",
+            "test_id": test_id,
+            "timestamp": clock.iso()
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to cancel load test: {e}")
+        raise HTTPException(status_code=500, detail="Failed to cancel load test")
@@ -2,27 +2,128 @@
 Metrics and monitoring endpoints.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import asyncio
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
 from fastapi import APIRouter, Query, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from loguru import logger
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from app.monitoring.metrics import (
+    PROMETHEUS_MULTIPROC_DIR,
+    MetricType,
     get_metrics_collector,
-    get_performance_monitor,
     llm_tracker,
     nlu_tracker,
     dialogue_tracker
 )
+from app.utils.clock import clock
+from app.utils.ttl_cache import TTLCache
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+MetricFormat = Literal["json", "prometheus"]
 
-@router.get("/metrics", response_model=Dict[str, Any])
+# Summary windows used by the fixed dashboards and alert checks
+FIVE_MINUTES = timedelta(minutes=5)
+ONE_HOUR = timedelta(hours=1)
+ONE_DAY = timedelta(hours=24)
+
+# Seconds a computed /metrics payload is reused across scrapes
+METRICS_CACHE_TTL = 1.5
+
+_metrics_cache = TTLCache(ttl=METRICS_CACHE_TTL, max_entries=32)
+
+# Metric names served by each endpoint
+LLM_METRICS: Tuple[str, ...] = (
+    "llm_requests_total",
+    "llm_request_duration_seconds",
+    "llm_tokens_used_total"
+)
+NLU_METRICS: Tuple[str, ...] = (
+    "nlu_intent_classification_duration_seconds",
+    "nlu_intent_confidence",
+    "nlu_intent_classification_accuracy",
+    "nlu_entity_extraction_duration_seconds",
+    "nlu_entities_found_count",
+    "nlu_sentiment_analysis_duration_seconds",
+    "nlu_sentiment_confidence"
+)
+DIALOGUE_METRICS: Tuple[str, ...] = (
+    "dialogue_state_transitions_total",
+    "dialogue_transition_confidence",
+    "conversation_quality_score"
+)
+SYSTEM_METRICS: Tuple[str, ...] = (
+    "system_cpu_usage_percent",
+    "system_memory_usage_percent",
+    "system_memory_used_bytes",
+    "system_memory_available_bytes",
+    "system_disk_usage_percent",
+    "system_disk_used_bytes",
+    "system_disk_free_bytes",
+    "process_memory_rss_bytes",
+    "process_memory_vms_bytes",
+    "process_cpu_percent",
+    "process_num_threads",
+    "active_connections",
+    "application_uptime_seconds"
+)
+
+# Overview dashboard: current system gauges, last-hour application and last-day service metrics
+OVERVIEW_SYSTEM_METRICS: Tuple[str, ...] = (
+    "system_cpu_usage_percent",
+    "system_memory_usage_percent",
+    "system_disk_usage_percent"
+)
+OVERVIEW_APP_METRICS: Tuple[str, ...] = (
+    "http_requests_total",
+    "http_request_duration_seconds",
+    "active_connections"
+)
+OVERVIEW_SERVICE_METRICS: Tuple[str, ...] = (
+    "llm_requests_total",
+    "llm_request_duration_seconds",
+    "nlu_intent_classification_accuracy",
+    "conversation_quality_score"
+)
+
+# (warning, critical) thresholds checked by /metrics/alerts
+ALERT_THRESHOLDS: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    "system_cpu_usage_percent": (80, 90),
+    "system_memory_usage_percent": (80, 90),
+    "system_disk_usage_percent": (85, 95),
+    "http_request_duration_seconds": (2.0, 5.0),
+    "llm_request_duration_seconds": (10.0, 20.0),
+    "conversation_quality_score": (0.6, 0.4)
+})
+
+
+def _current_value(summary: Dict) -> Optional[float]:
+    """Pick the value a threshold is compared against from a metric summary."""
+    for field in ("current", "mean", "latest"):
+        if field in summary:
+            return summary[field]
+    return None
+
+
+def _breached_threshold(metric_name: str, value: float) -> Optional[Tuple[str, float]]:
+    """Return the (severity, threshold) pair the value breaches, if any."""
+    warning, critical = ALERT_THRESHOLDS[metric_name]
+    if value >= critical:
+        return "critical", critical
+    if value >= warning:
+        return "warning", warning
+    return None
+
+
+@router.get("/metrics")
 async def get_metrics(
     time_window_hours: Optional[int] = Query(1, ge=1, le=24, description="Time window in hours"),
     metric_names: Optional[List[str]] = Query(None, description="Specific metric names to retrieve"),
-    format: Optional[str] = Query("json", regex="^(json|prometheus)$", description="Output format")
+    format: MetricFormat = Query("json", description="Output format")
 ):
     """
     Get application metrics.
@@ -39,24 +140,32 @@ async def get_metrics(
         metrics_collector = get_metrics_collector()
         time_window = timedelta(hours=time_window_hours)
 
+        # Scrapers and dashboards poll this endpoint; reuse results for a moment
         if format == "prometheus":
-            prometheus_data = metrics_collector.export_prometheus_format()
-            return Response(content=prometheus_data, media_type="text/plain")
+            prometheus_data = _metrics_cache.get("prometheus")
+            if prometheus_data is None:
+                if PROMETHEUS_MULTIPROC_DIR:
+                    # Aggregate every worker's samples, not just the one serving this scrape
+                    prometheus_data = metrics_collector.export_prometheus_multiprocess()
+                else:
+                    prometheus_data = metrics_collector.export_prometheus_format().encode()
+                _metrics_cache.set("prometheus", prometheus_data)
+            return Response(content=prometheus_data, headers={"Content-Type": CONTENT_TYPE_LATEST})
 
         # JSON format
-        if metric_names:
-            # Get specific metrics
-            summaries = {}
-            for name in metric_names:
-                summary = metrics_collector.get_metric_summary(name, time_window)
-                if summary:
-                    summaries[name] = summary
-        else:
-            # Get all metrics
-            summaries = metrics_collector.get_all_metrics_summaries(time_window)
+        cache_key = ("json", time_window_hours, tuple(sorted(metric_names or ())))
+        summaries = _metrics_cache.get(cache_key)
+        if summaries is None:
+            if metric_names:
+                # Get specific metrics
+                summaries = metrics_collector.get_metric_summaries(metric_names, time_window)
+            else:
+                # Get all metrics
+                summaries = metrics_collector.get_all_metrics_summaries(time_window)
+            _metrics_cache.set(cache_key, summaries)
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.iso(),
             "time_window_hours": time_window_hours,
             "metrics": summaries
         }
@@ -66,7 +175,7 @@ async def get_metrics(
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics")
 
 
-@router.get("/metrics/llm", response_model=Dict[str, Any])
+@router.get("/metrics/llm")
 async def get_llm_metrics(
     time_window_hours: Optional[int] = Query(1, ge=1, le=24),
     model: Optional[str] = Query(None, description="Filter by model name")
@@ -85,28 +194,11 @@ async def get_llm_metrics(
         metrics_collector = get_metrics_collector()
         time_window = timedelta(hours=time_window_hours)
 
-        llm_metrics = [
-            "llm_requests_total",
-            "llm_request_duration_seconds",
-            "llm_tokens_used_total"
-        ]
-
-        summaries = {}
-        for metric_name in llm_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, time_window)
-            if summary:
-                summaries[metric_name] = summary
-
-        # Filter by model if specified
-        if model:
-            filtered_summaries = {}
-            for metric_name, summary in summaries.items():
-                # This would require more sophisticated filtering in a real implementation
-                filtered_summaries[metric_name] = summary
-            summaries = filtered_summaries
+        # Summaries are not broken down by label yet, so the model filter is only echoed back
+        summaries = metrics_collector.get_metric_summaries(LLM_METRICS, time_window)
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.iso(),
             "time_window_hours": time_window_hours,
             "model_filter": model,
             "metrics": summaries
@@ -117,7 +209,7 @@ async def get_llm_metrics(
         raise HTTPException(status_code=500, detail="Failed to retrieve LLM metrics")
 
 
-@router.get("/metrics/nlu", response_model=Dict[str, Any])
+@router.get("/metrics/nlu")
 async def get_nlu_metrics(
     time_window_hours: Optional[int] = Query(1, ge=1, le=24)
 ):
@@ -134,24 +226,10 @@ async def get_nlu_metrics(
         metrics_collector = get_metrics_collector()
         time_window = timedelta(hours=time_window_hours)
 
-        nlu_metrics = [
-            "nlu_intent_classification_duration_seconds",
-            "nlu_intent_confidence",
-            "nlu_intent_classification_accuracy",
-            "nlu_entity_extraction_duration_seconds",
-            "nlu_entities_found_count",
-            "nlu_sentiment_analysis_duration_seconds",
-            "nlu_sentiment_confidence"
-        ]
-
-        summaries = {}
-        for metric_name in nlu_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, time_window)
-            if summary:
-                summaries[metric_name] = summary
+        summaries = metrics_collector.get_metric_summaries(NLU_METRICS, time_window)
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.iso(),
             "time_window_hours": time_window_hours,
             "metrics": summaries
         }
@@ -161,7 +239,7 @@ async def get_nlu_metrics(
         raise HTTPException(status_code=500, detail="Failed to retrieve NLU metrics")
 
 
-@router.get("/metrics/dialogue", response_model=Dict[str, Any])
+@router.get("/metrics/dialogue")
 async def get_dialogue_metrics(
     time_window_hours: Optional[int] = Query(1, ge=1, le=24)
 ):
@@ -178,20 +256,10 @@ async def get_dialogue_metrics(
         metrics_collector = get_metrics_collector()
         time_window = timedelta(hours=time_window_hours)
 
-        dialogue_metrics = [
-            "dialogue_state_transitions_total",
-            "dialogue_transition_confidence",
-            "conversation_quality_score"
-        ]
-
-        summaries = {}
-        for metric_name in dialogue_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, time_window)
-            if summary:
-                summaries[metric_name] = summary
+        summaries = metrics_collector.get_metric_summaries(DIALOGUE_METRICS, time_window)
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.iso(),
             "time_window_hours": time_window_hours,
             "metrics": summaries
         }
@@ -201,7 +269,7 @@ async def get_dialogue_metrics(
         raise HTTPException(status_code=500, detail="Failed to retrieve dialogue metrics")
 
 
-@router.get("/metrics/system", response_model=Dict[str, Any])
+@router.get("/metrics/system")
 async def get_system_metrics():
     """
     Get current system metrics.
@@ -210,36 +278,13 @@ async def get_system_metrics():
         Current system performance metrics
     """
     try:
-        performance_monitor = get_performance_monitor()
         metrics_collector = get_metrics_collector()
 
-        # Collect fresh system metrics
-        await performance_monitor.collect_system_metrics()
-
-        system_metrics = [
-            "system_cpu_usage_percent",
-            "system_memory_usage_percent",
-            "system_memory_used_bytes",
-            "system_memory_available_bytes",
-            "system_disk_usage_percent",
-            "system_disk_used_bytes",
-            "system_disk_free_bytes",
-            "process_memory_rss_bytes",
-            "process_memory_vms_bytes",
-            "process_cpu_percent",
-            "process_num_threads",
-            "active_connections",
-            "application_uptime_seconds"
-        ]
-
-        summaries = {}
-        for metric_name in system_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, timedelta(minutes=5))
-            if summary:
-                summaries[metric_name] = summary
+        # System gauges are refreshed by metrics_collection_task
+        summaries = metrics_collector.get_metric_summaries(SYSTEM_METRICS, FIVE_MINUTES)
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": clock.iso(),
             "metrics": summaries
         }
 
@@ -248,7 +293,7 @@ async def get_system_metrics():
         raise HTTPException(status_code=500, detail="Failed to retrieve system metrics")
 
 
-@router.get("/metrics/overview", response_model=Dict[str, Any])
+@router.get("/metrics/overview")
 async def get_metrics_overview():
     """
     Get metrics overview dashboard data.
@@ -258,63 +303,26 @@ async def get_metrics_overview():
     """
     try:
         metrics_collector = get_metrics_collector()
-        performance_monitor = get_performance_monitor()
-
-        # Collect fresh metrics
-        await performance_monitor.collect_system_metrics()
-        await performance_monitor.collect_application_metrics()
 
-        # Get key metrics for different time windows
-        time_windows = {
-            "last_5_minutes": timedelta(minutes=5),
-            "last_hour": timedelta(hours=1),
-            "last_24_hours": timedelta(hours=24)
-        }
+        # System and application gauges are refreshed by metrics_collection_task;
+        # the three windows are independent, so summarize them concurrently off the event loop
+        system_summaries, app_summaries, service_summaries = await asyncio.gather(
+            metrics_collector.get_metric_summaries_async(OVERVIEW_SYSTEM_METRICS, FIVE_MINUTES),
+            metrics_collector.get_metric_summaries_async(OVERVIEW_APP_METRICS, ONE_HOUR),
+            metrics_collector.get_metric_summaries_async(OVERVIEW_SERVICE_METRICS, ONE_DAY)
+        )
 
         overview = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "system": {},
-            "application": {},
-            "services": {}
+            "timestamp": clock.iso(),
+            "system": {
+                metric_name: summary["current"]
+                for metric_name, summary in system_summaries.items()
+                if "current" in summary
+            },
+            "application": app_summaries,
+            "services": service_summaries
         }
 
-        # System metrics (current)
-        system_metrics = [
-            "system_cpu_usage_percent",
-            "system_memory_usage_percent",
-            "system_disk_usage_percent"
-        ]
-
-        for metric_name in system_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, timedelta(minutes=5))
-            if summary and "current" in summary:
-                overview["system"][metric_name] = summary["current"]
-
-        # Application metrics (last hour)
-        app_metrics = [
-            "http_requests_total",
-            "http_request_duration_seconds",
-            "active_connections"
-        ]
-
-        for metric_name in app_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, timedelta(hours=1))
-            if summary:
-                overview["application"][metric_name] = summary
-
-        # Service metrics (last 24 hours)
-        service_metrics = [
-            "llm_requests_total",
-            "llm_request_duration_seconds",
-            "nlu_intent_classification_accuracy",
-            "conversation_quality_score"
-        ]
-
-        for metric_name in service_metrics:
-            summary = metrics_collector.get_metric_summary(metric_name, timedelta(hours=24))
-            if summary:
-                overview["services"][metric_name] = summary
-
         return overview
 
     except Exception as e:
@@ -322,7 +330,7 @@ async def get_metrics_overview():
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics overview")
 
 
-@router.get("/metrics/alerts", response_model=Dict[str, Any])
+@router.get("/metrics/alerts")
 async def get_metrics_alerts():
     """
     Get metrics-based alerts.
@@ -332,59 +340,31 @@ async def get_metrics_alerts():
     """
     try:
         metrics_collector = get_metrics_collector()
-        performance_monitor = get_performance_monitor()
-
-        # Collect fresh metrics
-        await performance_monitor.collect_system_metrics()
-
-        alerts = []
+        now_iso = clock.iso()
 
-        # Define alert thresholds
-        alert_thresholds = {
-            "system_cpu_usage_percent": {"warning": 80, "critical": 90},
-            "system_memory_usage_percent": {"warning": 80, "critical": 90},
-            "system_disk_usage_percent": {"warning": 85, "critical": 95},
-            "http_request_duration_seconds": {"warning": 2.0, "critical": 5.0},
-            "llm_request_duration_seconds": {"warning": 10.0, "critical": 20.0},
-            "conversation_quality_score": {"warning": 0.6, "critical": 0.4}
-        }
+        # System gauges are refreshed by metrics_collection_task
+        summaries = metrics_collector.get_metric_summaries(ALERT_THRESHOLDS, FIVE_MINUTES)
 
         # Check thresholds
-        for metric_name, thresholds in alert_thresholds.items():
-            summary = metrics_collector.get_metric_summary(metric_name, timedelta(minutes=5))
-            if not summary:
+        alerts = []
+        for metric_name, summary in summaries.items():
+            current_value = _current_value(summary)
+            breached = _breached_threshold(metric_name, current_value) if current_value is not None else None
+            if breached is None:
                 continue
 
-            current_value = None
-            if "current" in summary:
-                current_value = summary["current"]
-            elif "mean" in summary:
-                current_value = summary["mean"]
-            elif "latest" in summary:
-                current_value = summary["latest"]
-
-            if current_value is not None:
-                if current_value >= thresholds["critical"]:
-                    alerts.append({
-                        "metric": metric_name,
-                        "severity": "critical",
-                        "current_value": current_value,
-                        "threshold": thresholds["critical"],
-                        "message": f"Critical: {metric_name} is {current_value:.2f} (threshold: {thresholds['critical']})",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                elif current_value >= thresholds["warning"]:
-                    alerts.append({
-                        "metric": metric_name,
-                        "severity": "warning",
-                        "current_value": current_value,
-                        "threshold": thresholds["warning"],
-                        "message": f"Warning: {metric_name} is {current_value:.2f} (threshold: {thresholds['warning']})",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+            severity, threshold = breached
+            alerts.append({
+                "metric": metric_name,
+                "severity": severity,
+                "current_value": current_value,
+                "threshold": threshold,
+                "message": f"{severity.capitalize()}: {metric_name} is {current_value:.2f} (threshold: {threshold})",
+                "timestamp": now_iso
+            })
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "active_alerts": len(alerts),
             "alerts": alerts
         }
@@ -394,11 +374,11 @@ async def get_metrics_alerts():
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics alerts")
 
 
-@router.post("/metrics/custom", response_model=Dict[str, Any])
+@router.post("/metrics/custom")
 async def record_custom_metric(
     metric_name: str,
     metric_value: float,
-    metric_type: str = Query("gauge", regex="^(counter|gauge|histogram|timer)$"),
+    metric_type: MetricType = Query(MetricType.GAUGE),
     labels: Optional[Dict[str, str]] = None
 ):
     """
@@ -416,22 +396,22 @@ async def record_custom_metric(
     try:
         metrics_collector = get_metrics_collector()
 
-        if metric_type == "counter":
+        if metric_type is MetricType.COUNTER:
             metrics_collector.increment_counter(metric_name, metric_value, labels)
-        elif metric_type == "gauge":
+        elif metric_type is MetricType.GAUGE:
             metrics_collector.set_gauge(metric_name, metric_value, labels)
-        elif metric_type == "histogram":
+        elif metric_type is MetricType.HISTOGRAM:
             metrics_collector.record_histogram(metric_name, metric_value, labels)
-        elif metric_type == "timer":
+        elif metric_type is MetricType.TIMER:
             metrics_collector.record_timer(metric_name, metric_value, labels)
 
         return {
             "message": f"Metric {metric_name} recorded successfully",
             "metric_name": metric_name,
             "metric_value": metric_value,
-            "metric_type": metric_type,
+            "metric_type": metric_type.value,
             "labels": labels or {},
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": clock.iso()
         }
 
     except Exception as e:
@@ -3,17 +3,23 @@ API monitoring and alerting endpoints.
 """
 
 import asyncio
+import bisect
+import heapq
+import itertools
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import Counter, deque
+from typing import Deque, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
 from loguru import logger
 
-from app.db.session import get_db
 from app.core.config import settings
+from app.utils.compat import DATACLASS_SLOTS
 
 
 class AlertSeverity(Enum):
@@ -43,9 +49,9 @@ class AlertType(Enum):
     SECURITY = "security"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Alert:
-    """Alert data structure."""
+    """Alert data structure (slotted: up to max_history instances are retained)."""
     id: str
     type: AlertType
     severity: AlertSeverity
@@ -64,16 +70,21 @@ class Alert:
             self.metadata = {}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        data = asdict(self)
-        data['type'] = self.type.value
-        data['severity'] = self.severity.value
-        data['status'] = self.status.value
-        if self.timestamp:
-            data['timestamp'] = self.timestamp.isoformat()
-        if self.resolved_at:
-            data['resolved_at'] = self.resolved_at.isoformat()
-        return data
+        """Convert to dictionary (metadata is shared rather than deep-copied)."""
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "severity": self.severity.value,
+            "status": self.status.value,
+            "title": self.title,
+            "description": self.description,
+            "source": self.source,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "metadata": self.metadata,
+            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "resolved_by": self.resolved_by,
+            "suppression_duration": self.suppression_duration
+        }
 
 
 class AlertRule(BaseModel):
@@ -94,19 +105,35 @@ class AlertManager:
 
     def __init__(self):
         self.active_alerts: Dict[str, Alert] = {}
-        self.alert_history: List[Alert] = []
-        self.alert_rules: Dict[str, AlertRule] = {}
         self.max_history = 10000
-
-    def create_alert(self,
-                    type: AlertType,
-                    severity: AlertSeverity,
-                    title: str,
-                    description: str,
-                    source: str,
-                    metadata: Dict[str, Any] = None) -> Alert:
+        self.alert_history: Deque[Alert] = deque(maxlen=self.max_history)
+        # Creation times parallel to alert_history (chronological) for bisecting time windows;
+        # a list so bisect's index lookups are O(1)
+        self._history_times: List[datetime] = []
+        self.alert_rules: Dict[str, AlertRule] = {}
+        self._id_index: Dict[str, str] = {}  # alert id -> active_alerts key
+        self._id_seq = itertools.count(1)  # with a random suffix, keeps same-second ids unique
+        # Running breakdowns of active_alerts and creation times for the statistics view
+        self._severity_counts: Counter = Counter()
+        self._type_counts: Counter = Counter()
+        self._recent_alert_times: Deque[datetime] = deque(maxlen=self.max_history)
+        # Heap of (monotonic due time, alert id, resolved_by) drained by a single resolver task
+        self._pending_resolve: List[Tuple[float, str, str]] = []
+        self._resolve_wakeup: Optional[asyncio.Event] = None
+        self._resolve_task: Optional[asyncio.Task] = None
+        # Guards alert mutations; created on first use so it binds to the serving loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def create_alert(self,
+                           type: AlertType,
+                           severity: AlertSeverity,
+                           title: str,
+                           description: str,
+                           source: str,
+                           metadata: Dict[str, Any] = None) -> Alert:
         """Create a new alert."""
-        alert_id = f"{type.value}_{source}_{int(datetime.utcnow().timestamp())}"
+        now = datetime.utcnow()
+        alert_id = f"{type.value}_{source}_{next(self._id_seq)}_{secrets.token_hex(4)}"
 
         alert = Alert(
             id=alert_id,
@@ -116,56 +143,119 @@ class AlertManager:
             title=title,
             description=description,
             source=source,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             metadata=metadata or {}
         )
 
-        # Check for existing similar alert
-        existing_key = f"{type.value}_{source}"
-        if existing_key in self.active_alerts:
-            existing_alert = self.active_alerts[existing_key]
-            if existing_alert.status == AlertStatus.ACTIVE:
-                logger.info(f"Similar alert already active: {existing_alert.id}")
-                return existing_alert
-
-        self.active_alerts[existing_key] = alert
-        self.alert_history.append(alert)
-
-        # Cleanup old history
-        if len(self.alert_history) > self.max_history:
-            self.alert_history = self.alert_history[-self.max_history:]
-
-        logger.warning(f"Alert created: {alert.id} - {title}")
-        return alert
-
-    def resolve_alert(self, alert_id: str, resolved_by: str = "system") -> bool:
+        async with self._get_lock():
+            # Check for existing similar alert
+            existing_key = f"{type.value}_{source}"
+            if existing_key in self.active_alerts:
+                existing_alert = self.active_alerts[existing_key]
+                if existing_alert.status == AlertStatus.ACTIVE:
+                    logger.info(f"Similar alert already active: {existing_alert.id}")
+                    return existing_alert
+                # A suppressed alert is replaced by the new one
+                self._id_index.pop(existing_alert.id, None)
+                self._uncount(existing_alert)
+
+            self.active_alerts[existing_key] = alert
+            self._id_index[alert.id] = existing_key
+            self._severity_counts[alert.severity.value] += 1
+            self._type_counts[alert.type.value] += 1
+            self._recent_alert_times.append(now)
+            self.alert_history.append(alert)
+            self._history_times.append(now)
+            if len(self._history_times) > self.max_history:
+                # alert_history dropped its oldest entry; drop the matching time
+                del self._history_times[0]
+
+            logger.warning(f"Alert created: {alert.id} - {title}")
+            return alert
+
+    async def resolve_alert(self, alert_id: str, resolved_by: str = "system") -> bool:
         """Resolve an alert."""
-        # Find alert in active alerts
-        for key, alert in self.active_alerts.items():
-            if alert.id == alert_id and alert.status == AlertStatus.ACTIVE:
-                alert.status = AlertStatus.RESOLVED
-                alert.resolved_at = datetime.utcnow()
-                alert.resolved_by = resolved_by
-
-                # Move to history (already there)
-                del self.active_alerts[key]
-
-                logger.info(f"Alert resolved: {alert_id} by {resolved_by}")
-                return True
-
-        return False
-
-    def suppress_alert(self, alert_id: str, duration_minutes: int = 60) -> bool:
+        async with self._get_lock():
+            key = self._id_index.get(alert_id)
+            if key is None:
+                return False
+
+            alert = self.active_alerts.get(key)
+            if alert is None or alert.status != AlertStatus.ACTIVE:
+                return False
+
+            alert.status = AlertStatus.RESOLVED
+            alert.resolved_at = datetime.utcnow()
+            alert.resolved_by = resolved_by
+
+            # Move to history (already there)
+            del self.active_alerts[key]
+            del self._id_index[alert_id]
+            self._uncount(alert)
+
+            logger.info(f"Alert resolved: {alert_id} by {resolved_by}")
+            return True
+
+    def schedule_resolve(self, alert_id: str, delay_seconds: float, resolved_by: str = "auto_resolve"):
+        """Resolve an alert after a delay without parking a task per alert."""
+        entry = (time.monotonic() + delay_seconds, alert_id, resolved_by)
+        heapq.heappush(self._pending_resolve, entry)
+
+        task = self._resolve_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._resolve_wakeup = asyncio.Event()
+            self._resolve_task = asyncio.create_task(self._run_scheduled_resolves())
+        elif self._pending_resolve[0] is entry:
+            # New earliest deadline; cut the resolver's current sleep short
+            self._resolve_wakeup.set()
+
+    async def _run_scheduled_resolves(self):
+        """Sleep until the earliest scheduled resolve is due, then resolve everything due."""
+        while self._pending_resolve:
+            delay = self._pending_resolve[0][0] - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._resolve_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._resolve_wakeup.clear()
+                continue
+
+            _, alert_id, resolved_by = heapq.heappop(self._pending_resolve)
+            try:
+                await self.resolve_alert(alert_id, resolved_by)
+            except Exception as e:
+                logger.error(f"Scheduled resolve of alert {alert_id} failed: {e}")
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Lock serializing mutations of active_alerts, the index and the breakdowns."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _uncount(self, alert: Alert):
+        """Remove an alert leaving active_alerts from the running breakdowns."""
+        self._severity_counts[alert.severity.value] -= 1
+        if not self._severity_counts[alert.severity.value]:
+            del self._severity_counts[alert.severity.value]
+        self._type_counts[alert.type.value] -= 1
+        if not self._type_counts[alert.type.value]:
+            del self._type_counts[alert.type.value]
+
+    async def suppress_alert(self, alert_id: str, duration_minutes: int = 60) -> bool:
         """Suppress an alert for a duration."""
-        for key, alert in self.active_alerts.items():
-            if alert.id == alert_id and alert.status == AlertStatus.ACTIVE:
-                alert.status = AlertStatus.SUPPRESSED
-                alert.suppression_duration = duration_minutes
+        async with self._get_lock():
+            key = self._id_index.get(alert_id)
+            alert = self.active_alerts.get(key) if key is not None else None
+            if alert is None or alert.status != AlertStatus.ACTIVE:
+                return False
 
-                logger.info(f"Alert suppressed: {alert_id} for {duration_minutes} minutes")
-                return True
+            # Suppressed alerts stay in active_alerts (and the index) until replaced
+            alert.status = AlertStatus.SUPPRESSED
+            alert.suppression_duration = duration_minutes
 
-        return False
+            logger.info(f"Alert suppressed: {alert_id} for {duration_minutes} minutes")
+            return True
 
     def get_active_alerts(self, severity: Optional[AlertSeverity] = None) -> List[Alert]:
         """Get active alerts, optionally filtered by severity."""
@@ -180,21 +270,18 @@ class AlertManager:
         """Get alert history."""
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
-        filtered_alerts = [
-            alert for alert in self.alert_history
-            if alert.timestamp >= cutoff_time
-        ]
+        # History is appended in creation order, so the window is a suffix; walk it newest first
+        in_window = len(self._history_times) - bisect.bisect_left(self._history_times, cutoff_time)
+        return list(itertools.islice(reversed(self.alert_history), min(limit, in_window)))
 
-        return sorted(filtered_alerts, key=lambda x: x.timestamp, reverse=True)[:limit]
-
-    def check_system_health(self, metrics: Dict[str, Any]) -> List[Alert]:
+    async def check_system_health(self, metrics: Dict[str, Any]) -> List[Alert]:
         """Check system metrics and create alerts if needed."""
         alerts = []
 
         # CPU usage alert
         cpu_usage = metrics.get("cpu_usage_percent", 0)
         if cpu_usage > 90:
-            alerts.append(self.create_alert(
+            alerts.append(await self.create_alert(
                 type=AlertType.SYSTEM,
                 severity=AlertSeverity.HIGH if cpu_usage > 95 else AlertSeverity.MEDIUM,
                 title="High CPU Usage",
@@ -206,7 +293,7 @@ class AlertManager:
         # Memory usage alert
         memory_usage = metrics.get("memory_usage_percent", 0)
         if memory_usage > 85:
-            alerts.append(self.create_alert(
+            alerts.append(await self.create_alert(
                 type=AlertType.SYSTEM,
                 severity=AlertSeverity.HIGH if memory_usage > 95 else AlertSeverity.MEDIUM,
                 title="High Memory Usage",
@@ -218,7 +305,7 @@ class AlertManager:
         # Disk usage alert
         disk_usage = metrics.get("disk_usage_percent", 0)
         if disk_usage > 80:
-            alerts.append(self.create_alert(
+            alerts.append(await self.create_alert(
                 type=AlertType.SYSTEM,
                 severity=AlertSeverity.CRITICAL if disk_usage > 95 else AlertSeverity.HIGH,
                 title="High Disk Usage",
@@ -229,35 +316,31 @@ class AlertManager:
 
         return alerts
 
-    def cleanup_old_alerts(self):
+    async def cleanup_old_alerts(self):
         """Clean up old resolved alerts."""
         cutoff_time = datetime.utcnow() - timedelta(days=7)
 
-        # Remove resolved alerts older than 7 days from history
-        self.alert_history = [
-            alert for alert in self.alert_history
-            if not (alert.status == AlertStatus.RESOLVED and
-                   alert.resolved_at and alert.resolved_at < cutoff_time)
-        ]
+        async with self._get_lock():
+            # Remove resolved alerts older than 7 days from history
+            kept = [
+                alert for alert in self.alert_history
+                if not (alert.status == AlertStatus.RESOLVED and
+                        alert.resolved_at and alert.resolved_at < cutoff_time)
+            ]
+            self.alert_history = deque(kept, maxlen=self.max_history)
+            self._history_times = [alert.timestamp for alert in kept]
 
     def get_alert_statistics(self) -> Dict[str, Any]:
         """Get alert statistics."""
-        active_alerts = self.get_active_alerts()
-
-        severity_counts = {}
-        type_counts = {}
-
-        for alert in active_alerts:
-            severity_counts[alert.severity.value] = severity_counts.get(alert.severity.value, 0) + 1
-            type_counts[alert.type.value] = type_counts.get(alert.type.value, 0) + 1
-
-        recent_history = self.get_alert_history(hours=24)
+        cutoff_time = datetime.utcnow() - timedelta(hours=24)
+        while self._recent_alert_times and self._recent_alert_times[0] < cutoff_time:
+            self._recent_alert_times.popleft()
 
         return {
-            "active_alerts": len(active_alerts),
-            "severity_breakdown": severity_counts,
-            "type_breakdown": type_counts,
-            "alerts_last_24h": len(recent_history),
+            "active_alerts": len(self.active_alerts),
+            "severity_breakdown": dict(self._severity_counts),
+            "type_breakdown": dict(self._type_counts),
+            "alerts_last_24h": len(self._recent_alert_times),
             "total_rules": len(self.alert_rules),
             "enabled_rules": len([r for r in self.alert_rules.values() if r.enabled])
         }
@@ -266,27 +349,27 @@ class AlertManager:
 # Global alert manager
 alert_manager = AlertManager()
 
+# Enum lookups for query parameters
+_SEVERITY_BY_VALUE: Dict[str, AlertSeverity] = {s.value: s for s in AlertSeverity}
+_TYPE_BY_VALUE: Dict[str, AlertType] = {t.value: t for t in AlertType}
+
 
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/alerts", response_model=Dict[str, Any])
+@router.get("/alerts")
 async def get_alerts(
     severity: Optional[str] = Query(None, description="Filter by severity"),
     status: Optional[str] = Query("active", description="Filter by status"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of alerts"),
-    db: Session = Depends(get_db)
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of alerts")
 ):
     """Get alerts with optional filtering."""
     try:
         # Parse severity filter
-        severity_filter = None
-        if severity:
-            try:
-                severity_filter = AlertSeverity(severity)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid severity value")
+        severity_filter = _SEVERITY_BY_VALUE.get(severity) if severity else None
+        if severity and severity_filter is None:
+            raise HTTPException(status_code=400, detail="Invalid severity value")
 
         if status == "active":
             alerts = alert_manager.get_active_alerts(severity_filter)
@@ -303,6 +386,8 @@ async def get_alerts(
             }
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting alerts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -311,12 +396,11 @@ async def get_alerts(
 @router.post("/alerts/{alert_id}/resolve")
 async def resolve_alert(
     alert_id: str,
-    resolved_by: str = "user",
-    db: Session = Depends(get_db)
+    resolved_by: str = "user"
 ):
     """Resolve an alert."""
     try:
-        success = alert_manager.resolve_alert(alert_id, resolved_by)
+        success = await alert_manager.resolve_alert(alert_id, resolved_by)
 
         if not success:
             raise HTTPException(status_code=404, detail="Alert not found or already resolved")
@@ -325,7 +409,7 @@ async def resolve_alert(
             "message": "Alert resolved successfully",
             "alert_id": alert_id,
             "resolved_by": resolved_by,
-            "resolved_at": datetime.utcnow().isoformat()
+            "resolved_at": datetime.utcnow()
         }
 
     except HTTPException:
@@ -338,12 +422,11 @@ async def resolve_alert(
 @router.post("/alerts/{alert_id}/suppress")
 async def suppress_alert(
     alert_id: str,
-    duration_minutes: int = Query(60, ge=1, le=1440, description="Suppression duration in minutes"),
-    db: Session = Depends(get_db)
+    duration_minutes: int = Query(60, ge=1, le=1440, description="Suppression duration in minutes")
 ):
     """Suppress an alert for a duration."""
     try:
-        success = alert_manager.suppress_alert(alert_id, duration_minutes)
+        success = await alert_manager.suppress_alert(alert_id, duration_minutes)
 
         if not success:
             raise HTTPException(status_code=404, detail="Alert not found or already resolved")
@@ -352,7 +435,7 @@ async def suppress_alert(
             "message": "Alert suppressed successfully",
             "alert_id": alert_id,
             "duration_minutes": duration_minutes,
-            "suppressed_until": (datetime.utcnow() + timedelta(minutes=duration_minutes)).isoformat()
+            "suppressed_until": datetime.utcnow() + timedelta(minutes=duration_minutes)
         }
 
     except HTTPException:
@@ -362,8 +445,8 @@ async def suppress_alert(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/alerts/statistics", response_model=Dict[str, Any])
-async def get_alert_statistics(db: Session = Depends(get_db)):
+@router.get("/alerts/statistics")
+async def get_alert_statistics():
     """Get alert statistics."""
     try:
         return alert_manager.get_alert_statistics()
@@ -375,29 +458,29 @@ async def get_alert_statistics(db: Session = Depends(get_db)):
 
 @router.post("/alerts/test")
 async def create_test_alert(
-    background_tasks: BackgroundTasks,
     type: str = Query("system", description="Alert type"),
-    severity: str = Query("medium", description="Alert severity"),
-    db: Session = Depends(get_db)
+    severity: str = Query("medium", description="Alert severity")
 ):
     """Create a test alert for monitoring purposes."""
     try:
-        alert_type = AlertType(type)
-        alert_severity = AlertSeverity(severity)
-
-        alert = alert_manager.create_alert(
+        alert_type = _TYPE_BY_VALUE.get(type)
+        if alert_type is None:
+            raise HTTPException(status_code=400, detail=f"'{type}' is not a valid AlertType")
+        alert_severity = _SEVERITY_BY_VALUE.get(severity)
+        if alert_severity is None:
+            raise HTTPException(status_code=400, detail=f"'{severity}' is not a valid AlertSeverity")
+
+        alert = await alert_manager.create_alert(
             type=alert_type,
             severity=alert_severity,
             title="Test Alert",
             description="This is a test alert created via API",
             source="api_test",
-            metadata={"test": True, "created_at": datetime.utcnow().isoformat()}
+            metadata={"test": True, "created_at": datetime.utcnow()}
         )
 
         # Schedule automatic resolution after 5 minutes
-        background_tasks.add_task(
-            lambda: asyncio.sleep(300) or alert_manager.resolve_alert(alert.id, "auto_resolve")
-        )
+        alert_manager.schedule_resolve(alert.id, 300)
 
         return {
             "message": "Test alert created successfully",
@@ -405,8 +488,8 @@ async def create_test_alert(
             "auto_resolve_in": "5 minutes"
         }
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error creating test alert: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,19 +2,93 @@
 API analytics and reporting endpoints.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-
+import asyncio
+import heapq
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+
+import numpy as np
 from fastapi import APIRouter, Query, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 from sqlalchemy.orm import Session
 
-from app.core.api.monitoring import get_api_monitor
+from app.core.api.monitoring import (
+    MICROS_PER_HOUR,
+    ClientAggregate,
+    RequestArrays,
+    get_api_monitor,
+    to_epoch_micros,
+)
 from app.services.conversation_analytics import conversation_analytics_service
 from app.db.session import get_db
+from app.utils.ttl_cache import TTLCache
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"], default_response_class=ORJSONResponse)
+
+MICROS_PER_DAY = 24 * MICROS_PER_HOUR
+
+# Seconds a computed report is reused across dashboard polls
+ANALYTICS_CACHE_TTL = 30.0
+
+_analytics_cache = TTLCache(ttl=ANALYTICS_CACHE_TTL, max_entries=64)
+
+# days -> (array snapshot, PeriodSnapshot filtered from it)
+_period_cache = TTLCache(ttl=ANALYTICS_CACHE_TTL, max_entries=16)
+
+
+@dataclass
+class PeriodSnapshot:
+    """Tracked requests from the last `days` days, filtered once for the array-based reports."""
+    days: int
+    now: datetime
+    requests: RequestArrays
+
+
+def _period_snapshot(days: int) -> PeriodSnapshot:
+    """Snapshot of the last `days` days, reused until the tracker records another request."""
+    arrays = get_api_monitor().request_tracker.to_arrays()
+    cached = _period_cache.get(days)
+    if cached is not None and cached[0] is arrays:
+        return cached[1]
+
+    now = datetime.utcnow()
+    snapshot = PeriodSnapshot(days=days, now=now, requests=arrays.select(arrays.since(now - timedelta(days=days))))
+    _period_cache.set(days, (arrays, snapshot))
+    return snapshot
+
+
+async def _cached_report(kind: str, days: int, no_cache: bool = False) -> Any:
+    """
+    Return the report for (kind, days) from the cache, computing it on a miss or when no_cache is set.
+
+    Array-based reports crunch a period snapshot taken here, on the event loop
+    where requests are recorded, in a worker thread so other requests keep
+    being served. Usage and client analytics only merge hourly buckets whose
+    counters are live, so they stay on the loop.
+    """
+    key = (kind, days)
+    if not no_cache:
+        report = _analytics_cache.get(key)
+        if report is not None:
+            return report
+
+    compute, uses_snapshot = _REPORTS[kind]
+    if uses_snapshot:
+        report = await run_in_threadpool(compute, _period_snapshot(days))
+    else:
+        report = compute(days)
+    _analytics_cache.set(key, report)
+    return report
+
 
-router = APIRouter(prefix="/analytics", tags=["Analytics"])
+def _day_offsets(timestamps: np.ndarray, now: datetime) -> np.ndarray:
+    """Whole UTC days between each epoch-microsecond timestamp and now (0 = today)."""
+    return to_epoch_micros(now) // MICROS_PER_DAY - timestamps // MICROS_PER_DAY
 
 
 class UsageAnalytics(BaseModel):
@@ -52,235 +126,255 @@ class ClientAnalytics(BaseModel):
     quota_utilization: float
 
 
-@router.get("/usage", response_model=UsageAnalytics)
-async def get_usage_analytics(days: int = Query(7, ge=1, le=90, description="Analysis period in days")):
-    """Get usage analytics for the specified period."""
-    try:
-        monitor = get_api_monitor()
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
+def _compute_usage_analytics(days: int) -> Dict[str, Any]:
+    """
+    Usage analytics over the last `days` days of tracked requests.
+
+    Summed from the tracker's hourly aggregates, so the window is widened to
+    the start of its first hour.
+    """
+    monitor = get_api_monitor()
+    now = datetime.utcnow()
+    tracker = monitor.request_tracker
+    endpoint_labels = tracker.endpoint_index.labels
+    buckets = tracker.hour_buckets(now - timedelta(days=days))
+
+    # Merge the hourly buckets
+    total_requests = 0
+    users = set()
+    clients = set()
+    endpoint_counts = Counter()
+    hour_counts = [0] * 24
+    day_totals = [0] * days
+    day_errors = [0] * days
+    today_hour = to_epoch_micros(now) // MICROS_PER_HOUR
+    for hour, bucket in buckets:
+        total_requests += bucket.count
+        users.update(bucket.users)
+        clients.update(bucket.clients)
+        endpoint_counts.update(bucket.endpoints)
+        hour_counts[hour % 24] += bucket.count
+        offset = today_hour // 24 - hour // 24
+        if 0 <= offset < days:
+            day_totals[offset] += bucket.count
+            day_errors[offset] += bucket.error_count
+
+    # Calculate basic metrics
+    unique_users = len(users)
+    unique_clients = len(clients)
+    avg_requests_per_user = total_requests / max(unique_users, 1)
+
+    # Get top endpoints
+    top_endpoints = [
+        {
+            "endpoint": " ".join(endpoint_labels[endpoint_id]),
+            "count": count,
+            "percentage": (count / total_requests) * 100
+        }
+        for endpoint_id, count in endpoint_counts.most_common(10)
+    ]
 
-        # Filter requests for the period
-        period_requests = [
-            r for r in monitor.request_tracker.requests
-            if r.timestamp >= cutoff_time
-        ]
+    # Calculate usage by hour
+    usage_by_hour = {f"{hour:02d}:00": count for hour, count in enumerate(hour_counts) if count}
 
-        # Calculate basic metrics
-        total_requests = len(period_requests)
-        unique_users = len(set(r.user_id for r in period_requests if r.user_id))
-        unique_clients = len(set(r.client_id for r in period_requests if r.client_id))
-        avg_requests_per_user = total_requests / max(unique_users, 1)
+    # Calculate error trends (today first, zero for days without traffic)
+    today = now.toordinal()
+    error_trends = {
+        date.fromordinal(today - offset).isoformat():
+            (day_errors[offset] / day_totals[offset]) * 100 if day_totals[offset] else 0
+        for offset in range(days)
+    }
 
-        # Get top endpoints
-        endpoint_counts = {}
-        for request in period_requests:
-            endpoint = f"{request.method} {request.path}"
-            endpoint_counts[endpoint] = endpoint_counts.get(endpoint, 0) + 1
+    return {
+        "period_days": days,
+        "total_requests": total_requests,
+        "unique_users": unique_users,
+        "unique_clients": unique_clients,
+        "avg_requests_per_user": avg_requests_per_user,
+        "top_endpoints": top_endpoints,
+        "usage_by_hour": usage_by_hour,
+        "error_trends": error_trends
+    }
 
-        top_endpoints = [
-            {"endpoint": endpoint, "count": count, "percentage": (count / total_requests) * 100}
-            for endpoint, count in sorted(endpoint_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
 
-        # Calculate usage by hour
-        usage_by_hour = {}
-        for request in period_requests:
-            hour = request.timestamp.strftime("%H:00")
-            usage_by_hour[hour] = usage_by_hour.get(hour, 0) + 1
-
-        # Calculate error trends
-        error_trends = {}
-        for i in range(days):
-            day = (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
-            day_requests = [
-                r for r in period_requests
-                if r.timestamp.strftime("%Y-%m-%d") == day
-            ]
-            day_errors = len([r for r in day_requests if r.status_code >= 400])
-            error_rate = (day_errors / len(day_requests)) * 100 if day_requests else 0
-            error_trends[day] = error_rate
-
-        return UsageAnalytics(
-            period_days=days,
-            total_requests=total_requests,
-            unique_users=unique_users,
-            unique_clients=unique_clients,
-            avg_requests_per_user=avg_requests_per_user,
-            top_endpoints=top_endpoints,
-            usage_by_hour=usage_by_hour,
-            error_trends=error_trends
-        )
 
-    except Exception as e:
-        logger.error(f"Error generating usage analytics: {e}")
+@router.get("/usage", response_model=UsageAnalytics)
+async def get_usage_analytics(
+    days: int = Query(7, ge=1, le=90, description="Analysis period in days"),
+    no_cache: bool = Query(False, description="Recompute instead of reusing a recent report")
+):
+    """Get usage analytics for the specified period."""
+    try:
+        return await _cached_report("usage", days, no_cache)
+    except Exception:
+        logger.exception("Error generating usage analytics")
         raise HTTPException(status_code=500, detail="Failed to generate usage analytics")
 
 
-@router.get("/performance", response_model=PerformanceAnalytics)
-async def get_performance_analytics(days: int = Query(7, ge=1, le=90, description="Analysis period in days")):
-    """Get performance analytics for the specified period."""
-    try:
-        monitor = get_api_monitor()
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
+def _compute_performance_analytics(snapshot: PeriodSnapshot) -> Dict[str, Any]:
+    """Response time analytics over a period snapshot."""
+    days, now, requests = snapshot.days, snapshot.now, snapshot.requests
+    durations = requests.durations_ms
 
-        # Filter requests for the period
-        period_requests = [
-            r for r in monitor.request_tracker.requests
-            if r.timestamp >= cutoff_time
-        ]
+    if not len(durations):
+        return {
+            "period_days": days,
+            "avg_response_time_ms": 0,
+            "p95_response_time_ms": 0,
+            "p99_response_time_ms": 0,
+            "slowest_endpoints": [],
+            "performance_trends": {},
+            "cache_performance": {}
+        }
 
-        if not period_requests:
-            return PerformanceAnalytics(
-                period_days=days,
-                avg_response_time_ms=0,
-                p95_response_time_ms=0,
-                p99_response_time_ms=0,
-                slowest_endpoints=[],
-                performance_trends={},
-                cache_performance={}
-            )
-
-        # Calculate response time metrics
-        durations = [r.duration_ms for r in period_requests]
-        durations.sort()
-
-        avg_response_time_ms = sum(durations) / len(durations)
-        p95_response_time_ms = durations[int(len(durations) * 0.95)]
-        p99_response_time_ms = durations[int(len(durations) * 0.99)]
-
-        # Get slowest endpoints
-        endpoint_performance = {}
-        for request in period_requests:
-            endpoint = f"{request.method} {request.path}"
-            if endpoint not in endpoint_performance:
-                endpoint_performance[endpoint] = []
-            endpoint_performance[endpoint].append(request.duration_ms)
-
-        slowest_endpoints = []
-        for endpoint, times in endpoint_performance.items():
-            avg_time = sum(times) / len(times)
-            slowest_endpoints.append({
-                "endpoint": endpoint,
-                "avg_response_time_ms": avg_time,
-                "request_count": len(times)
-            })
-
-        slowest_endpoints.sort(key=lambda x: x["avg_response_time_ms"], reverse=True)
-        slowest_endpoints = slowest_endpoints[:10]
-
-        # Calculate performance trends
-        performance_trends = {}
-        for i in range(min(days, 30)):  # Limit to 30 days for readability
-            day = (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
-            day_requests = [
-                r for r in period_requests
-                if r.timestamp.strftime("%Y-%m-%d") == day
-            ]
-            if day_requests:
-                day_durations = [r.duration_ms for r in day_requests]
-                performance_trends[day] = [
-                    sum(day_durations) / len(day_durations),  # avg
-                    day_durations[int(len(day_durations) * 0.95)],  # p95
-                    len(day_requests)  # count
-                ]
-
-        # Cache performance
-        cache_hits = len([r for r in period_requests if r.cache_hit])
-        cache_performance = {
-            "hit_rate": (cache_hits / len(period_requests)) * 100,
-            "total_requests": len(period_requests),
-            "cache_hits": cache_hits,
-            "cache_misses": len(period_requests) - cache_hits
+    # Calculate response time metrics
+    total_requests = len(durations)
+    k95, k99 = int(total_requests * 0.95), int(total_requests * 0.99)
+    selected = np.partition(durations, [k95, k99])
+    avg_response_time_ms = float(durations.mean())
+    p95_response_time_ms = float(selected[k95])
+    p99_response_time_ms = float(selected[k99])
+
+    # Get slowest endpoints
+    endpoint_ids = requests.endpoint_ids
+    endpoint_counts = np.bincount(endpoint_ids, minlength=len(requests.endpoints))
+    endpoint_totals = np.bincount(endpoint_ids, weights=durations, minlength=len(requests.endpoints))
+    seen_ids = np.flatnonzero(endpoint_counts)
+    endpoint_avgs = endpoint_totals[seen_ids] / endpoint_counts[seen_ids]
+    slowest_endpoints = [
+        {
+            "endpoint": " ".join(requests.endpoints[seen_ids[i]]),
+            "avg_response_time_ms": float(endpoint_avgs[i]),
+            "request_count": int(endpoint_counts[seen_ids[i]])
         }
+        for i in heapq.nlargest(10, range(len(seen_ids)), key=endpoint_avgs.__getitem__)
+    ]
+
+    # Calculate performance trends, limited to 30 days for readability.
+    # Offsets within the period fit in 16 bits, where NumPy's stable sort is
+    # a linear-time radix sort rather than a comparison sort.
+    day_offsets = _day_offsets(requests.timestamps, now).astype(np.int16)
+    by_day = np.argsort(day_offsets, kind="stable")
+    day_bounds = np.searchsorted(day_offsets[by_day], np.arange(min(days, 30) + 1))
+    performance_trends = {}
+    today = now.toordinal()
+    for offset in range(min(days, 30)):
+        day_durations = durations[by_day[day_bounds[offset]:day_bounds[offset + 1]]]
+        if len(day_durations):
+            k95 = int(len(day_durations) * 0.95)
+            performance_trends[date.fromordinal(today - offset).isoformat()] = [
+                float(day_durations.mean()),  # avg
+                float(np.partition(day_durations, k95)[k95]),  # p95
+                len(day_durations)  # count
+            ]
 
-        return PerformanceAnalytics(
-            period_days=days,
-            avg_response_time_ms=avg_response_time_ms,
-            p95_response_time_ms=p95_response_time_ms,
-            p99_response_time_ms=p99_response_time_ms,
-            slowest_endpoints=slowest_endpoints,
-            performance_trends=performance_trends,
-            cache_performance=cache_performance
-        )
+    # Cache performance
+    cache_hits = int(np.count_nonzero(requests.cache_hits))
+    cache_performance = {
+        "hit_rate": (cache_hits / total_requests) * 100,
+        "total_requests": total_requests,
+        "cache_hits": cache_hits,
+        "cache_misses": total_requests - cache_hits
+    }
 
-    except Exception as e:
-        logger.error(f"Error generating performance analytics: {e}")
-        raise HTTPException(status_code=500, detail="Failed to generate performance analytics")
+    return {
+        "period_days": days,
+        "avg_response_time_ms": avg_response_time_ms,
+        "p95_response_time_ms": p95_response_time_ms,
+        "p99_response_time_ms": p99_response_time_ms,
+        "slowest_endpoints": slowest_endpoints,
+        "performance_trends": performance_trends,
+        "cache_performance": cache_performance
+    }
 
 
-@router.get("/clients", response_model=List[ClientAnalytics])
-async def get_client_analytics(days: int = Query(7, ge=1, le=90, description="Analysis period in days")):
-    """Get analytics per client."""
+
+@router.get("/performance", response_model=PerformanceAnalytics)
+async def get_performance_analytics(
+    days: int = Query(7, ge=1, le=90, description="Analysis period in days"),
+    no_cache: bool = Query(False, description="Recompute instead of reusing a recent report")
+):
+    """Get performance analytics for the specified period."""
     try:
-        monitor = get_api_monitor()
-        cutoff_time = datetime.utcnow() - timedelta(days=days)
+        return await _cached_report("performance", days, no_cache)
+    except Exception:
+        logger.exception("Error generating performance analytics")
+        raise HTTPException(status_code=500, detail="Failed to generate performance analytics")
+
 
-        # Filter requests for the period
-        period_requests = [
-            r for r in monitor.request_tracker.requests
-            if r.timestamp >= cutoff_time and r.client_id
+def _compute_client_analytics(days: int) -> List[Dict[str, Any]]:
+    """
+    Per-client analytics over the last `days` days, busiest client first.
+
+    Merged from the per-client totals in the tracker's hourly aggregates, so
+    the window is widened to the start of its first hour.
+    """
+    tracker = get_api_monitor().request_tracker
+    endpoint_labels = tracker.endpoint_index.labels
+    client_labels = tracker.client_index.labels
+
+    # Group by client
+    clients: Dict[int, ClientAggregate] = {}
+    for _, bucket in tracker.hour_buckets(datetime.utcnow() - timedelta(days=days)):
+        for client_index, client_totals in bucket.clients.items():
+            merged = clients.get(client_index)
+            if merged is None:
+                merged = clients[client_index] = ClientAggregate()
+            merged.merge(client_totals)
+
+    # Generate client analytics
+    client_analytics = []
+    for client_index, totals in clients.items():
+        total_requests = totals.count
+
+        # Get top endpoints for this client
+        top_endpoints = [
+            " ".join(endpoint_labels[endpoint_id])
+            for endpoint_id, _ in totals.endpoints.most_common(5)
         ]
 
-        # Group by client
-        client_data = {}
-        for request in period_requests:
-            client_id = request.client_id
-            if client_id not in client_data:
-                client_data[client_id] = {
-                    "requests": [],
-                    "first_seen": request.timestamp,
-                    "last_seen": request.timestamp
-                }
-
-            client_data[client_id]["requests"].append(request)
-            client_data[client_id]["last_seen"] = max(
-                client_data[client_id]["last_seen"],
-                request.timestamp
-            )
-
-        # Generate client analytics
-        client_analytics = []
-        for client_id, data in client_data.items():
-            requests = data["requests"]
-            total_requests = len(requests)
-            durations = [r.duration_ms for r in requests]
-            errors = len([r for r in requests if r.status_code >= 400])
-
-            # Get top endpoints for this client
-            endpoint_counts = {}
-            for request in requests:
-                endpoint = f"{request.method} {request.path}"
-                endpoint_counts[endpoint] = endpoint_counts.get(endpoint, 0) + 1
-
-            top_endpoints = [
-                endpoint for endpoint, count in
-                sorted(endpoint_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-            ]
+        # Get quota utilization (mock data - would come from rate limiter)
+        quota_utilization = min((total_requests / 1000) * 100, 100)  # Assume 1000 request limit
 
-            # Get quota utilization (mock data - would come from rate limiter)
-            quota_utilization = min((total_requests / 1000) * 100, 100)  # Assume 1000 request limit
+        client_analytics.append({
+            "client_id": client_labels[client_index],
+            "total_requests": total_requests,
+            "avg_response_time_ms": totals.duration_sum / total_requests,
+            "error_rate": (totals.error_count / total_requests) * 100,
+            "top_endpoints": top_endpoints,
+            "first_seen": totals.first_seen,
+            "last_seen": totals.last_seen,
+            "quota_utilization": quota_utilization
+        })
 
-            client_analytics.append(ClientAnalytics(
-                client_id=client_id,
-                total_requests=total_requests,
-                avg_response_time_ms=sum(durations) / len(durations) if durations else 0,
-                error_rate=(errors / total_requests) * 100 if total_requests > 0 else 0,
-                top_endpoints=top_endpoints,
-                first_seen=data["first_seen"],
-                last_seen=data["last_seen"],
-                quota_utilization=quota_utilization
-            ))
+    # Sort by total requests
+    client_analytics.sort(key=lambda x: x["total_requests"], reverse=True)
 
-        # Sort by total requests
-        client_analytics.sort(key=lambda x: x.total_requests, reverse=True)
+    return client_analytics
 
-        return client_analytics
 
-    except Exception as e:
-        logger.error(f"Error generating client analytics: {e}")
+
+@router.get("/clients", response_model=List[ClientAnalytics])
+async def get_client_analytics(
+    days: int = Query(7, ge=1, le=90, description="Analysis period in days"),
+    no_cache: bool = Query(False, description="Recompute instead of reusing a recent report")
+):
+    """Get analytics per client."""
+    try:
+        return await _cached_report("clients", days, no_cache)
+    except Exception:
+        logger.exception("Error generating client analytics")
         raise HTTPException(status_code=500, detail="Failed to generate client analytics")
 
 
+# kind -> (compute function, whether it takes a PeriodSnapshot instead of days)
+_REPORTS: Dict[str, Tuple[Callable[..., Any], bool]] = {
+    "usage": (_compute_usage_analytics, False),
+    "performance": (_compute_performance_analytics, True),
+    "clients": (_compute_client_analytics, False),
+}
+
+
 @router.get("/dashboard")
 async def get_dashboard_data(days: int = Query(7, ge=1, le=30, description="Analysis period in days")):
     """Get comprehensive dashboard data."""
@@ -289,15 +383,18 @@ async def get_dashboard_data(days: int = Query(7, ge=1, le=30, description="Anal
         monitor = get_api_monitor()
         dashboard_data = monitor.get_dashboard_data()
 
-        # Add additional analytics
-        usage_analytics = await get_usage_analytics(days)
-        performance_analytics = await get_performance_analytics(days)
+        # Add additional analytics; performance goes first so its threadpool
+        # work overlaps the usage merge on the loop
+        performance_analytics, usage_analytics = await asyncio.gather(
+            _cached_report("performance", days),
+            _cached_report("usage", days)
+        )
 
         return {
             "system_health": dashboard_data["system_health"],
             "real_time_metrics": dashboard_data["metrics"],
-            "usage_analytics": usage_analytics.dict(),
-            "performance_analytics": performance_analytics.dict(),
+            "usage_analytics": usage_analytics,
+            "performance_analytics": performance_analytics,
             "recent_alerts": dashboard_data["recent_alerts"],
             "active_integrations": {
                 "shopify": dashboard_data["system_health"].get("status") != "unhealthy",
@@ -306,8 +403,8 @@ async def get_dashboard_data(days: int = Query(7, ge=1, le=30, description="Anal
             }
         }
 
-    except Exception as e:
-        logger.error(f"Error generating dashboard data: {e}")
+    except Exception:
+        logger.exception("Error generating dashboard data")
         raise HTTPException(status_code=500, detail="Failed to generate dashboard data")
 
 
@@ -316,14 +413,19 @@ async def get_summary_report(days: int = Query(30, ge=1, le=90, description="Rep
     """Generate a summary report."""
     try:
         # Get analytics data
-        usage_analytics = await get_usage_analytics(days)
-        performance_analytics = await get_performance_analytics(days)
+        performance_analytics, usage_analytics = await asyncio.gather(
+            _cached_report("performance", days),
+            _cached_report("usage", days)
+        )
 
         # Calculate key metrics
-        total_requests = usage_analytics.total_requests
-        error_rate = (sum(usage_analytics.error_trends.values()) / len(usage_analytics.error_trends)) if usage_analytics.error_trends else 0
-        avg_response_time = performance_analytics.avg_response_time_ms
-        cache_hit_rate = performance_analytics.cache_performance.get("hit_rate", 0)
+        total_requests = usage_analytics["total_requests"]
+        error_rates = list(usage_analytics["error_trends"].values())
+        error_rate = (sum(error_rates) / len(error_rates)) if error_rates else 0
+        recent_error_rates = error_rates[-5:]
+        usage_by_hour = usage_analytics["usage_by_hour"]
+        avg_response_time = performance_analytics["avg_response_time_ms"]
+        cache_hit_rate = performance_analytics["cache_performance"].get("hit_rate", 0)
 
         # Determine overall health
         health_status = "healthy"
@@ -345,29 +447,29 @@ async def get_summary_report(days: int = Query(30, ge=1, le=90, description="Rep
 
         return {
             "report_period_days": days,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": datetime.utcnow(),
             "summary": {
                 "health_status": health_status,
                 "total_requests": total_requests,
-                "unique_users": usage_analytics.unique_users,
+                "unique_users": usage_analytics["unique_users"],
                 "average_error_rate": round(error_rate, 2),
                 "average_response_time_ms": round(avg_response_time, 2),
                 "cache_hit_rate": round(cache_hit_rate, 2)
             },
             "top_metrics": {
-                "busiest_endpoint": usage_analytics.top_endpoints[0] if usage_analytics.top_endpoints else None,
-                "slowest_endpoint": performance_analytics.slowest_endpoints[0] if performance_analytics.slowest_endpoints else None,
-                "peak_usage_hour": max(usage_analytics.usage_by_hour.items(), key=lambda x: x[1])[0] if usage_analytics.usage_by_hour else None
+                "busiest_endpoint": usage_analytics["top_endpoints"][0] if usage_analytics["top_endpoints"] else None,
+                "slowest_endpoint": performance_analytics["slowest_endpoints"][0] if performance_analytics["slowest_endpoints"] else None,
+                "peak_usage_hour": max(usage_by_hour, key=usage_by_hour.get) if usage_by_hour else None
             },
             "recommendations": recommendations,
             "trends": {
-                "error_trend": "improving" if list(usage_analytics.error_trends.values())[-5:] and list(usage_analytics.error_trends.values())[-5:][0] > list(usage_analytics.error_trends.values())[-5:][-1] else "stable",
-                "usage_trend": "increasing" if len(usage_analytics.usage_by_hour) > 0 else "stable"
+                "error_trend": "improving" if recent_error_rates and recent_error_rates[0] > recent_error_rates[-1] else "stable",
+                "usage_trend": "increasing" if usage_by_hour else "stable"
             }
         }
 
-    except Exception as e:
-        logger.error(f"Error generating summary report: {e}")
+    except Exception:
+        logger.exception("Error generating summary report")
         raise HTTPException(status_code=500, detail="Failed to generate summary report")
 
 
@@ -381,8 +483,8 @@ async def get_conversation_summary(
         summary = await conversation_analytics_service.get_conversation_metrics_summary(days, db)
         return summary
 
-    except Exception as e:
-        logger.error(f"Error getting conversation summary: {e}")
+    except Exception:
+        logger.exception("Error getting conversation summary")
         raise HTTPException(status_code=500, detail="Failed to get conversation summary")
 
 
@@ -396,8 +498,8 @@ async def get_conversation_topics(
         topics = await conversation_analytics_service.get_top_topics(days, db)
         return {"topics": topics, "period_days": days}
 
-    except Exception as e:
-        logger.error(f"Error getting conversation topics: {e}")
+    except Exception:
+        logger.exception("Error getting conversation topics")
         raise HTTPException(status_code=500, detail="Failed to get conversation topics")
 
 
@@ -411,6 +513,6 @@ async def get_resolution_trends(
         trends = await conversation_analytics_service.get_resolution_trends(days, db)
         return {"trends": trends, "period_days": days}
 
-    except Exception as e:
-        logger.error(f"Error getting resolution trends: {e}")
+    except Exception:
+        logger.exception("Error getting resolution trends")
         raise HTTPException(status_code=500, detail="Failed to get resolution trends")
\ No newline at end of file
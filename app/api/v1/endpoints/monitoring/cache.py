@@ -2,18 +2,44 @@
 Cache management and monitoring endpoints.
 """
 
+import asyncio
+import os
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 from sqlalchemy.orm import Session
 
 from app.services.cache_service import cache_service
+from app.utils.ttl_cache import TTLCache
 from app.db.session import get_db
 
-router = APIRouter(prefix="/cache", tags=["Cache Management"])
+router = APIRouter(prefix="/cache", tags=["Cache Management"], default_response_class=ORJSONResponse)
+
+# Seconds cache stats (a Redis PING and INFO) are reused across dashboard polls
+CACHE_STATS_TTL = 2.0
+
+_stats_cache = TTLCache(ttl=CACHE_STATS_TTL, max_entries=1)
+
+# Tag categories the services cache under
+KNOWN_CACHE_TAGS = (
+    "products",
+    "search",
+    "details",
+    "orders",
+    "status",
+    "policies",
+    "analytics"
+)
+
+
+async def _cached_cache_stats() -> Dict[str, Any]:
+    """Cache service stats, shared by /stats and /performance for CACHE_STATS_TTL seconds."""
+    return await _stats_cache.get_or_set("stats", cache_service.get_cache_stats)
 
 
 class CacheStats(BaseModel):
@@ -40,7 +66,7 @@ class CacheOperation(BaseModel):
 async def get_cache_stats():
     """Get cache performance statistics."""
     try:
-        stats = await cache_service.get_cache_stats()
+        stats = await _cached_cache_stats()
         return CacheStats(**stats)
 
     except Exception as e:
@@ -62,18 +88,18 @@ async def clear_cache(
 
     try:
         if pattern:
-            # For now, we don't implement pattern-based clearing
-            # This would require more complex Redis commands
-            await cache_service.clear_all()
-            message = f"All cache cleared (pattern filtering not implemented)"
+            affected_keys = await cache_service.clear_by_pattern(pattern)
+            message = f"Cleared {affected_keys} cache entries matching pattern"
         else:
             await cache_service.clear_all()
+            affected_keys = 0  # FLUSHDB does not report a count
             message = "All cache cleared successfully"
 
+        _stats_cache.invalidate()
         return CacheOperation(
             success=True,
             message=message,
-            affected_keys=0  # We don't track exact count in current implementation
+            affected_keys=affected_keys
         )
 
     except Exception as e:
@@ -88,6 +114,7 @@ async def invalidate_cache_by_tag(
     """Invalidate cache entries by tag."""
     try:
         invalidated_count = await cache_service.invalidate_by_tag(tag)
+        _stats_cache.invalidate()
 
         return CacheOperation(
             success=True,
@@ -103,39 +130,36 @@ async def invalidate_cache_by_tag(
 @router.get("/health")
 async def cache_health_check():
     """Check cache system health."""
+    now = datetime.utcnow()
     try:
-        # Test basic cache operations
-        test_key = f"health_check_{datetime.utcnow().timestamp()}"
-        test_value = {"test": True, "timestamp": datetime.utcnow().isoformat()}
+        # Test basic cache operations, fetching stats concurrently
+        test_key = f"health_check_{os.getpid()}_{time.monotonic_ns()}"
+        test_value = {"test": True, "timestamp": now.isoformat()}
+        (set_success, retrieved_value), stats = await asyncio.gather(
+            cache_service.round_trip(test_key, test_value, ttl=60),
+            cache_service.get_cache_stats()
+        )
 
         # Test set
-        set_success = await cache_service.set(test_key, test_value, ttl=60)
         if not set_success:
             return {
                 "status": "unhealthy",
                 "message": "Cache set operation failed",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }
 
         # Test get
-        retrieved_value = await cache_service.get(test_key)
         if retrieved_value != test_value:
             return {
                 "status": "unhealthy",
                 "message": "Cache get operation failed",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now
             }
 
-        # Clean up test key
-        await cache_service.delete(test_key)
-
-        # Get cache stats
-        stats = await cache_service.get_cache_stats()
-
         return {
             "status": "healthy",
             "message": "Cache system operating normally",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now,
             "stats": stats
         }
 
@@ -144,7 +168,7 @@ async def cache_health_check():
         return {
             "status": "unhealthy",
             "message": f"Cache health check failed: {str(e)}",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now
         }
 
 
@@ -152,7 +176,7 @@ async def cache_health_check():
 async def get_cache_performance_metrics():
     """Get detailed cache performance metrics."""
     try:
-        stats = await cache_service.get_cache_stats()
+        stats = await _cached_cache_stats()
 
         # Calculate performance indicators
         memory_usage_percent = (stats.get("memory_cache_size", 0) /
@@ -192,20 +216,10 @@ async def get_cache_tags():
     try:
         # This would require implementing tag enumeration in the cache service
         # For now, return known tag categories
-        known_tags = [
-            "products",
-            "search",
-            "details",
-            "orders",
-            "status",
-            "policies",
-            "analytics"
-        ]
-
         return {
-            "available_tags": known_tags,
+            "available_tags": KNOWN_CACHE_TAGS,
             "note": "This shows known tag categories. Actual tag enumeration requires Redis implementation.",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
 
     except Exception as e:
@@ -2,6 +2,7 @@
 Metrics and performance monitoring endpoints.
 """
 
+import heapq
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
@@ -115,40 +116,43 @@ async def get_performance_metrics(minutes: int = Query(5, ge=1, le=60, descripti
     """Get performance metrics for endpoints."""
     try:
         monitor = get_api_monitor()
-        request_stats = monitor.request_tracker.get_request_stats(minutes)
-
-        # Extract performance data by endpoint
-        endpoint_stats = request_stats.get("top_endpoints", {})
-        performance_metrics = []
-
-        for endpoint, count in endpoint_stats.items():
-            # Get detailed stats for this endpoint
-            endpoint_requests = [
-                r for r in monitor.request_tracker.requests
-                if r.path == endpoint and (datetime.utcnow() - r.timestamp).total_seconds() <= minutes * 60
-            ]
-
-            if endpoint_requests:
-                durations = [r.duration_ms for r in endpoint_requests]
-                errors = [r for r in endpoint_requests if r.status_code >= 400]
-                cache_hits = [r for r in endpoint_requests if r.cache_hit]
-
-                # Extract method from first request (assuming all same method)
-                method = endpoint_requests[0].method if endpoint_requests else "GET"
-
-                performance_metrics.append(PerformanceMetrics(
-                    endpoint=endpoint,
-                    method=method,
-                    avg_duration_ms=sum(durations) / len(durations),
-                    max_duration_ms=max(durations),
-                    min_duration_ms=min(durations),
-                    request_count=len(endpoint_requests),
-                    error_rate=(len(errors) / len(endpoint_requests)) * 100,
-                    cache_hit_rate=(len(cache_hits) / len(endpoint_requests)) * 100
-                ))
+        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
 
-        # Sort by request count
-        performance_metrics.sort(key=lambda x: x.request_count, reverse=True)
+        # One pass keeping running totals per path instead of per-endpoint request lists
+        endpoint_stats: Dict[str, Dict[str, Any]] = {}
+        for r in monitor.request_tracker.requests:
+            if r.timestamp < cutoff_time:
+                continue
+            stats = endpoint_stats.get(r.path)
+            if stats is None:
+                # Method of the first request seen (assuming all same method)
+                stats = endpoint_stats[r.path] = {
+                    "method": r.method, "count": 0, "total_ms": 0.0,
+                    "max_ms": r.duration_ms, "min_ms": r.duration_ms, "errors": 0, "cache_hits": 0
+                }
+            stats["count"] += 1
+            stats["total_ms"] += r.duration_ms
+            if r.duration_ms > stats["max_ms"]:
+                stats["max_ms"] = r.duration_ms
+            if r.duration_ms < stats["min_ms"]:
+                stats["min_ms"] = r.duration_ms
+            stats["errors"] += r.status_code >= 400
+            stats["cache_hits"] += r.cache_hit
+
+        # Ten busiest endpoints, by request count
+        performance_metrics = [
+            PerformanceMetrics(
+                endpoint=endpoint,
+                method=stats["method"],
+                avg_duration_ms=stats["total_ms"] / stats["count"],
+                max_duration_ms=stats["max_ms"],
+                min_duration_ms=stats["min_ms"],
+                request_count=stats["count"],
+                error_rate=(stats["errors"] / stats["count"]) * 100,
+                cache_hit_rate=(stats["cache_hits"] / stats["count"]) * 100
+            )
+            for endpoint, stats in heapq.nlargest(10, endpoint_stats.items(), key=lambda item: item[1]["count"])
+        ]
 
         return performance_metrics
 
@@ -346,7 +350,7 @@ async def clear_metrics():
         monitor.metrics_collector.timers.clear()
 
         # Clear request history
-        monitor.request_tracker.requests.clear()
+        monitor.request_tracker.clear()
 
         logger.info("All metrics cleared")
         return {"message": "All metrics cleared successfully"}
@@ -5,16 +5,18 @@ API monitoring and analytics system.
 import time
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 
+import numpy as np
 from fastapi import Request, Response
 from loguru import logger
 
 from app.core.config import settings
+from app.utils.compat import DATACLASS_SLOTS
 
 
 class MetricType(Enum):
@@ -44,9 +46,9 @@ class APIMetric:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RequestMetric:
-    """Request-specific metric."""
+    """Request-specific metric (slotted: up to max_requests instances are retained)."""
     method: str
     path: str
     status_code: int
@@ -60,6 +62,180 @@ class RequestMetric:
     request_size: int = 0
     cache_hit: bool = False
     error_message: Optional[str] = None
+    endpoint_id: int = -1  # interned (method, path), assigned by RequestTracker
+    client_index: int = -1  # interned client_id, -1 when unknown
+
+
+class LabelIndex:
+    """Dense integer ids for a set of repeated labels."""
+
+    def __init__(self):
+        self.ids: Dict[Any, int] = {}
+        self.labels: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def intern(self, label: Any) -> int:
+        """Id for `label`, assigning the next one on first sight."""
+        label_id = self.ids.get(label)
+        if label_id is None:
+            label_id = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return label_id
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+MICROS_PER_HOUR = 3_600_000_000
+
+
+def to_epoch_micros(timestamp: datetime) -> int:
+    """Microseconds since the epoch for a naive UTC datetime."""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime:
+    """Naive UTC datetime for microseconds since the epoch."""
+    return _EPOCH + timedelta(microseconds=int(micros))
+
+
+@dataclass
+class RequestArrays:
+    """Column-wise snapshot of tracked requests for vectorized analytics."""
+    timestamps: np.ndarray  # microseconds since the epoch (UTC), int64
+    durations_ms: np.ndarray  # float64
+    status_codes: np.ndarray  # int32
+    cache_hits: np.ndarray  # bool
+    endpoint_ids: np.ndarray  # int32 index into endpoints
+    client_ids: np.ndarray  # int32 index into clients, -1 when unknown
+    user_ids: np.ndarray  # int32 index into users, -1 when unknown
+    endpoints: List[Tuple[str, str]]  # (method, path)
+    clients: List[str]
+    users: List[str]
+
+    def since(self, cutoff_time: datetime) -> np.ndarray:
+        """Boolean mask of requests at or after cutoff_time."""
+        return self.timestamps >= to_epoch_micros(cutoff_time)
+
+    def select(self, mask: np.ndarray) -> "RequestArrays":
+        """Rows where `mask` is set, sharing the label lists."""
+        return RequestArrays(
+            timestamps=self.timestamps[mask],
+            durations_ms=self.durations_ms[mask],
+            status_codes=self.status_codes[mask],
+            cache_hits=self.cache_hits[mask],
+            endpoint_ids=self.endpoint_ids[mask],
+            client_ids=self.client_ids[mask],
+            user_ids=self.user_ids[mask],
+            endpoints=self.endpoints,
+            clients=self.clients,
+            users=self.users
+        )
+
+
+def _decrement(counter: Counter, key: Any) -> None:
+    """Take one off counter[key], dropping the key when it reaches zero."""
+    if key in counter:
+        counter[key] -= 1
+        if not counter[key]:
+            del counter[key]
+
+
+@dataclass
+class ClientAggregate:
+    """
+    Running totals of one client's requests within an HourBucket.
+
+    first_seen/last_seen are exact until requests are evicted, then bounds
+    (see remove).
+    """
+    count: int = 0
+    duration_sum: float = 0.0
+    error_count: int = 0
+    endpoints: Counter = field(default_factory=Counter)  # endpoint_id -> requests
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+
+    def add(self, metric: RequestMetric) -> None:
+        """Fold a request into the totals."""
+        self.count += 1
+        self.duration_sum += metric.duration_ms
+        self.error_count += metric.status_code >= 400
+        self.endpoints[metric.endpoint_id] += 1
+        if self.first_seen is None or metric.timestamp < self.first_seen:
+            self.first_seen = metric.timestamp
+        if self.last_seen is None or metric.timestamp > self.last_seen:
+            self.last_seen = metric.timestamp
+
+    def remove(self, metric: RequestMetric) -> None:
+        """
+        Take back an evicted request.
+
+        The tracker evicts in completion order while timestamps are start
+        times, so the evicted request need not be the client's earliest and
+        the earliest remaining start is unknown. first_seen is left as is:
+        after evictions it is a lower bound, never later than any request
+        still held and within the bucket's hour. last_seen is likewise an
+        upper bound.
+        """
+        self.count -= 1
+        self.duration_sum -= metric.duration_ms
+        self.error_count -= metric.status_code >= 400
+        _decrement(self.endpoints, metric.endpoint_id)
+
+    def merge(self, other: "ClientAggregate") -> None:
+        """Add another aggregate's totals into this one."""
+        self.count += other.count
+        self.duration_sum += other.duration_sum
+        self.error_count += other.error_count
+        self.endpoints.update(other.endpoints)
+        if self.first_seen is None or other.first_seen < self.first_seen:
+            self.first_seen = other.first_seen
+        if self.last_seen is None or other.last_seen > self.last_seen:
+            self.last_seen = other.last_seen
+
+
+@dataclass
+class HourBucket:
+    """Additive aggregates of the tracked requests that started in one UTC hour."""
+    count: int = 0
+    error_count: int = 0
+    duration_sum: float = 0.0
+    cache_hits: int = 0
+    endpoints: Counter = field(default_factory=Counter)  # endpoint_id -> requests
+    users: Counter = field(default_factory=Counter)
+    clients: Dict[int, ClientAggregate] = field(default_factory=dict)  # client_index -> totals
+
+    def add(self, metric: RequestMetric) -> None:
+        """Fold a request into the bucket."""
+        self.count += 1
+        self.error_count += metric.status_code >= 400
+        self.duration_sum += metric.duration_ms
+        self.cache_hits += metric.cache_hit
+        self.endpoints[metric.endpoint_id] += 1
+        if metric.user_id:
+            self.users[metric.user_id] += 1
+        if metric.client_index >= 0:
+            client = self.clients.get(metric.client_index)
+            if client is None:
+                client = self.clients[metric.client_index] = ClientAggregate()
+            client.add(metric)
+
+    def remove(self, metric: RequestMetric) -> None:
+        """Take back a request previously added, dropping keys that reach zero."""
+        self.count -= 1
+        self.error_count -= metric.status_code >= 400
+        self.duration_sum -= metric.duration_ms
+        self.cache_hits -= metric.cache_hit
+        _decrement(self.endpoints, metric.endpoint_id)
+        _decrement(self.users, metric.user_id)
+        client = self.clients.get(metric.client_index)
+        if client is not None:
+            client.remove(metric)
+            if not client.count:
+                del self.clients[metric.client_index]
 
 
 @dataclass
@@ -198,6 +374,14 @@ class RequestTracker:
         self.max_requests = max_requests
         self.requests: deque = deque(maxlen=max_requests)
         self.active_requests: Dict[str, datetime] = {}
+        self._recorded = 0  # requests ever appended; with len(requests), versions the array snapshot
+        self._arrays: Optional[RequestArrays] = None
+        self._arrays_version: Optional[Tuple[int, int]] = None
+        # Aggregates of the requests currently held, keyed by epoch hour
+        self._hour_buckets: Dict[int, HourBucket] = {}
+        # Endpoints and clients interned at ingest so analytics count small ints
+        self.endpoint_index = LabelIndex()  # (method, path)
+        self.client_index = LabelIndex()
 
     def start_request(self, request_id: str, request: Request) -> datetime:
         """Start tracking a request."""
@@ -237,14 +421,77 @@ class RequestTracker:
             error_message=getattr(request.state, 'error_message', None)
         )
 
-        # Store request metric
-        self.requests.append(metric)
+        self._record(metric)
 
         # Remove from active requests
         self.active_requests.pop(request_id, None)
 
         return metric
 
+    def _record(self, metric: RequestMetric) -> None:
+        """Intern, store and aggregate a finished request."""
+        metric.endpoint_id = self.endpoint_index.intern((metric.method, metric.path))
+        metric.client_index = self.client_index.intern(metric.client_id) if metric.client_id else -1
+
+        # Keep the hourly aggregates in step with the bounded deque
+        if len(self.requests) == self.max_requests:
+            self._unbucket(self.requests[0])
+        self.requests.append(metric)
+        self._recorded += 1
+        self._hour_bucket(metric.timestamp).add(metric)
+
+        # Labels of evicted requests are never forgotten individually, so
+        # re-intern from the held requests once the tables outgrow them
+        if max(len(self.endpoint_index), len(self.client_index)) > 2 * self.max_requests:
+            self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the label tables and hourly aggregates from the held requests."""
+        self.endpoint_index = LabelIndex()
+        self.client_index = LabelIndex()
+        self._hour_buckets = {}
+        for metric in self.requests:
+            metric.endpoint_id = self.endpoint_index.intern((metric.method, metric.path))
+            metric.client_index = self.client_index.intern(metric.client_id) if metric.client_id else -1
+            self._hour_bucket(metric.timestamp).add(metric)
+        self._arrays = None
+
+    def _hour_bucket(self, timestamp: datetime) -> HourBucket:
+        hour = to_epoch_micros(timestamp) // MICROS_PER_HOUR
+        bucket = self._hour_buckets.get(hour)
+        if bucket is None:
+            bucket = self._hour_buckets[hour] = HourBucket()
+        return bucket
+
+    def _unbucket(self, metric: RequestMetric) -> None:
+        hour = to_epoch_micros(metric.timestamp) // MICROS_PER_HOUR
+        bucket = self._hour_buckets.get(hour)
+        if bucket is None:
+            return
+        bucket.remove(metric)
+        if bucket.count <= 0:
+            del self._hour_buckets[hour]
+
+    def hour_buckets(self, since: datetime) -> List[Tuple[int, HourBucket]]:
+        """
+        Hourly aggregates from the hour containing `since` onwards, oldest first.
+
+        Keys are hours since the epoch (UTC). The first bucket covers its
+        whole hour, so the window starts up to an hour before `since`.
+        """
+        first_hour = to_epoch_micros(since) // MICROS_PER_HOUR
+        return sorted(
+            ((hour, bucket) for hour, bucket in list(self._hour_buckets.items()) if hour >= first_hour),
+            key=lambda item: item[0]
+        )
+
+    def clear(self) -> None:
+        """Forget all tracked requests and their aggregates."""
+        self.requests.clear()
+        self._hour_buckets = {}
+        self.endpoint_index = LabelIndex()
+        self.client_index = LabelIndex()
+
     def get_request_stats(self, minutes: int = 5) -> Dict[str, Any]:
         """Get request statistics."""
         cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
@@ -263,7 +510,7 @@ class RequestTracker:
 
         durations = [r.duration_ms for r in recent_requests]
         status_codes = defaultdict(int)
-        endpoints = defaultdict(int)
+        endpoints = Counter()
         methods = defaultdict(int)
 
         for request in recent_requests:
@@ -280,15 +527,73 @@ class RequestTracker:
             "max_duration_ms": max(durations) if durations else 0,
             "min_duration_ms": min(durations) if durations else 0,
             "status_codes": dict(status_codes),
-            "top_endpoints": dict(sorted(endpoints.items(), key=lambda x: x[1], reverse=True)[:10]),
+            "top_endpoints": dict(endpoints.most_common(10)),
             "methods": dict(methods),
             "cache_hit_rate": (len([r for r in recent_requests if r.cache_hit]) / total_requests * 100) if total_requests > 0 else 0
         }
 
+    def to_arrays(self) -> RequestArrays:
+        """
+        Struct-of-arrays view of the tracked requests.
+
+        Rebuilt only when requests were recorded since the last call, so
+        analytics endpoints polled together share one extraction pass.
+        """
+        version = (self._recorded, len(self.requests))
+        if self._arrays is not None and self._arrays_version == version:
+            return self._arrays
+
+        count = len(self.requests)
+        timestamps = np.empty(count, dtype=np.int64)
+        durations = np.empty(count, dtype=np.float64)
+        status_codes = np.empty(count, dtype=np.int32)
+        cache_hits = np.empty(count, dtype=bool)
+        endpoint_ids = np.empty(count, dtype=np.int32)
+        client_ids = np.empty(count, dtype=np.int32)
+        user_ids = np.empty(count, dtype=np.int32)
+        user_index: Dict[str, int] = {}
+
+        for i, request in enumerate(self.requests):
+            timestamps[i] = to_epoch_micros(request.timestamp)
+            durations[i] = request.duration_ms
+            status_codes[i] = request.status_code
+            cache_hits[i] = request.cache_hit
+            endpoint_ids[i] = request.endpoint_id
+            client_ids[i] = request.client_index
+            user_ids[i] = user_index.setdefault(request.user_id, len(user_index)) if request.user_id else -1
+
+        self._arrays = RequestArrays(
+            timestamps=timestamps,
+            durations_ms=durations,
+            status_codes=status_codes,
+            cache_hits=cache_hits,
+            endpoint_ids=endpoint_ids,
+            client_ids=client_ids,
+            user_ids=user_ids,
+            endpoints=list(self.endpoint_index.labels),
+            clients=list(self.client_index.labels),
+            users=list(user_index)
+        )
+        self._arrays_version = version
+        return self._arrays
+
     def get_active_requests_count(self) -> int:
         """Get count of active requests."""
         return len(self.active_requests)
 
+    def get_load_snapshot(self, minutes: int = 1) -> Dict[str, int]:
+        """
+        Count of requests started in the last `minutes` plus in-flight requests.
+
+        A cheap alternative to get_request_stats for probes that only need
+        the volume.
+        """
+        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
+        return {
+            "total_requests": sum(1 for r in self.requests if r.timestamp >= cutoff_time),
+            "active_requests": len(self.active_requests)
+        }
+
 
 class AlertManager:
     """Manages alerts and notifications."""
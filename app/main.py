@@ -2,6 +2,8 @@
 Shop Assistant AI - Main FastAPI application entry point.
 """
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
@@ -14,6 +16,7 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.exceptions import RequestValidationError
 from pathlib import Path
 
+from app.api.health_interceptor import HealthCheckInterceptor
 from app.core.config import settings
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.security import SecurityMiddleware
@@ -42,9 +45,37 @@ redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting Shop Assistant AI application...")
+
+    # Refresh system metrics in the background so monitoring endpoints never sample psutil
+    metrics_task = None
+    try:
+        from app.monitoring.metrics import metrics_collection_task
+        metrics_task = asyncio.create_task(metrics_collection_task())
+    except ImportError as e:
+        logger.warning(f"Metrics collection disabled: {e}")
+
     yield
     logger.info("Shutting down Shop Assistant AI application...")
 
+    if metrics_task is not None:
+        metrics_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await metrics_task
+
+    # Close the Shopify client shared by the monitoring health probes
+    try:
+        from app.api.v1.endpoints.monitoring.health import health_checker
+        await health_checker.close()
+    except ImportError:
+        pass
+
+    # Cancel running load tests and close the runner's pooled HTTP clients
+    try:
+        from app.testing.load_testing import load_test_runner
+        await load_test_runner.aclose()
+    except ImportError:
+        pass
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -231,4 +262,9 @@ async def add_request_id_header(request: Request, call_next):
 
     response = await call_next(request)
     response.headers["X-Request-ID"] = request_id
-    return response
\ No newline at end of file
+    return response
+
+
+# Answer liveness probes (/ping, /health/live) ahead of the middleware stack
+fastapi_app = app
+app = HealthCheckInterceptor(fastapi_app)
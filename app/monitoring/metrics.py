@@ -2,10 +2,11 @@
 API performance monitoring and metrics collection.
 """
 
+import os
 import time
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, Iterable, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import json
@@ -14,12 +15,16 @@ from collections import defaultdict, deque
 from functools import wraps
 import psutil
 import redis.asyncio as redis
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from loguru import logger
 
 from app.core.config import settings
 
+# Shared mmap directory for prometheus_client when the app runs with several workers
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
 
 class MetricType(Enum):
     """Metric types."""
@@ -64,6 +69,8 @@ class MetricsCollector:
         self.histograms: Dict[str, List[float]] = defaultdict(list)
         self.timers: Dict[str, List[float]] = defaultdict(list)
         self.metric_definitions: Dict[str, MetricDefinition] = {}
+        # prometheus_client mirrors, written to PROMETHEUS_MULTIPROC_DIR and aggregated on scrape
+        self._prometheus_metrics: Dict[str, Tuple[MetricType, Any]] = {}
 
         # Define standard metrics
         self._define_standard_metrics()
@@ -150,6 +157,8 @@ class MetricsCollector:
     ):
         """Increment a counter metric."""
         self.counters[name] += value
+        if PROMETHEUS_MULTIPROC_DIR:
+            self._mirror_prometheus(name, MetricType.COUNTER, value)
         self._record_metric(name, value, labels)
 
     def set_gauge(
@@ -160,6 +169,8 @@ class MetricsCollector:
     ):
         """Set a gauge metric value."""
         self.gauges[name] = value
+        if PROMETHEUS_MULTIPROC_DIR:
+            self._mirror_prometheus(name, MetricType.GAUGE, value)
         self._record_metric(name, value, labels)
 
     def record_histogram(
@@ -173,6 +184,8 @@ class MetricsCollector:
         # Keep only last 1000 values
         if len(self.histograms[name]) > 1000:
             self.histograms[name] = self.histograms[name][-1000:]
+        if PROMETHEUS_MULTIPROC_DIR:
+            self._mirror_prometheus(name, MetricType.HISTOGRAM, value)
         self._record_metric(name, value, labels)
 
     def record_timer(
@@ -186,8 +199,39 @@ class MetricsCollector:
         # Keep only last 1000 values
         if len(self.timers[name]) > 1000:
             self.timers[name] = self.timers[name][-1000:]
+        if PROMETHEUS_MULTIPROC_DIR:
+            self._mirror_prometheus(name, MetricType.TIMER, duration)
         self._record_metric(name, duration, labels)
 
+    def _mirror_prometheus(self, name: str, metric_type: MetricType, value: float):
+        """Record a value in the unlabelled prometheus_client metric shared across workers."""
+        entry = self._prometheus_metrics.get(name)
+        if entry is None:
+            metric_def = self.metric_definitions.get(name)
+            description = metric_def.description if metric_def else name
+            try:
+                if metric_type == MetricType.COUNTER:
+                    metric = Counter(name, description, registry=None)
+                elif metric_type == MetricType.GAUGE:
+                    metric = Gauge(name, description, registry=None, multiprocess_mode="mostrecent")
+                else:
+                    metric = Histogram(name, description, registry=None)
+            except ValueError as e:
+                logger.debug(f"Metric {name} not exported to Prometheus: {e}")
+                metric = None
+            entry = self._prometheus_metrics[name] = (metric_type, metric)
+
+        # Names first seen as another type (or invalid names) stay out of the export
+        exported_type, metric = entry
+        if metric is None or exported_type != metric_type:
+            return
+        if metric_type == MetricType.COUNTER:
+            metric.inc(value)
+        elif metric_type == MetricType.GAUGE:
+            metric.set(value)
+        else:
+            metric.observe(value)
+
     def _record_metric(
         self,
         name: str,
@@ -226,26 +270,62 @@ class MetricsCollector:
         time_window: Optional[timedelta] = None
     ) -> Dict[str, Any]:
         """Get metric summary for a specific metric."""
-        if name not in self.metrics:
-            return {}
+        return self.get_metric_summaries([name], time_window).get(name, {})
 
-        cutoff_time = datetime.utcnow() - (time_window or timedelta(hours=1))
-        recent_values = [
-            mv.value for mv in self.metrics[name]
-            if mv.timestamp > cutoff_time
-        ]
+    def get_metric_summaries(
+        self,
+        names: Iterable[str],
+        time_window: Optional[timedelta] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get summaries for several metrics in one pass, skipping metrics with no recent data."""
+        return self._summarize_series(((name, self.metrics.get(name)) for name in names), time_window)
+
+    async def get_metric_summaries_async(
+        self,
+        names: Iterable[str],
+        time_window: Optional[timedelta] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Like get_metric_summaries, but summarizes a snapshot of the series in a worker thread."""
+        # Copy on the event loop so the thread never iterates a deque that is being appended to
+        snapshot = [(name, list(self.metrics[name])) for name in names if name in self.metrics]
+        return await asyncio.to_thread(self._summarize_series, snapshot, time_window)
+
+    def _summarize_series(
+        self,
+        series_by_name: Iterable[Tuple[str, Optional[Iterable[MetricValue]]]],
+        time_window: Optional[timedelta] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Summarize (name, values) pairs against a single cutoff."""
+        time_window = time_window or timedelta(hours=1)
+        now = datetime.utcnow()
+        cutoff_time = now - time_window
+        timestamp = now.isoformat()
 
-        if not recent_values:
-            return {}
+        summaries = {}
+        for name, series in series_by_name:
+            if not series:
+                continue
+            recent_values = [mv.value for mv in series if mv.timestamp > cutoff_time]
+            if recent_values:
+                summaries[name] = self._summarize(name, recent_values, time_window, timestamp)
+        return summaries
 
+    def _summarize(
+        self,
+        name: str,
+        recent_values: List[float],
+        time_window: timedelta,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """Build the summary for a metric's values within the time window."""
         metric_def = self.metric_definitions.get(name)
         summary = {
             "name": name,
             "type": metric_def.metric_type.value if metric_def else "unknown",
             "description": metric_def.description if metric_def else "",
             "count": len(recent_values),
-            "latest": recent_values[-1] if recent_values else None,
-            "timestamp": datetime.utcnow().isoformat()
+            "latest": recent_values[-1],
+            "timestamp": timestamp
         }
 
         # Add statistics based on metric type
@@ -261,7 +341,7 @@ class MetricsCollector:
         elif metric_def and metric_def.metric_type == MetricType.COUNTER:
             summary.update({
                 "total": sum(recent_values),
-                "rate": len(recent_values) / (time_window or timedelta(hours=1)).total_seconds()
+                "rate": len(recent_values) / time_window.total_seconds()
             })
         elif metric_def and metric_def.metric_type == MetricType.GAUGE:
             summary.update({
@@ -286,12 +366,7 @@ class MetricsCollector:
         time_window: Optional[timedelta] = None
     ) -> Dict[str, Dict[str, Any]]:
         """Get summaries for all metrics."""
-        summaries = {}
-        for name in self.metrics.keys():
-            summary = self.get_metric_summary(name, time_window)
-            if summary:
-                summaries[name] = summary
-        return summaries
+        return self.get_metric_summaries(list(self.metrics), time_window)
 
     def export_prometheus_format(self) -> str:
         """Export metrics in Prometheus format."""
@@ -318,6 +393,12 @@ class MetricsCollector:
 
         return "\n".join(lines)
 
+    def export_prometheus_multiprocess(self) -> bytes:
+        """Export metrics aggregated across all workers sharing PROMETHEUS_MULTIPROC_DIR."""
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+
 
 class PerformanceMonitor:
     """Performance monitoring utility."""
@@ -329,8 +410,8 @@ class PerformanceMonitor:
     async def collect_system_metrics(self):
         """Collect system performance metrics."""
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU metrics (usage since the previous call; the collection loop sets the window)
+            cpu_percent = psutil.cpu_percent(interval=None)
             self.metrics.set_gauge("system_cpu_usage_percent", cpu_percent)
 
             # Memory metrics
@@ -504,14 +585,26 @@ def get_performance_monitor() -> PerformanceMonitor:
     return performance_monitor
 
 
+# Seconds between background system/application metric refreshes; with
+# 1000 samples per series this keeps about 8 hours of history
+METRICS_COLLECTION_INTERVAL = 30.0
+
+
 # Background task to collect metrics
-async def metrics_collection_task():
-    """Background task to periodically collect metrics."""
+async def metrics_collection_task(interval: float = METRICS_COLLECTION_INTERVAL):
+    """
+    Background task to periodically collect metrics.
+
+    Endpoints read the gauges this task keeps fresh instead of sampling
+    psutil inside the request.
+    """
     while True:
         try:
             await performance_monitor.collect_system_metrics()
             await performance_monitor.collect_application_metrics()
-            await asyncio.sleep(30)  # Collect every 30 seconds
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Metrics collection task error: {e}")
             await asyncio.sleep(60)  # Wait longer on error
@@ -4,9 +4,10 @@ Implements multi-level caching with Redis backend and intelligent cache invalida
 """
 
 import json
+import fnmatch
 import hashlib
 import asyncio
-from typing import Any, Optional, Dict, List, Union, Callable
+from typing import Any, Optional, Dict, List, Tuple, Union, Callable
 from datetime import datetime, timedelta
 from functools import wraps
 from loguru import logger
@@ -20,6 +21,9 @@ except ImportError:
 
 from app.core.config import settings
 
+# Keys requested per SCAN call and removed per UNLINK when clearing by pattern
+SCAN_BATCH_SIZE = 500
+
 
 class CacheService:
     """High-performance caching service with Redis backend and fallback."""
@@ -209,6 +213,41 @@ class CacheService:
             logger.error(f"Cache clear error: {e}")
             return False
 
+    async def clear_by_pattern(self, pattern: str) -> int:
+        """
+        Delete entries whose keys match a glob-style pattern, returning how many were removed.
+
+        Redis keys are found with SCAN and removed with UNLINK in batches, so
+        the server never blocks on KEYS or FLUSHDB and reclaims memory in the
+        background.
+        """
+        try:
+            await self.ensure_redis_initialized()
+            removed = 0
+
+            if self.redis_client:
+                batch = []
+                async for key in self.redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        removed += await self.redis_client.unlink(*batch)
+                        batch.clear()
+                if batch:
+                    removed += await self.redis_client.unlink(*batch)
+
+            matched = [key for key in self.memory_cache if fnmatch.fnmatchcase(key, pattern)]
+            for key in matched:
+                del self.memory_cache[key]
+                self.memory_cache_expiry.pop(key, None)
+            removed += len(matched)
+
+            logger.info(f"Cleared {removed} cache entries matching {pattern!r}")
+            return removed
+
+        except Exception as e:
+            logger.error(f"Cache clear error for pattern {pattern!r}: {e}")
+            return 0
+
     def _cleanup_memory_cache(self):
         """Clean up expired entries from memory cache."""
         now = datetime.utcnow()
@@ -261,6 +300,30 @@ class CacheService:
             return wrapper
         return decorator
 
+    async def round_trip(self, key: str, value: Any, ttl: int = 60) -> Tuple[bool, Any]:
+        """
+        Write, read back and delete a key, for health checks.
+
+        Redis runs all three in one pipelined transaction (a single round
+        trip). Returns whether the write succeeded and the value read back.
+        """
+        await self.ensure_redis_initialized()
+        if self.redis_client:
+            try:
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    pipe.setex(key, ttl, json.dumps(value, default=str))
+                    pipe.get(key)
+                    pipe.delete(key)
+                    set_ok, raw_value, _ = await pipe.execute()
+                return bool(set_ok), json.loads(raw_value) if raw_value else None
+            except Exception as e:
+                logger.error(f"Redis round trip error: {e}")
+
+        set_ok = await self.set(key, value, ttl=ttl)
+        retrieved = await self.get(key)
+        await self.delete(key)
+        return set_ok, retrieved
+
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         try:
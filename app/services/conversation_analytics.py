@@ -8,7 +8,7 @@ import uuid
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import case, func, and_, or_
 from loguru import logger
 
 from app.models.analytics import (
@@ -599,28 +599,30 @@ class ConversationAnalyticsService:
             if not db:
                 return {}
 
+            # One grouped query over the whole window, limited to 30 days
+            span = min(days, 30)
+            today = datetime.utcnow().date()
+            window_start = datetime.combine(today - timedelta(days=span - 1), datetime.min.time())
+            window_end = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            day = func.date(ConversationAnalytics.created_at)
+            rows = db.query(
+                day,
+                func.count(),
+                func.sum(case((ConversationAnalytics.resolution_status == "resolved", 1), else_=0))
+            ).filter(
+                and_(
+                    ConversationAnalytics.created_at >= window_start,
+                    ConversationAnalytics.created_at < window_end
+                )
+            ).group_by(day).all()
+
+            # date() comes back as a date or an ISO string depending on the backend
+            day_counts = {str(bucket): (total, resolved or 0) for bucket, total, resolved in rows}
+
             trends = {}
-            for i in range(min(days, 30)):  # Limit to 30 days
-                day = datetime.utcnow() - timedelta(days=i)
-                day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-                day_end = day_start + timedelta(days=1)
-
-                total = db.query(ConversationAnalytics).filter(
-                    and_(
-                        ConversationAnalytics.created_at >= day_start,
-                        ConversationAnalytics.created_at < day_end
-                    )
-                ).count()
-
-                resolved = db.query(ConversationAnalytics).filter(
-                    and_(
-                        ConversationAnalytics.created_at >= day_start,
-                        ConversationAnalytics.created_at < day_end,
-                        ConversationAnalytics.resolution_status == "resolved"
-                    )
-                ).count()
-
-                day_str = day.strftime("%Y-%m-%d")
+            for i in range(span):
+                day_str = (today - timedelta(days=i)).isoformat()
+                total, resolved = day_counts.get(day_str, (0, 0))
                 trends[day_str] = (resolved / total * 100) if total > 0 else 0
 
             return trends
@@ -3,20 +3,46 @@ API load testing framework.
 """
 
 import asyncio
+import multiprocessing
+import queue
 import time
-import json
-import statistics
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from collections import deque
+from itertools import islice
+from datetime import datetime
+from typing import Awaitable, Deque, Dict, List, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import cached_property
 import httpx
-from concurrent.futures import ThreadPoolExecutor
+import orjson
 import uuid
 from loguru import logger
 
-from app.core.config import settings
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+# Connection pool shared by every load test (sized for the 1000-user request cap)
+SHARED_CLIENT_MAX_CONNECTIONS = 2000
+SHARED_CLIENT_MAX_KEEPALIVE = 1000
+
+# HTTP methods the load tester can send
+SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Smoothing factor for the live response time average shown while a test runs
+RESPONSE_TIME_EWMA_ALPHA = 0.1
+
+# Most recent response times kept per test for percentile statistics
+RESPONSE_TIME_SAMPLE_SIZE = 10_000
+
+# Extra seconds a distributed run waits for worker results beyond the test duration
+WORKER_RESULT_GRACE_SECONDS = 60
+
+# Longest a blocking read of the worker results queue holds its thread, so
+# cancellation and crashed workers are noticed promptly
+WORKER_RESULT_POLL_SECONDS = 0.5
 
 
 class LoadTestStatus(Enum):
@@ -28,6 +54,14 @@ class LoadTestStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# States after which a test's results no longer change
+TERMINAL_STATUSES = frozenset({
+    LoadTestStatus.COMPLETED,
+    LoadTestStatus.FAILED,
+    LoadTestStatus.CANCELLED
+})
+
+
 @dataclass
 class LoadTestConfig:
     """Load test configuration."""
@@ -45,6 +79,35 @@ class LoadTestConfig:
     think_time_seconds: float = 0.0
     follow_redirects: bool = True
     verify_ssl: bool = True
+    fast_mode: bool = False  # Check status codes only; skip decoding error bodies
+    http2: bool = False
+
+    # Request pieces below are built once per config and reused for every send
+
+    @cached_property
+    def url(self) -> str:
+        """Full request URL."""
+        return f"{self.base_url}{self.endpoint}"
+
+    @cached_property
+    def http_method(self) -> str:
+        """Upper-cased HTTP method."""
+        return self.method.upper()
+
+    @cached_property
+    def body_bytes(self) -> Optional[bytes]:
+        """JSON-encoded request body, or None for methods that send no body."""
+        if self.body is None or self.http_method not in ("POST", "PUT"):
+            return None
+        return orjson.dumps(self.body)
+
+    @cached_property
+    def prepared_headers(self) -> httpx.Headers:
+        """Request headers, with a JSON content type when a body is sent."""
+        headers = httpx.Headers(self.headers or {})
+        if self.body_bytes is not None and "content-type" not in headers:
+            headers["content-type"] = "application/json"
+        return headers
 
 
 @dataclass
@@ -55,10 +118,16 @@ class LoadTestResult:
     status: LoadTestStatus
     start_time: datetime
     end_time: Optional[datetime] = None
+    start_iso: Optional[str] = None
+    end_iso: Optional[str] = None
+    start_ns: Optional[int] = None  # perf_counter_ns() readings for durations
+    end_ns: Optional[int] = None
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
-    response_times: List[float] = None
+    response_times: Deque[float] = None
+    response_time_count: int = 0
+    response_time_sum: float = 0.0
     status_codes: Dict[int, int] = None
     errors: List[str] = None
     throughput: float = 0.0
@@ -67,15 +136,62 @@ class LoadTestResult:
     p99_response_time: float = 0.0
     min_response_time: float = 0.0
     max_response_time: float = 0.0
+    current_response_time_ewma: float = 0.0
 
     def __post_init__(self):
+        if self.start_iso is None and self.start_time is not None:
+            self.start_iso = self.start_time.isoformat()
+        if self.start_ns is None:
+            self.start_ns = time.perf_counter_ns()
         if self.response_times is None:
-            self.response_times = []
+            self.response_times = deque(maxlen=RESPONSE_TIME_SAMPLE_SIZE)
         if self.status_codes is None:
             self.status_codes = {}
         if self.errors is None:
             self.errors = []
 
+    @property
+    def success_rate(self) -> float:
+        """Percentage of requests that succeeded."""
+        if not self.total_requests:
+            return 0.0
+        return self.successful_requests * 100.0 / self.total_requests
+
+    def finish(self, status: LoadTestStatus):
+        """Mark the test as finished, stamping its end time."""
+        self.status = status
+        self.end_ns = time.perf_counter_ns()
+        self.end_time = datetime.utcnow()
+        self.end_iso = self.end_time.isoformat()
+
+    @property
+    def duration_seconds(self) -> float:
+        """Elapsed run time, or 0 while the test is still running."""
+        if self.end_ns is None:
+            return 0
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def add_response_time(self, response_time: float):
+        """Record a response time, updating the running aggregates and moving average."""
+        if self.response_time_count:
+            self.current_response_time_ewma += (
+                RESPONSE_TIME_EWMA_ALPHA * (response_time - self.current_response_time_ewma)
+            )
+            if response_time < self.min_response_time:
+                self.min_response_time = response_time
+            if response_time > self.max_response_time:
+                self.max_response_time = response_time
+        else:
+            self.current_response_time_ewma = response_time
+            self.min_response_time = self.max_response_time = response_time
+        self.response_time_count += 1
+        self.response_time_sum += response_time
+        self.response_times.append(response_time)
+
+    def last_n_response_times(self, n: int = 10) -> List[float]:
+        """Most recent n response times, oldest first."""
+        return list(islice(self.response_times, max(0, len(self.response_times) - n), None))
+
 
 class LoadTestScenario:
     """Load test scenario with multiple requests."""
@@ -116,57 +232,142 @@ class LoadTestRunner:
     def __init__(self):
         self.active_tests: Dict[str, LoadTestResult] = {}
         self.test_history: List[LoadTestResult] = []
+        self._clients: Dict[Tuple[bool, bool], httpx.AsyncClient] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def get_client(self, verify_ssl: bool = True, http2: bool = False) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client shared by all virtual users."""
+        key = (verify_ssl, http2)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            # HTTP/2 clients get the same limits: streams are multiplexed over
+            # open h2 connections, while targets that negotiate HTTP/1.1
+            # (plain http without h2c) still need a socket per in-flight user
+            limits = httpx.Limits(
+                max_connections=SHARED_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=SHARED_CLIENT_MAX_KEEPALIVE
+            )
+            client = httpx.AsyncClient(verify=verify_ssl, http2=http2, limits=limits)
+            self._clients[key] = client
+        return client
 
-    async def run_load_test(self, config: LoadTestConfig) -> LoadTestResult:
-        """Run a single load test."""
+    @property
+    def running_task_count(self) -> int:
+        """Number of load tests currently running as background tasks."""
+        return len(self._tasks)
+
+    def start_test(
+        self,
+        config: LoadTestConfig,
+        run: Callable[..., Awaitable[LoadTestResult]],
+        *args: Any
+    ) -> str:
+        """
+        Start a load test as a tracked background task.
+
+        A PENDING result for `config` is registered before the id is returned,
+        so the test can be fetched or cancelled before its task first runs.
+        `run` is one of the run_* methods; it is given the test_id and picks
+        that result up when it starts.
+        """
         test_id = str(uuid.uuid4())
-        result = LoadTestResult(
+        self.active_tests[test_id] = LoadTestResult(
             test_id=test_id,
             config=config,
-            status=LoadTestStatus.RUNNING,
+            status=LoadTestStatus.PENDING,
             start_time=datetime.utcnow()
         )
+        task = asyncio.create_task(run(*args, test_id=test_id))
+        self._tasks[test_id] = task
+        task.add_done_callback(lambda _: self._task_done(test_id))
+        return test_id
+
+    def _task_done(self, test_id: str) -> None:
+        """Forget a finished task, recording a test cancelled before it started."""
+        self._tasks.pop(test_id, None)
+        result = self.active_tests.pop(test_id, None)
+        if result is not None:
+            result.finish(LoadTestStatus.CANCELLED)
+            self.test_history.append(result)
+
+    def _begin_test(self, test_id: Optional[str], config: LoadTestConfig) -> LoadTestResult:
+        """Register a RUNNING result, reusing the PENDING one from start_test."""
+        test_id = test_id or str(uuid.uuid4())
+        result = self.active_tests.get(test_id)
+        if result is None:
+            result = LoadTestResult(
+                test_id=test_id,
+                config=config,
+                status=LoadTestStatus.RUNNING,
+                start_time=datetime.utcnow()
+            )
+            self.active_tests[test_id] = result
+        else:
+            result.config = config
+            result.status = LoadTestStatus.RUNNING
+            result.start_time = datetime.utcnow()
+            result.start_iso = result.start_time.isoformat()
+            result.start_ns = time.perf_counter_ns()
+        return result
+
+    async def aclose(self):
+        """Cancel running tests and close the shared HTTP clients."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-        self.active_tests[test_id] = result
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    async def run_load_test(
+        self,
+        config: LoadTestConfig,
+        test_id: Optional[str] = None
+    ) -> LoadTestResult:
+        """Run a single load test."""
+        result = self._begin_test(test_id, config)
+        test_id = result.test_id
 
         try:
             logger.info(f"Starting load test: {config.name} (ID: {test_id})")
 
-            # Prepare HTTP client
-            async with httpx.AsyncClient(
-                timeout=config.timeout_seconds,
-                follow_redirects=config.follow_redirects,
-                verify=config.verify_ssl
-            ) as client:
-                # Calculate user start times for ramp-up
-                user_start_times = self._calculate_user_start_times(
-                    config.concurrent_users,
-                    config.ramp_up_seconds
-                )
+            # Reuse pooled keep-alive connections across tests
+            client = self.get_client(config.verify_ssl, config.http2)
+
+            # Calculate user start times for ramp-up
+            user_start_times = self._calculate_user_start_times(
+                config.concurrent_users,
+                config.ramp_up_seconds
+            )
 
-                # Create user tasks
-                user_tasks = []
-                for user_id, start_delay in enumerate(user_start_times):
-                    task = self._run_user_session(
-                        client, config, user_id, start_delay, result
-                    )
-                    user_tasks.append(task)
+            # Create user tasks
+            user_tasks = []
+            for user_id, start_delay in enumerate(user_start_times):
+                task = self._run_user_session(
+                    client, config, user_id, start_delay, result
+                )
+                user_tasks.append(task)
 
-                # Wait for all users to complete
-                await asyncio.gather(*user_tasks, return_exceptions=True)
+            # Wait for all users to complete
+            await asyncio.gather(*user_tasks, return_exceptions=True)
 
-            # Calculate final statistics
+            # Calculate final statistics once the end time is known
+            result.finish(LoadTestStatus.COMPLETED)
             self._calculate_statistics(result)
 
-            result.status = LoadTestStatus.COMPLETED
-            result.end_time = datetime.utcnow()
-
             logger.info(f"Load test completed: {config.name} (ID: {test_id})")
 
+        except asyncio.CancelledError:
+            logger.info(f"Load test cancelled: {config.name} (ID: {test_id})")
+            result.finish(LoadTestStatus.CANCELLED)
+            self._calculate_statistics(result)
+            raise
+
         except Exception as e:
             logger.error(f"Load test failed: {config.name} - {str(e)}")
-            result.status = LoadTestStatus.FAILED
-            result.end_time = datetime.utcnow()
+            result.finish(LoadTestStatus.FAILED)
             result.errors.append(str(e))
 
         finally:
@@ -177,66 +378,78 @@ class LoadTestRunner:
 
         return result
 
-    async def run_scenario_test(
-        self,
+    @staticmethod
+    def scenario_config(
         scenario: LoadTestScenario,
         concurrent_users: int = 10,
         duration_seconds: int = 60,
-        ramp_up_seconds: int = 10
-    ) -> LoadTestResult:
-        """Run a load test with a scenario containing multiple request types."""
-        test_id = str(uuid.uuid4())
-        config = LoadTestConfig(
+        ramp_up_seconds: int = 10,
+        http2: bool = False
+    ) -> LoadTestConfig:
+        """Summary config recorded on the result of a scenario test."""
+        return LoadTestConfig(
             name=f"Scenario: {scenario.name}",
             base_url="",
             endpoint="",
             concurrent_users=concurrent_users,
             duration_seconds=duration_seconds,
-            ramp_up_seconds=ramp_up_seconds
+            ramp_up_seconds=ramp_up_seconds,
+            http2=http2
         )
 
-        result = LoadTestResult(
-            test_id=test_id,
-            config=config,
-            status=LoadTestStatus.RUNNING,
-            start_time=datetime.utcnow()
+    async def run_scenario_test(
+        self,
+        scenario: LoadTestScenario,
+        concurrent_users: int = 10,
+        duration_seconds: int = 60,
+        ramp_up_seconds: int = 10,
+        http2: bool = False,
+        test_id: Optional[str] = None
+    ) -> LoadTestResult:
+        """Run a load test with a scenario containing multiple request types."""
+        config = self.scenario_config(
+            scenario, concurrent_users, duration_seconds, ramp_up_seconds, http2
         )
-
-        self.active_tests[test_id] = result
+        result = self._begin_test(test_id, config)
+        test_id = result.test_id
 
         try:
             logger.info(f"Starting scenario test: {scenario.name} (ID: {test_id})")
 
-            async with httpx.AsyncClient(timeout=30) as client:
-                # Calculate user start times
-                user_start_times = self._calculate_user_start_times(
-                    concurrent_users,
-                    ramp_up_seconds
-                )
+            client = self.get_client(http2=http2)
 
-                # Create user tasks
-                user_tasks = []
-                for user_id, start_delay in enumerate(user_start_times):
-                    task = self._run_scenario_user_session(
-                        client, scenario, user_id, start_delay, duration_seconds, result
-                    )
-                    user_tasks.append(task)
+            # Calculate user start times
+            user_start_times = self._calculate_user_start_times(
+                concurrent_users,
+                ramp_up_seconds
+            )
 
-                # Wait for all users to complete
-                await asyncio.gather(*user_tasks, return_exceptions=True)
+            # Create user tasks
+            user_tasks = []
+            for user_id, start_delay in enumerate(user_start_times):
+                task = self._run_scenario_user_session(
+                    client, scenario, user_id, start_delay, duration_seconds, result
+                )
+                user_tasks.append(task)
 
-            # Calculate final statistics
-            self._calculate_statistics(result)
+            # Wait for all users to complete
+            await asyncio.gather(*user_tasks, return_exceptions=True)
 
-            result.status = LoadTestStatus.COMPLETED
-            result.end_time = datetime.utcnow()
+            # Calculate final statistics once the end time is known
+            result.finish(LoadTestStatus.COMPLETED)
+            self._calculate_statistics(result)
 
             logger.info(f"Scenario test completed: {scenario.name} (ID: {test_id})")
 
+        except asyncio.CancelledError:
+            logger.info(f"Scenario test cancelled: {scenario.name} (ID: {test_id})")
+            result.finish(LoadTestStatus.CANCELLED)
+            self._calculate_statistics(result)
+            raise
+
         except Exception as e:
             logger.error(f"Scenario test failed: {scenario.name} - {str(e)}")
-            result.status = LoadTestStatus.FAILED
-            result.end_time = datetime.utcnow()
+            result.finish(LoadTestStatus.FAILED)
             result.errors.append(str(e))
 
         finally:
@@ -246,6 +459,129 @@ class LoadTestRunner:
 
         return result
 
+    async def run_distributed_load_test(
+        self,
+        config: LoadTestConfig,
+        workers: int,
+        test_id: Optional[str] = None
+    ) -> LoadTestResult:
+        """
+        Run a load test split across several worker processes.
+
+        Each worker drives its share of the virtual users on its own event
+        loop, side-stepping the single-loop/GIL ceiling of one process. Large
+        runs need a raised open-file limit on the host (e.g. ulimit -n 65535).
+        """
+        result = self._begin_test(test_id, config)
+        test_id = result.test_id
+        processes = []
+
+        try:
+            logger.info(f"Starting distributed load test: {config.name} (ID: {test_id}, workers: {workers})")
+
+            context = multiprocessing.get_context("spawn")
+            results_queue = context.Queue()
+            for users in self._split_users(config.concurrent_users, workers):
+                process = context.Process(
+                    target=_run_load_test_worker,
+                    args=(replace(config, concurrent_users=users), results_queue),
+                    daemon=True
+                )
+                process.start()
+                processes.append(process)
+
+            # Collect one result per worker
+            deadline = time.monotonic() + (
+                config.ramp_up_seconds + config.duration_seconds +
+                config.timeout_seconds + WORKER_RESULT_GRACE_SECONDS
+            )
+            for _ in processes:
+                worker_result = await self._next_worker_result(results_queue, processes, deadline)
+                self._merge_results(result, worker_result)
+
+            for process in processes:
+                await asyncio.to_thread(process.join)
+
+            result.finish(LoadTestStatus.COMPLETED)
+            self._calculate_statistics(result)
+
+            logger.info(f"Distributed load test completed: {config.name} (ID: {test_id})")
+
+        except asyncio.CancelledError:
+            logger.info(f"Distributed load test cancelled: {config.name} (ID: {test_id})")
+            result.finish(LoadTestStatus.CANCELLED)
+            self._calculate_statistics(result)
+            raise
+
+        except queue.Empty:
+            logger.error(f"Distributed load test timed out waiting for workers: {config.name}")
+            result.finish(LoadTestStatus.FAILED)
+            result.errors.append("Timed out waiting for worker results")
+
+        except Exception as e:
+            logger.error(f"Distributed load test failed: {config.name} - {str(e)}")
+            result.finish(LoadTestStatus.FAILED)
+            result.errors.append(str(e))
+
+        finally:
+            # Workers left running after a cancel, timeout or crash are stopped
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            if test_id in self.active_tests:
+                del self.active_tests[test_id]
+            self.test_history.append(result)
+
+        return result
+
+    async def _next_worker_result(
+        self,
+        results_queue: multiprocessing.Queue,
+        processes: List[multiprocessing.Process],
+        deadline: float
+    ) -> LoadTestResult:
+        """
+        Wait for the next worker result until `deadline` (time.monotonic()).
+
+        Reads block a thread for at most WORKER_RESULT_POLL_SECONDS, so a
+        cancelled test releases it quickly, and a worker that exits with an
+        error fails the test instead of waiting out the deadline.
+        """
+        while True:
+            try:
+                return await asyncio.to_thread(results_queue.get, True, WORKER_RESULT_POLL_SECONDS)
+            except queue.Empty:
+                crashed = [p.exitcode for p in processes if p.exitcode not in (None, 0)]
+                if crashed:
+                    raise RuntimeError(f"Load test worker exited with code {crashed[0]}")
+                if time.monotonic() >= deadline:
+                    raise
+
+    def _split_users(self, concurrent_users: int, workers: int) -> List[int]:
+        """Split virtual users as evenly as possible across workers."""
+        base, extra = divmod(concurrent_users, workers)
+        shares = [base + (1 if i < extra else 0) for i in range(workers)]
+        return [share for share in shares if share > 0]
+
+    def _merge_results(self, result: LoadTestResult, worker_result: LoadTestResult):
+        """Fold a worker's raw counters into the aggregate result."""
+        result.total_requests += worker_result.total_requests
+        result.successful_requests += worker_result.successful_requests
+        result.failed_requests += worker_result.failed_requests
+        if worker_result.response_time_count:
+            if not result.response_time_count:
+                result.min_response_time = worker_result.min_response_time
+                result.max_response_time = worker_result.max_response_time
+            else:
+                result.min_response_time = min(result.min_response_time, worker_result.min_response_time)
+                result.max_response_time = max(result.max_response_time, worker_result.max_response_time)
+            result.response_time_count += worker_result.response_time_count
+            result.response_time_sum += worker_result.response_time_sum
+            result.response_times.extend(worker_result.response_times)
+        result.errors.extend(worker_result.errors)
+        for status_code, count in worker_result.status_codes.items():
+            result.status_codes[status_code] = result.status_codes.get(status_code, 0) + count
+
     def _calculate_user_start_times(
         self,
         concurrent_users: int,
@@ -274,29 +610,29 @@ class LoadTestRunner:
         session_start = time.time()
         session_end = session_start + config.duration_seconds
 
-        # Prepare request data
-        url = f"{config.base_url}{config.endpoint}"
-        headers = config.headers or {}
+        request_options = {
+            "timeout": config.timeout_seconds,
+            "follow_redirects": config.follow_redirects
+        }
 
         while time.time() < session_end:
             request_start = time.time()
 
             try:
                 # Make request
-                if config.method.upper() == "GET":
-                    response = await client.get(url, headers=headers)
-                elif config.method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=config.body)
-                elif config.method.upper() == "PUT":
-                    response = await client.put(url, headers=headers, json=config.body)
-                elif config.method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers)
-                else:
+                if config.http_method not in SUPPORTED_METHODS:
                     raise ValueError(f"Unsupported HTTP method: {config.method}")
+                response = await client.request(
+                    config.http_method,
+                    config.url,
+                    content=config.body_bytes,
+                    headers=config.prepared_headers,
+                    **request_options
+                )
 
                 # Record metrics
                 response_time = time.time() - request_start
-                result.response_times.append(response_time)
+                result.add_response_time(response_time)
                 result.total_requests += 1
 
                 # Track status codes
@@ -308,12 +644,15 @@ class LoadTestRunner:
                     result.successful_requests += 1
                 else:
                     result.failed_requests += 1
-                    result.errors.append(f"HTTP {status_code}: {response.text[:100]}")
+                    if config.fast_mode:
+                        result.errors.append(f"HTTP {status_code}")
+                    else:
+                        result.errors.append(f"HTTP {status_code}: {response.text[:100]}")
 
             except Exception as e:
                 # Track failed requests
                 response_time = time.time() - request_start
-                result.response_times.append(response_time)
+                result.add_response_time(response_time)
                 result.total_requests += 1
                 result.failed_requests += 1
                 result.errors.append(str(e))
@@ -347,25 +686,11 @@ class LoadTestRunner:
         session_end = session_start + duration_seconds
 
         while time.time() < session_end:
-            # Get random request from scenario
+            # Get random request from scenario (its prepared body/headers are reused)
             request_config = scenario.get_random_request()
 
-            # Convert scenario request to full config
-            test_config = LoadTestConfig(
-                name=request_config.name,
-                base_url=request_config.base_url,
-                endpoint=request_config.endpoint,
-                method=request_config.method,
-                headers=request_config.headers,
-                body=request_config.body,
-                timeout_seconds=request_config.timeout_seconds,
-                think_time_seconds=request_config.think_time_seconds,
-                follow_redirects=request_config.follow_redirects,
-                verify_ssl=request_config.verify_ssl
-            )
-
             # Run single request
-            await self._run_single_request(client, test_config, result)
+            await self._run_single_request(client, request_config, result)
 
             # Think time
             if request_config.think_time_seconds > 0:
@@ -381,23 +706,24 @@ class LoadTestRunner:
         request_start = time.time()
 
         try:
-            url = f"{config.base_url}{config.endpoint}"
-            headers = config.headers or {}
-
-            if config.method.upper() == "GET":
-                response = await client.get(url, headers=headers)
-            elif config.method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=config.body)
-            elif config.method.upper() == "PUT":
-                response = await client.put(url, headers=headers, json=config.body)
-            elif config.method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
+            request_options = {
+                "timeout": config.timeout_seconds,
+                "follow_redirects": config.follow_redirects
+            }
+
+            if config.http_method not in SUPPORTED_METHODS:
                 raise ValueError(f"Unsupported HTTP method: {config.method}")
+            response = await client.request(
+                config.http_method,
+                config.url,
+                content=config.body_bytes,
+                headers=config.prepared_headers,
+                **request_options
+            )
 
             # Record metrics
             response_time = time.time() - request_start
-            result.response_times.append(response_time)
+            result.add_response_time(response_time)
             result.total_requests += 1
 
             # Track status codes
@@ -414,30 +740,27 @@ class LoadTestRunner:
         except Exception as e:
             # Track failed requests
             response_time = time.time() - request_start
-            result.response_times.append(response_time)
+            result.add_response_time(response_time)
             result.total_requests += 1
             result.failed_requests += 1
             result.errors.append(str(e))
 
     def _calculate_statistics(self, result: LoadTestResult):
         """Calculate final statistics for the test result."""
-        if not result.response_times:
+        if not result.response_time_count:
             return
 
-        # Response time statistics
-        result.average_response_time = statistics.mean(result.response_times)
-        result.min_response_time = min(result.response_times)
-        result.max_response_time = max(result.response_times)
+        # Response time statistics (percentiles come from the retained recent sample)
+        result.average_response_time = result.response_time_sum / result.response_time_count
         result.p95_response_time = self._percentile(result.response_times, 95)
         result.p99_response_time = self._percentile(result.response_times, 99)
 
         # Throughput (requests per second)
-        if result.end_time:
-            duration = (result.end_time - result.start_time).total_seconds()
-            if duration > 0:
-                result.throughput = result.total_requests / duration
+        duration = result.duration_seconds
+        if duration > 0:
+            result.throughput = result.total_requests / duration
 
-    def _percentile(self, values: List[float], percentile: int) -> float:
+    def _percentile(self, values: Deque[float], percentile: int) -> float:
         """Calculate percentile value."""
         if not values:
             return 0
@@ -466,10 +789,15 @@ class LoadTestRunner:
 
     def cancel_test(self, test_id: str) -> bool:
         """Cancel an active test."""
+        task = self._tasks.get(test_id)
+        if task is not None:
+            # The run_* coroutine records the cancellation and moves the result to history
+            task.cancel()
+            return True
+
         if test_id in self.active_tests:
             result = self.active_tests[test_id]
-            result.status = LoadTestStatus.CANCELLED
-            result.end_time = datetime.utcnow()
+            result.finish(LoadTestStatus.CANCELLED)
             del self.active_tests[test_id]
             self.test_history.append(result)
             return True
@@ -580,6 +908,16 @@ class PredefinedScenarios:
         return scenario
 
 
+def _run_load_test_worker(config: LoadTestConfig, results_queue: multiprocessing.Queue):
+    """Worker process entry point for distributed load tests."""
+    # Spawned workers start with the default policy, so opt into uvloop here
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    runner = LoadTestRunner()
+    result = asyncio.run(runner.run_load_test(config))
+    results_queue.put(result)
+
+
 # Global load test runner instance
 load_test_runner = LoadTestRunner()
 
@@ -596,12 +934,9 @@ def generate_load_report(result: LoadTestResult) -> Dict[str, Any]:
             "test_id": result.test_id,
             "name": result.config.name,
             "status": result.status.value,
-            "start_time": result.start_time.isoformat(),
-            "end_time": result.end_time.isoformat() if result.end_time else None,
-            "duration_seconds": (
-                (result.end_time - result.start_time).total_seconds()
-                if result.end_time else 0
-            )
+            "start_time": result.start_iso,
+            "end_time": result.end_iso,
+            "duration_seconds": result.duration_seconds
         },
         "test_config": {
             "endpoint": result.config.endpoint,
@@ -609,16 +944,14 @@ def generate_load_report(result: LoadTestResult) -> Dict[str, Any]:
             "concurrent_users": result.config.concurrent_users,
             "duration_seconds": result.config.duration_seconds,
             "ramp_up_seconds": result.config.ramp_up_seconds,
-            "requests_per_second": result.config.requests_per_second
+            "requests_per_second": result.config.requests_per_second,
+            "http2": result.config.http2
         },
         "results": {
             "total_requests": result.total_requests,
             "successful_requests": result.successful_requests,
             "failed_requests": result.failed_requests,
-            "success_rate": (
-                (result.successful_requests / result.total_requests * 100)
-                if result.total_requests > 0 else 0
-            ),
+            "success_rate": result.success_rate,
             "throughput_rps": result.throughput
         },
         "response_times": {
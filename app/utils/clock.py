@@ -0,0 +1,60 @@
+"""
+Coarse wall clock for response timestamps on hot paths.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+
+class CoarseClock:
+    """
+    Wall clock refreshed by a background task instead of on every read.
+
+    Response payloads only need timestamps to within a second, so the
+    formatted ISO string and epoch seconds are recomputed every `interval`
+    seconds and shared by all readers. Code that measures elapsed time must
+    keep calling time.time()/time.perf_counter() directly.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._iso = ""
+        self._time = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._tick()
+
+    def iso(self) -> str:
+        """Current UTC time as an ISO 8601 string."""
+        self._ensure_running()
+        return self._iso
+
+    def time(self) -> float:
+        """Current time in seconds since the epoch."""
+        self._ensure_running()
+        return self._time
+
+    def _tick(self) -> None:
+        self._iso = datetime.utcnow().isoformat()
+        self._time = time.time()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._tick()
+
+    def _ensure_running(self) -> None:
+        """Start the refresh task on the running loop, or tick inline without one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._tick()
+            return
+
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._tick()
+            self._task = loop.create_task(self._run())
+
+
+clock = CoarseClock()
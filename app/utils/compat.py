@@ -0,0 +1,9 @@
+"""
+Compatibility shims for older Python versions.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass(**DATACLASS_SLOTS): slotted dataclasses
+# need Python 3.10, older interpreters fall back to a regular __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,12 @@
+#!/bin/sh
+# Container entrypoint: prepare runtime state, then run the given command.
+set -e
+
+# prometheus_client multiprocess mode needs an empty directory at startup;
+# .db files left by a previous run would be merged into every scrape.
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    find "$PROMETHEUS_MULTIPROC_DIR" -mindepth 1 -delete
+fi
+
+exec "$@"
@@ -0,0 +1,207 @@
+"""
+Unit tests for the monitoring AlertManager.
+"""
+
+import asyncio
+import json
+from collections import deque
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.api.v1.endpoints.monitoring.alerts import (
+    AlertManager,
+    AlertSeverity,
+    AlertStatus,
+    AlertType,
+)
+
+
+async def create(manager, source="system_monitor", type=AlertType.SYSTEM,
+                 severity=AlertSeverity.HIGH):
+    """Create an alert with default title and description."""
+    return await manager.create_alert(
+        type=type,
+        severity=severity,
+        title="Test alert",
+        description="Test alert description",
+        source=source
+    )
+
+
+@pytest.mark.unit
+class TestAlertManager:
+    """Test suite for AlertManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a fresh alert manager."""
+        return AlertManager()
+
+    @pytest.mark.asyncio
+    async def test_similar_active_alert_is_deduplicated(self, manager):
+        """Test a second alert for the same type and source returns the first."""
+        first = await create(manager)
+        second = await create(manager)
+
+        assert second is first
+        assert len(manager.active_alerts) == 1
+        assert len(manager.alert_history) == 1
+
+    @pytest.mark.asyncio
+    async def test_alert_ids_are_unique(self, manager):
+        """Test ids stay unique for alerts created in the same second."""
+        alerts = [await create(manager, source=f"source_{i}") for i in range(50)]
+
+        assert len({alert.id for alert in alerts}) == 50
+
+    @pytest.mark.asyncio
+    async def test_resolve_uses_id_index(self, manager):
+        """Test resolving by id removes the alert and its index entry."""
+        alert = await create(manager)
+
+        assert await manager.resolve_alert(alert.id, resolved_by="tester")
+        assert alert.status == AlertStatus.RESOLVED
+        assert alert.resolved_by == "tester"
+        assert alert.resolved_at is not None
+        assert manager.active_alerts == {}
+        assert manager._id_index == {}
+
+        # Already resolved, and unknown ids
+        assert not await manager.resolve_alert(alert.id)
+        assert not await manager.resolve_alert("missing")
+
+    @pytest.mark.asyncio
+    async def test_suppressed_alert_is_replaced_by_new_alert(self, manager):
+        """Test a suppressed alert cannot be resolved and is replaced on re-alert."""
+        suppressed = await create(manager)
+        assert await manager.suppress_alert(suppressed.id, duration_minutes=30)
+        assert suppressed.status == AlertStatus.SUPPRESSED
+        assert suppressed.suppression_duration == 30
+        assert not await manager.resolve_alert(suppressed.id)
+
+        replacement = await create(manager)
+
+        assert replacement is not suppressed
+        assert suppressed.id not in manager._id_index
+        assert manager._id_index[replacement.id] == "system_system_monitor"
+        assert manager.get_alert_statistics()["active_alerts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_statistics_counters_follow_alert_lifecycle(self, manager):
+        """Test running breakdowns match a rescan of the active alerts."""
+        high = await create(manager, source="a", severity=AlertSeverity.HIGH)
+        await create(manager, source="b", severity=AlertSeverity.HIGH, type=AlertType.API)
+        await create(manager, source="c", severity=AlertSeverity.LOW, type=AlertType.API)
+
+        stats = manager.get_alert_statistics()
+        assert stats["severity_breakdown"] == {"high": 2, "low": 1}
+        assert stats["type_breakdown"] == {"system": 1, "api": 2}
+        assert stats["alerts_last_24h"] == 3
+
+        await manager.resolve_alert(high.id)
+
+        stats = manager.get_alert_statistics()
+        assert stats["active_alerts"] == 2
+        assert stats["severity_breakdown"] == {"high": 1, "low": 1}
+        assert stats["type_breakdown"] == {"api": 2}
+        # Resolving does not change how many alerts were raised
+        assert stats["alerts_last_24h"] == 3
+
+    @pytest.mark.asyncio
+    async def test_statistics_drop_alerts_older_than_a_day(self, manager):
+        """Test alerts_last_24h ages out old creation times."""
+        await create(manager, source="a")
+        await create(manager, source="b")
+        manager._recent_alert_times[0] = datetime.utcnow() - timedelta(hours=25)
+
+        assert manager.get_alert_statistics()["alerts_last_24h"] == 1
+
+    @pytest.mark.asyncio
+    async def test_history_window_is_newest_first_and_limited(self, manager):
+        """Test get_alert_history bisects the time window and honours the limit."""
+        alerts = [await create(manager, source=f"source_{i}") for i in range(5)]
+        # Age the two oldest alerts out of a one-hour window
+        for i in range(2):
+            old = datetime.utcnow() - timedelta(hours=3 - i)
+            alerts[i].timestamp = old
+            manager._history_times[i] = old
+
+        history = manager.get_alert_history(limit=100, hours=1)
+        assert [alert.id for alert in history] == [alert.id for alert in reversed(alerts[2:])]
+
+        assert len(manager.get_alert_history(limit=2, hours=1)) == 2
+        assert len(manager.get_alert_history(limit=100, hours=24)) == 5
+
+    @pytest.mark.asyncio
+    async def test_history_times_trimmed_with_full_history(self, manager):
+        """Test the time index drops its oldest entry when history overflows."""
+        manager.max_history = 3
+        manager.alert_history = deque(maxlen=3)
+
+        for i in range(5):
+            await create(manager, source=f"source_{i}")
+
+        assert manager._history_times == [alert.timestamp for alert in manager.alert_history]
+        assert [alert.source for alert in manager.get_alert_history()] == [
+            "source_4", "source_3", "source_2"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_history_times_parallel(self, manager):
+        """Test cleanup drops old resolved alerts from history and its time index."""
+        old = await create(manager, source="old")
+        kept = await create(manager, source="kept")
+        await manager.resolve_alert(old.id)
+        old.resolved_at = datetime.utcnow() - timedelta(days=8)
+
+        await manager.cleanup_old_alerts()
+
+        assert list(manager.alert_history) == [kept]
+        assert manager._history_times == [kept.timestamp]
+
+    @pytest.mark.asyncio
+    async def test_scheduled_resolves_run_in_due_order(self, manager):
+        """Test one resolver task resolves alerts when each is due."""
+        late = await create(manager, source="late")
+        early = await create(manager, source="early")
+
+        manager.schedule_resolve(late.id, 0.2)
+        first_task = manager._resolve_task
+        # An earlier deadline wakes the running resolver instead of adding a task
+        manager.schedule_resolve(early.id, 0.01)
+        assert manager._resolve_task is first_task
+
+        await asyncio.sleep(0.1)
+        assert early.status == AlertStatus.RESOLVED
+        assert early.resolved_by == "auto_resolve"
+        assert late.status == AlertStatus.ACTIVE
+
+        await asyncio.sleep(0.2)
+        assert late.status == AlertStatus.RESOLVED
+        assert manager._pending_resolve == []
+        assert first_task.done()
+
+    @pytest.mark.asyncio
+    async def test_scheduled_resolve_of_resolved_alert_is_ignored(self, manager):
+        """Test a scheduled resolve after a manual one leaves the alert untouched."""
+        alert = await create(manager)
+        manager.schedule_resolve(alert.id, 0.01)
+        await manager.resolve_alert(alert.id, resolved_by="user")
+
+        await asyncio.sleep(0.05)
+
+        assert alert.resolved_by == "user"
+        assert manager._resolve_task.done()
+
+    @pytest.mark.asyncio
+    async def test_to_dict_is_json_serializable(self, manager):
+        """Test to_dict renders datetimes as ISO strings."""
+        alert = await create(manager)
+        await manager.resolve_alert(alert.id)
+
+        data = json.loads(json.dumps(alert.to_dict()))
+
+        assert data["timestamp"] == alert.timestamp.isoformat()
+        assert data["resolved_at"] == alert.resolved_at.isoformat()
+        assert data["severity"] == "high"
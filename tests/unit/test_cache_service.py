@@ -0,0 +1,176 @@
+"""
+Unit tests for the cache service.
+"""
+
+import fnmatch
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.cache_service import SCAN_BATCH_SIZE, CacheService
+
+
+class FakePipeline:
+    """Transactional pipeline that queues commands against a dict."""
+
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append(("setex", key))
+        self.store[key] = value
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    async def execute(self):
+        results = []
+        for command, key in self.commands:
+            if command == "setex":
+                results.append(True)
+            elif command == "get":
+                results.append(self.store.get(key))
+            else:
+                results.append(int(self.store.pop(key, None) is not None))
+        return results
+
+
+class DroppingPipeline(FakePipeline):
+    """Pipeline whose GET misses, as if the key expired in between."""
+
+    async def execute(self):
+        results = await super().execute()
+        return [results[0], None, results[2]]
+
+
+class FakeRedis:
+    """Minimal async Redis client over a dict."""
+
+    def __init__(self, keys=()):
+        self.store = {key: "1" for key in keys}
+        self.pipelines = []
+        self.unlink = AsyncMock(side_effect=self._unlink)
+
+    async def _unlink(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        pipe = FakePipeline(self.store)
+        self.pipelines.append(pipe)
+        return pipe
+
+
+@pytest.mark.unit
+class TestCacheService:
+    """Test suite for CacheService."""
+
+    @pytest.fixture
+    def service(self):
+        """Cache service with Redis initialization already settled."""
+        service = CacheService()
+        service._redis_initialized = True
+        return service
+
+    @pytest.mark.asyncio
+    async def test_clear_by_pattern_memory_only(self, service):
+        """Test memory entries are matched case-sensitively and removed with their expiry."""
+        for key in ("product:1", "product:2", "Product:3", "order:1"):
+            await service.set(key, "value")
+
+        removed = await service.clear_by_pattern("product:*")
+
+        assert removed == 2
+        assert set(service.memory_cache) == {"Product:3", "order:1"}
+        assert set(service.memory_cache_expiry) == {"Product:3", "order:1"}
+
+    @pytest.mark.asyncio
+    async def test_clear_by_pattern_unlinks_redis_keys_in_batches(self, service):
+        """Test matching Redis keys are unlinked in SCAN_BATCH_SIZE batches."""
+        keys = [f"product:{i}" for i in range(SCAN_BATCH_SIZE + 3)]
+        service.redis_client = FakeRedis(keys + ["order:1"])
+
+        removed = await service.clear_by_pattern("product:*")
+
+        assert removed == len(keys)
+        assert list(service.redis_client.store) == ["order:1"]
+        batch_sizes = [len(call.args) for call in service.redis_client.unlink.await_args_list]
+        assert batch_sizes == [SCAN_BATCH_SIZE, 3]
+
+    @pytest.mark.asyncio
+    async def test_clear_by_pattern_without_matches_skips_unlink(self, service):
+        """Test no UNLINK is sent when nothing matches."""
+        service.redis_client = FakeRedis(["order:1"])
+
+        assert await service.clear_by_pattern("product:*") == 0
+        service.redis_client.unlink.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_clear_by_pattern_error_returns_zero(self, service):
+        """Test Redis failures are logged and reported as nothing removed."""
+        service.redis_client = MagicMock()
+        service.redis_client.scan_iter.side_effect = ConnectionError("down")
+
+        assert await service.clear_by_pattern("product:*") == 0
+
+    @pytest.mark.asyncio
+    async def test_round_trip_uses_one_pipeline(self, service):
+        """Test the write, read and delete go through a single pipeline."""
+        service.redis_client = FakeRedis()
+
+        ok, value = await service.round_trip("health_check", {"test": True}, ttl=10)
+
+        assert ok is True
+        assert value == {"test": True}
+        [pipe] = service.redis_client.pipelines
+        assert [command for command, _ in pipe.commands] == ["setex", "get", "delete"]
+        assert service.redis_client.store == {}
+
+    @pytest.mark.asyncio
+    async def test_round_trip_falls_back_when_pipeline_fails(self, service):
+        """Test a failing pipeline falls back to set/get/delete."""
+        service.redis_client = MagicMock()
+        service.redis_client.pipeline.side_effect = ConnectionError("down")
+        service.redis_client.setex = AsyncMock(side_effect=ConnectionError("down"))
+        service.redis_client.get = AsyncMock(return_value=None)
+        service.redis_client.delete = AsyncMock()
+
+        ok, value = await service.round_trip("health_check", {"test": True})
+
+        assert ok is True
+        assert value == {"test": True}
+        assert "health_check" not in service.memory_cache
+
+    @pytest.mark.asyncio
+    async def test_round_trip_memory_only(self, service):
+        """Test the round trip works without Redis."""
+        ok, value = await service.round_trip("health_check", [1, 2])
+
+        assert ok is True
+        assert value == [1, 2]
+        assert service.memory_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_round_trip_reports_missing_value(self, service):
+        """Test a key that vanished before the GET reads back as None."""
+        service.redis_client = FakeRedis()
+        service.redis_client.pipeline = lambda transaction=True: DroppingPipeline(service.redis_client.store)
+
+        ok, value = await service.round_trip("health_check", "value")
+
+        assert ok is True
+        assert value is None
@@ -0,0 +1,95 @@
+"""
+Unit tests for the pure ASGI health check interceptor.
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.api.health_interceptor import (
+    LIVENESS_PATHS,
+    MONITORING_PING_PATH,
+    HealthCheckInterceptor,
+)
+
+
+async def call(app, path: str, method: str = "GET", scope_type: str = "http"):
+    """Send one request through the app and collect the messages it sends."""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await app({"type": scope_type, "path": path, "method": method}, AsyncMock(), send)
+    return messages
+
+
+@pytest.mark.unit
+class TestHealthCheckInterceptor:
+    """Test suite for HealthCheckInterceptor."""
+
+    @pytest.fixture
+    def inner_app(self):
+        """Wrapped application that records whether it was called."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def interceptor(self, inner_app):
+        """Interceptor around the mock application."""
+        return HealthCheckInterceptor(inner_app)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", sorted(LIVENESS_PATHS))
+    async def test_get_liveness_answered_directly(self, interceptor, inner_app, path):
+        """Test GET liveness probes never reach the wrapped app."""
+        start, body = await call(interceptor, path)
+
+        assert start["status"] == 200
+        headers = dict(start["headers"])
+        assert headers[b"content-type"] == b"application/json"
+        assert int(headers[b"content-length"]) == len(body["body"])
+        assert json.loads(body["body"]) == {"alive": True, "message": "pong"}
+        inner_app.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_monitoring_ping_answered_directly(self, interceptor, inner_app):
+        """Test the monitoring ping gets its own pre-serialized body."""
+        start, body = await call(interceptor, MONITORING_PING_PATH)
+
+        assert start["status"] == 200
+        assert json.loads(body["body"]) == {"status": "ok"}
+        inner_app.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_get_probe_returns_405(self, interceptor, inner_app):
+        """Test other methods on a probe path get 405 with an Allow header."""
+        start, body = await call(interceptor, "/ping", method="POST")
+
+        assert start["status"] == 405
+        assert dict(start["headers"])[b"allow"] == b"GET"
+        assert json.loads(body["body"]) == {"detail": "Method Not Allowed"}
+        inner_app.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_other_paths_pass_through(self, interceptor, inner_app):
+        """Test non-probe requests are delegated unchanged."""
+        messages = await call(interceptor, "/api/v1/chat")
+
+        assert messages == []
+        inner_app.assert_awaited_once()
+        scope = inner_app.await_args.args[0]
+        assert scope["path"] == "/api/v1/chat"
+
+    @pytest.mark.asyncio
+    async def test_non_http_scopes_pass_through(self, interceptor, inner_app):
+        """Test lifespan and websocket scopes are delegated even on probe paths."""
+        await call(interceptor, "/ping", scope_type="websocket")
+
+        inner_app.assert_awaited_once()
+
+    def test_attribute_access_forwards_to_wrapped_app(self, interceptor, inner_app):
+        """Test the interceptor can still be used like the wrapped app."""
+        inner_app.dependency_overrides = {"dep": "override"}
+
+        assert interceptor.dependency_overrides == {"dep": "override"}
@@ -0,0 +1,155 @@
+"""
+Unit tests for the monitoring health checker: probe coalescing, timeouts and history.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.api.v1.endpoints.monitoring.health import ComponentStatus, HealthChecker, HealthStatus
+
+
+def healthy(name: str) -> ComponentStatus:
+    """Healthy status for a component."""
+    return ComponentStatus.model_construct(
+        name=name,
+        status=HealthStatus.HEALTHY,
+        response_time_ms=1.0,
+        last_check=datetime.utcnow()
+    )
+
+
+class SlowCheck:
+    """Component check that counts its calls and waits to be released."""
+
+    def __init__(self, name: str = "redis"):
+        self.name = name
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> ComponentStatus:
+        self.calls += 1
+        await self.release.wait()
+        return healthy(self.name)
+
+
+@pytest.mark.unit
+class TestHealthChecker:
+    """Test suite for the monitoring HealthChecker."""
+
+    @pytest.fixture
+    def checker(self):
+        """Create a fresh health checker."""
+        return HealthChecker()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checks_share_one_probe(self, checker):
+        """Test concurrent callers of the same component await one check."""
+        check = SlowCheck()
+        waiters = [asyncio.ensure_future(checker.coalesced_check("redis", check)) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        check.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert check.calls == 1
+        assert all(result is results[0] for result in results)
+        assert checker._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_components_are_not_coalesced(self, checker):
+        """Test each component name gets its own probe."""
+        redis_check, db_check = SlowCheck("redis"), SlowCheck("database")
+        redis_check.release.set()
+        db_check.release.set()
+
+        await asyncio.gather(
+            checker.coalesced_check("redis", redis_check),
+            checker.coalesced_check("database", db_check)
+        )
+
+        assert (redis_check.calls, db_check.calls) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_check_runs_again_after_completion(self, checker):
+        """Test a finished probe is not reused by later callers."""
+        check = SlowCheck()
+        check.release.set()
+
+        await checker.coalesced_check("redis", check)
+        await checker.coalesced_check("redis", check)
+
+        assert check.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_caller_does_not_cancel_shared_probe(self, checker):
+        """Test a caller hitting its budget leaves the probe running for the others."""
+        check = SlowCheck()
+        patient = asyncio.ensure_future(checker.coalesced_check("redis", check))
+        await asyncio.sleep(0)
+
+        status = await checker._run_with_timeout(
+            "redis", checker.coalesced_check("redis", check), budget=0.01
+        )
+        assert status.status == HealthStatus.UNHEALTHY
+        assert not patient.done()
+
+        check.release.set()
+        assert (await patient).status == HealthStatus.HEALTHY
+        assert check.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_reports_unhealthy_with_budget(self, checker):
+        """Test a check over its budget is reported unhealthy at the budget."""
+        check = SlowCheck()
+
+        status = await checker._run_with_timeout("redis", check(), budget=0.01)
+
+        assert status.name == "redis"
+        assert status.status == HealthStatus.UNHEALTHY
+        assert status.response_time_ms == 10.0
+        assert status.error_message == "Check timed out after 0.01s"
+
+    @pytest.mark.asyncio
+    async def test_exception_reports_unhealthy(self, checker):
+        """Test an unexpected error is reported instead of raised."""
+        async def failing() -> ComponentStatus:
+            raise ConnectionError("connection refused")
+
+        status = await checker._run_with_timeout("database", failing(), budget=1.0)
+
+        assert status.name == "database"
+        assert status.status == HealthStatus.UNHEALTHY
+        assert status.error_message == "connection refused"
+
+    @pytest.mark.asyncio
+    async def test_check_within_budget_passes_through(self, checker):
+        """Test a check finishing in time returns its own status."""
+        check = SlowCheck()
+        check.release.set()
+
+        status = await checker._run_with_timeout("redis", check(), budget=1.0)
+
+        assert status.status == HealthStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_overall_health_records_round_before_returning(self, checker):
+        """Test uptime read right after the first overall check includes that round."""
+        names = {
+            "check_database_health": "database",
+            "check_redis_health": "redis",
+            "check_shopify_health": "shopify_api",
+            "check_llm_health": "llm_service",
+            "check_system_resources": "system_resources",
+        }
+        for method, name in names.items():
+            setattr(checker, method, AsyncMock(return_value=healthy(name)))
+
+        with patch("app.api.v1.endpoints.monitoring.health.get_api_monitor", MagicMock()):
+            await checker.get_overall_health()
+
+        for name in names.values():
+            assert checker.calculate_uptime_percentage(name) == 100.0
+            assert len(checker.component_history[name]) == 1
@@ -0,0 +1,148 @@
+"""
+Unit tests for the API monitoring request tracker.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.api.monitoring import MICROS_PER_HOUR, RequestMetric, RequestTracker, to_epoch_micros
+
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0)
+
+
+def make_metric(path="/api/v1/items", status_code=200, duration_ms=10.0,
+                minutes=0, client_id=None, user_id=None, cache_hit=False):
+    """Build a finished request starting `minutes` after BASE_TIME."""
+    return RequestMetric(
+        method="GET",
+        path=path,
+        status_code=status_code,
+        duration_ms=duration_ms,
+        timestamp=BASE_TIME + timedelta(minutes=minutes),
+        client_id=client_id,
+        user_id=user_id,
+        cache_hit=cache_hit
+    )
+
+
+def rebuilt_totals(tracker):
+    """Per-hour totals recomputed from the requests still held."""
+    totals = {}
+    for metric in tracker.requests:
+        hour = to_epoch_micros(metric.timestamp) // MICROS_PER_HOUR
+        count, errors, clients = totals.get(hour, (0, 0, {}))
+        if metric.client_id:
+            clients[metric.client_id] = clients.get(metric.client_id, 0) + 1
+        totals[hour] = (count + 1, errors + (metric.status_code >= 400), clients)
+    return totals
+
+
+def bucket_totals(tracker):
+    """Per-hour totals as maintained incrementally by the tracker."""
+    clients = tracker.client_index.labels
+    return {
+        hour: (
+            bucket.count,
+            bucket.error_count,
+            {clients[index]: aggregate.count for index, aggregate in bucket.clients.items()}
+        )
+        for hour, bucket in tracker.hour_buckets(BASE_TIME - timedelta(days=1))
+    }
+
+
+@pytest.mark.unit
+class TestRequestTracker:
+    """Test suite for RequestTracker."""
+
+    def test_hour_buckets_follow_evictions(self):
+        """Test hourly aggregates only count the requests still in the deque."""
+        tracker = RequestTracker(max_requests=3)
+        for i in range(7):
+            tracker._record(make_metric(
+                minutes=i * 25,
+                status_code=500 if i % 2 else 200,
+                client_id=f"client_{i % 2}"
+            ))
+
+        assert len(tracker.requests) == 3
+        assert bucket_totals(tracker) == rebuilt_totals(tracker)
+        assert sum(bucket.count for _, bucket in tracker.hour_buckets(BASE_TIME)) == 3
+
+    def test_evicted_client_is_dropped_from_bucket(self):
+        """Test a client disappears from its bucket once all its requests are evicted."""
+        tracker = RequestTracker(max_requests=2)
+        tracker._record(make_metric(client_id="gone", path="/a"))
+        tracker._record(make_metric(client_id="kept", path="/b"))
+        tracker._record(make_metric(client_id="kept", path="/b"))
+
+        [(_, bucket)] = tracker.hour_buckets(BASE_TIME)
+        kept = tracker.client_index.ids["kept"]
+        assert list(bucket.clients) == [kept]
+        assert bucket.clients[kept].count == 2
+        assert bucket.endpoints == {tracker.endpoint_index.ids[("GET", "/b")]: 2}
+
+    def test_bucket_removed_when_hour_empties(self):
+        """Test an hour whose requests were all evicted is no longer reported."""
+        tracker = RequestTracker(max_requests=2)
+        tracker._record(make_metric(minutes=0))
+        tracker._record(make_metric(minutes=60))
+        tracker._record(make_metric(minutes=61))
+
+        hours = [hour for hour, _ in tracker.hour_buckets(BASE_TIME)]
+        assert hours == [to_epoch_micros(BASE_TIME) // MICROS_PER_HOUR + 1]
+
+    def test_hour_buckets_window_starts_at_hour_of_since(self):
+        """Test hour_buckets includes the whole hour containing `since`."""
+        tracker = RequestTracker()
+        tracker._record(make_metric(minutes=-30))
+        tracker._record(make_metric(minutes=5))
+        tracker._record(make_metric(minutes=50))
+
+        buckets = tracker.hour_buckets(BASE_TIME + timedelta(minutes=45))
+
+        assert [bucket.count for _, bucket in buckets] == [2]
+
+    def test_reindex_shrinks_label_tables(self):
+        """Test label tables are rebuilt from the held requests once they outgrow them."""
+        tracker = RequestTracker(max_requests=2)
+        for i in range(5):
+            tracker._record(make_metric(path=f"/path_{i}", client_id=f"client_{i}"))
+
+        assert len(tracker.endpoint_index) <= 2 * tracker.max_requests
+        assert len(tracker.client_index) <= 2 * tracker.max_requests
+        for metric in tracker.requests:
+            assert tracker.endpoint_index.labels[metric.endpoint_id] == (metric.method, metric.path)
+            assert tracker.client_index.labels[metric.client_index] == metric.client_id
+        assert bucket_totals(tracker) == rebuilt_totals(tracker)
+
+    def test_to_arrays_cached_until_new_request(self):
+        """Test to_arrays returns the same snapshot until a request is recorded."""
+        tracker = RequestTracker(max_requests=2)
+        tracker._record(make_metric(client_id="client", user_id="user"))
+
+        arrays = tracker.to_arrays()
+        assert tracker.to_arrays() is arrays
+        assert arrays.clients == ["client"]
+        assert arrays.users == ["user"]
+
+        # A full deque keeps its length, so the version must still move
+        tracker._record(make_metric(status_code=404))
+        tracker._record(make_metric(status_code=500))
+        refreshed = tracker.to_arrays()
+
+        assert refreshed is not arrays
+        assert refreshed.status_codes.tolist() == [404, 500]
+        assert refreshed.client_ids.tolist() == [-1, -1]
+
+    def test_to_arrays_rebuilt_after_clear(self):
+        """Test clearing the tracker invalidates the cached snapshot."""
+        tracker = RequestTracker()
+        tracker._record(make_metric())
+        tracker.to_arrays()
+
+        tracker.clear()
+
+        assert len(tracker.to_arrays().timestamps) == 0
+        assert tracker.hour_buckets(BASE_TIME) == []
@@ -0,0 +1,129 @@
+"""
+Unit tests for the in-process TTL cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic()."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the cache's monotonic clock."""
+        fake = FakeClock()
+        with patch("app.utils.ttl_cache.time.monotonic", fake):
+            yield fake
+
+    def test_get_returns_value_before_expiry(self, clock):
+        """Test a value is served until its TTL elapses."""
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        clock.now += 9.9
+        assert cache.get("key") == "value"
+
+    def test_get_returns_default_after_expiry(self, clock):
+        """Test an expired value is dropped and the default returned."""
+        cache = TTLCache(ttl=10)
+        cache.set("key", "value")
+
+        clock.now += 10
+        assert cache.get("key", "missing") == "missing"
+        assert "key" not in cache._entries
+
+    def test_per_entry_ttl_overrides_default(self, clock):
+        """Test set(ttl=...) overrides the cache-wide TTL."""
+        cache = TTLCache(ttl=10)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2, ttl=60)
+
+        clock.now += 30
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_invalidate_single_key_and_all(self, clock):
+        """Test invalidate drops one key or the whole cache."""
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.invalidate()
+        assert cache.get("b") is None
+
+    def test_eviction_prefers_expired_entries(self, clock):
+        """Test a full cache evicts expired entries before live ones."""
+        cache = TTLCache(ttl=10, max_entries=2)
+        cache.set("expiring", 1, ttl=1)
+        cache.set("live", 2)
+
+        clock.now += 5
+        cache.set("new", 3)
+
+        assert cache.get("expiring") is None
+        assert cache.get("live") == 2
+        assert cache.get("new") == 3
+
+    def test_eviction_falls_back_to_oldest_entry(self, clock):
+        """Test a full cache of live entries evicts the oldest one."""
+        cache = TTLCache(ttl=10, max_entries=2)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("third", 3)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+        assert cache.get("third") == 3
+
+    def test_overwriting_existing_key_does_not_evict(self, clock):
+        """Test replacing a key in a full cache keeps the other entries."""
+        cache = TTLCache(ttl=10, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_calls_factory_once_per_ttl(self, clock):
+        """Test get_or_set reuses the cached value until it expires."""
+        cache = TTLCache(ttl=10)
+        factory = AsyncMock(side_effect=["first", "second"])
+
+        assert await cache.get_or_set("key", factory) == "first"
+        assert await cache.get_or_set("key", factory) == "first"
+        assert factory.await_count == 1
+
+        clock.now += 10
+        assert await cache.get_or_set("key", factory) == "second"
+        assert factory.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_caches_falsy_values(self, clock):
+        """Test None and other falsy results are cached, not recomputed."""
+        cache = TTLCache(ttl=10)
+        factory = AsyncMock(return_value=None)
+
+        await cache.get_or_set("key", factory)
+        await cache.get_or_set("key", factory)
+
+        assert factory.await_count == 1